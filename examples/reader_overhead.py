@@ -0,0 +1,29 @@
+#!/usr/bin/env python
+"""Micro-benchmark: fixed per-call overhead of loading / probing tiny files.
+
+Every call to :func:`objutils.loads` or :func:`objutils.probes` creates fresh
+Reader instances, so anything done in ``Reader.__init__`` is paid per call.
+
+Usage::
+
+    python examples/reader_overhead.py
+"""
+
+import timeit
+
+import objutils
+from objutils import Image, Section, dumps, loads, probes, registry
+
+NUMBER = 2000
+
+image = Image([Section(0x1000, bytes(range(16)))])
+samples = {name: bytes(dumps(name, image)) for name in ("ihex", "srec", "titxt", "tek", "mostec")}
+
+print(f"{'codec':8} {'Reader()':>12} {'loads()':>12} {'probes()':>12}")
+for name, data in samples.items():
+    reader_class = registry.get(name).Reader
+    create = timeit.timeit(reader_class, number=NUMBER) / NUMBER
+    load = timeit.timeit(lambda: loads(name, data), number=NUMBER) / NUMBER
+    probe = timeit.timeit(lambda: probes(data), number=NUMBER) / NUMBER
+    print(f"{name:8} {create * 1e6:10.1f}us {load * 1e6:10.1f}us {probe * 1e6:10.1f}us")
+print(f"objutils {objutils.__version__}")
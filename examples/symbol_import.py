@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+"""Benchmark: importing a large symbol table into the .prgdb.
+
+Writes a synthetic ELF64 relocatable with many sections and symbols (see
+:func:`objutils.elf.synthetic.make_elf`) and times the ``sections`` and
+``symbols`` parsing phases, on disk and in memory.
+Whether the C++ extension (``hexfiles_ext``) is used shows in the last line.
+
+Usage::
+
+    python examples/symbol_import.py [NUM_SYMBOLS [NUM_SECTIONS]]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from objutils.elf import ElfParser
+from objutils.elf.synthetic import make_elf
+
+num_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+num_sections = int(sys.argv[2]) if len(sys.argv) > 2 else 5_000
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = Path(tmp) / "symbols.elf"
+    make_elf(path, num_sections=num_sections, num_symbols=num_symbols)
+    print(f"{num_symbols} symbols, {num_sections} sections, {path.stat().st_size / 1e6:.1f} MB")
+    print(f"{'database':10} {'sections':>10} {'symbols':>10}")
+    for label, in_memory in (("file", False), ("in-memory", True)):
+        parser = ElfParser(str(path), in_memory=in_memory)
+        try:
+            start = time.perf_counter()
+            parser.load_phases("sections")
+            sections = time.perf_counter() - start
+            start = time.perf_counter()
+            parser.load_phases("symbols")
+            symbols = time.perf_counter() - start
+        finally:
+            parser.close()
+        print(f"{label:10} {sections * 1e3:8.0f}ms {symbols * 1e3:8.0f}ms")
+
+try:
+    import objutils.hexfiles_ext  # noqa: F401
+
+    print("C++ extension: yes")
+except ImportError:
+    print("C++ extension: no")
@@ -13,6 +13,8 @@ Registers CODECS and implements an interface to them.
 The first parameter is always the codec name.
 """
 
+from __future__ import annotations
+
 __version__ = "0.10.18"
 
 __all__ = [
@@ -54,77 +56,45 @@ __copyright__ = """
 import io
 import os
 import sys
-from pathlib import Path
-from typing import Any, BinaryIO, Optional
-
-from rich import pretty
-from rich.console import Console
-from rich.traceback import install as tb_install
-
-import objutils.ash
-import objutils.binfile
-import objutils.oocdtxt
-import objutils.cosmac
-import objutils.emon52
-import objutils.etek
-import objutils.fpc
-import objutils.ihex
-import objutils.mostec
-import objutils.rca
-import objutils.shf
-import objutils.sig
-import objutils.srec
-import objutils.tek
-import objutils.titxt
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
 from objutils.image import Image, InvalidAddressError
 from objutils.registry import registry
 from objutils.section import Section, LazySection
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 # Optional developer-friendly console and tracebacks; disabled by default for library consumers.
 _ENABLE_RICH = os.getenv("OBJUTILS_RICH", "0").lower() in {"1", "true", "yes"}
 if _ENABLE_RICH and sys.stderr.isatty():
+    from rich import pretty
+    from rich.console import Console
+    from rich.traceback import install as tb_install
+
     pretty.install()
     tb_install(show_locals=True, max_frames=3)
     console = Console()
 else:
     console = None  # type: ignore[assignment]
 
-registry.register("bin", objutils.binfile.Reader, objutils.binfile.Writer, "Plain binary format.")
-registry.register(
-    "binzip",
-    objutils.binfile.BinZipReader,
-    objutils.binfile.BinZipWriter,
-    "Zipped binary format.",
-)
-registry.register("sig", objutils.sig.Reader, objutils.sig.Writer, "Signetics format.")
-registry.register(
-    "srec",
-    objutils.srec.Reader,
-    objutils.srec.Writer,
-    "Motorola S-Records (a.k.a. S19).",
-)
-registry.register(
-    "titxt",
-    objutils.titxt.Reader,
-    objutils.titxt.Writer,
-    "Texas Instruments MSP430 text format.",
-)
-registry.register(
-    "emon52",
-    objutils.emon52.Reader,
-    objutils.emon52.Writer,
-    "Elektor Monitor (EMON52) file format.",
-)
-registry.register("etek", objutils.etek.Reader, objutils.etek.Writer, "Extended Tektonix format.")
-registry.register("fpc", objutils.fpc.Reader, objutils.fpc.Writer, "Four packed code file format.")
-registry.register("ihex", objutils.ihex.Reader, objutils.ihex.Writer, "Intel IHex format.")
-registry.register("mostec", objutils.mostec.Reader, objutils.mostec.Writer, "MOSTech format.")
-registry.register("rca", objutils.rca.Reader, objutils.rca.Writer, "RCA format.")
-registry.register("tek", objutils.tek.Reader, objutils.tek.Writer, "Tektonix format.")
-registry.register("cosmac", objutils.cosmac.Reader, objutils.cosmac.Writer, "RCA COSMAC format.")
-registry.register("ash", objutils.ash.Reader, objutils.ash.Writer, "ASCII hex space formats.")
-registry.register("shf", objutils.shf.Reader, objutils.shf.Writer, "S Hexdump Format (rfc4149).")
-registry.register("oocdtxt", objutils.oocdtxt.Reader, objutils.oocdtxt.Writer, "OpenOCD flash mdb text format.")
+# Codec modules are imported on first use, see `Registry.register_lazy`.
+registry.register_lazy("bin", "objutils.binfile", "Plain binary format.")
+registry.register_lazy("binzip", "objutils.binfile", "Zipped binary format.", reader="BinZipReader", writer="BinZipWriter")
+registry.register_lazy("sig", "objutils.sig", "Signetics format.")
+registry.register_lazy("srec", "objutils.srec", "Motorola S-Records (a.k.a. S19).")
+registry.register_lazy("titxt", "objutils.titxt", "Texas Instruments MSP430 text format.")
+registry.register_lazy("emon52", "objutils.emon52", "Elektor Monitor (EMON52) file format.")
+registry.register_lazy("etek", "objutils.etek", "Extended Tektonix format.")
+registry.register_lazy("fpc", "objutils.fpc", "Four packed code file format.")
+registry.register_lazy("ihex", "objutils.ihex", "Intel IHex format.")
+registry.register_lazy("mostec", "objutils.mostec", "MOSTech format.")
+registry.register_lazy("rca", "objutils.rca", "RCA format.")
+registry.register_lazy("tek", "objutils.tek", "Tektonix format.")
+registry.register_lazy("cosmac", "objutils.cosmac", "RCA COSMAC format.")
+registry.register_lazy("ash", "objutils.ash", "ASCII hex space formats.")
+registry.register_lazy("shf", "objutils.shf", "S Hexdump Format (rfc4149).")
+registry.register_lazy("oocdtxt", "objutils.oocdtxt", "OpenOCD flash mdb text format.")
 
 
 def load(codec_name: str, fp: str | Path | BinaryIO, join: bool = True, **kws: Any) -> Image:
@@ -158,14 +128,12 @@ def loads(codec_name: str, data: str | bytes | bytearray, join: bool = True, **k
     return registry.get(codec_name).Reader().loads(data, join=join, **kws)
 
 
-def probe(fp: BinaryIO, **kws: Any) -> str | None:
-    """Try to guess codec from file.
+# Magic numbers of binary object formats no codec reads; such files are rejected without probing.
+_FOREIGN_MAGIC = (b"\x7fELF", b"MZ", b"\xfe\xed\xfa", b"\xcf\xfa\xed\xfe", b"\xce\xfa\xed\xfe")
+_PROBE_HEAD_SIZE = 512
 
-    Returns
-    -------
-    str | None
-        The detected codec name or None if undetected.
-    """
+
+def _probe_order() -> list[tuple[str, Any]]:
     # Priority order for probing.
     # We prioritize formats with more unique/strict probing logic (like 'sig' vs 'ihex')
     # to avoid false positives.
@@ -184,8 +152,24 @@ def probe(fp: BinaryIO, **kws: Any) -> str | None:
     for name, codec in registry:
         if name not in priority:
             codecs_to_test.append((name, codec))
+    return codecs_to_test
+
 
-    for name, codec in codecs_to_test:
+def _peek(fp: BinaryIO, size: int) -> bytes:
+    """Read up to `size` bytes without moving the file position."""
+    try:
+        start_pos = fp.tell()
+    except (AttributeError, io.UnsupportedOperation, OSError):
+        return b""
+    try:
+        head = fp.read(size)
+    finally:
+        fp.seek(start_pos)
+    return head.encode("ascii", errors="ignore") if isinstance(head, str) else bytes(head)
+
+
+def _probe_with(codecs: list[tuple[str, Any]], fp: BinaryIO, **kws: Any) -> str | None:
+    for name, codec in codecs:
         try:
             reader = codec.Reader()
             if hasattr(reader, "probe") and reader.probe(fp, **kws):
@@ -195,6 +179,33 @@ def probe(fp: BinaryIO, **kws: Any) -> str | None:
     return None
 
 
+def probe(fp: BinaryIO, **kws: Any) -> str | None:
+    """Try to guess codec from file.
+
+    The first bytes of the file are matched against the ``SIGNATURES`` of
+    the registered readers first, so usually only one or two codecs run
+    their full :meth:`probe`. Files without a known signature are tried
+    against every codec.
+
+    Returns
+    -------
+    str | None
+        The detected codec name or None if undetected.
+    """
+    codecs_to_test = _probe_order()
+    head = _peek(fp, _PROBE_HEAD_SIZE)
+    if head.startswith(_FOREIGN_MAGIC):
+        return None
+    head = head.removeprefix(b"\xef\xbb\xbf").lstrip()  # UTF-8 BOM, leading blank lines.
+    candidates = [(name, codec) for name, codec in codecs_to_test if head.startswith(getattr(codec.Reader, "SIGNATURES", ()))]
+    if candidates:
+        result = _probe_with(candidates, fp, **kws)
+        if result is not None:
+            return result
+        codecs_to_test = [entry for entry in codecs_to_test if entry not in candidates]
+    return _probe_with(codecs_to_test, fp, **kws)
+
+
 def probes(data: str | bytes | bytearray, **kws: Any) -> str | None:
     """Try to guess codec from bytes.
 
@@ -68,6 +68,7 @@ class Reader(hexfile.ASCIIHexReader):
     """
 
     VALID_CHARS = re.compile(r"^[a-fA-F0-9 %,\'\$\x02\x03\n\r]*$")
+    SIGNATURES = (b"\x02", b"$A")
 
     def __init__(
         self,
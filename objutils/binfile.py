@@ -97,6 +97,8 @@ class Writer:
 
 
 class BinZipReader(hexfile.Reader):
+    SIGNATURES = (b"PK\x03\x04",)
+
     def probe(self, fp: BinaryIO, **kws: Any) -> bool:
         """Probe for zip files."""
         start_pos = 0
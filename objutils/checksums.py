@@ -22,11 +22,27 @@ __copyright__ = """
   51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+import copy
 import enum
 import functools
 import operator
-import struct
+import os
+import sys
 import zlib
+from array import array
+
+try:
+    from .hexfiles_ext import CrcEngine, word_sum
+except ImportError:
+    CrcEngine = word_sum = None  # Pure Python implementations only.
+
+# array typecodes by item size, for pure Python word sums.
+_WORD_TYPECODES = {array(typecode).itemsize: typecode for typecode in "QLIH"}
+# NumPy is only imported for frames at least this large.
+_NUMPY_MIN_SIZE = 1 << 16
+
+# (width, poly, init, refin, refout, xorout) of the CRC computed by zlib.crc32().
+_ZLIB_CRC32 = (32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF)
 
 COMPLEMENT_NONE = 0
 COMPLEMENT_ONES = 1
@@ -110,525 +126,11 @@ class Algorithm(enum.IntEnum):
     CHK_CRC_16_CCITT = 8
     CHK_CRC_32 = 9
     CHK_USER_DEFINED = 10
-
-
-CRC16 = (
-    0x0000,
-    0x8005,
-    0x800F,
-    0x000A,
-    0x801B,
-    0x001E,
-    0x0014,
-    0x8011,
-    0x8033,
-    0x0036,
-    0x003C,
-    0x8039,
-    0x0028,
-    0x802D,
-    0x8027,
-    0x0022,
-    0x8063,
-    0x0066,
-    0x006C,
-    0x8069,
-    0x0078,
-    0x807D,
-    0x8077,
-    0x0072,
-    0x0050,
-    0x8055,
-    0x805F,
-    0x005A,
-    0x804B,
-    0x004E,
-    0x0044,
-    0x8041,
-    0x80C3,
-    0x00C6,
-    0x00CC,
-    0x80C9,
-    0x00D8,
-    0x80DD,
-    0x80D7,
-    0x00D2,
-    0x00F0,
-    0x80F5,
-    0x80FF,
-    0x00FA,
-    0x80EB,
-    0x00EE,
-    0x00E4,
-    0x80E1,
-    0x00A0,
-    0x80A5,
-    0x80AF,
-    0x00AA,
-    0x80BB,
-    0x00BE,
-    0x00B4,
-    0x80B1,
-    0x8093,
-    0x0096,
-    0x009C,
-    0x8099,
-    0x0088,
-    0x808D,
-    0x8087,
-    0x0082,
-    0x8183,
-    0x0186,
-    0x018C,
-    0x8189,
-    0x0198,
-    0x819D,
-    0x8197,
-    0x0192,
-    0x01B0,
-    0x81B5,
-    0x81BF,
-    0x01BA,
-    0x81AB,
-    0x01AE,
-    0x01A4,
-    0x81A1,
-    0x01E0,
-    0x81E5,
-    0x81EF,
-    0x01EA,
-    0x81FB,
-    0x01FE,
-    0x01F4,
-    0x81F1,
-    0x81D3,
-    0x01D6,
-    0x01DC,
-    0x81D9,
-    0x01C8,
-    0x81CD,
-    0x81C7,
-    0x01C2,
-    0x0140,
-    0x8145,
-    0x814F,
-    0x014A,
-    0x815B,
-    0x015E,
-    0x0154,
-    0x8151,
-    0x8173,
-    0x0176,
-    0x017C,
-    0x8179,
-    0x0168,
-    0x816D,
-    0x8167,
-    0x0162,
-    0x8123,
-    0x0126,
-    0x012C,
-    0x8129,
-    0x0138,
-    0x813D,
-    0x8137,
-    0x0132,
-    0x0110,
-    0x8115,
-    0x811F,
-    0x011A,
-    0x810B,
-    0x010E,
-    0x0104,
-    0x8101,
-    0x8303,
-    0x0306,
-    0x030C,
-    0x8309,
-    0x0318,
-    0x831D,
-    0x8317,
-    0x0312,
-    0x0330,
-    0x8335,
-    0x833F,
-    0x033A,
-    0x832B,
-    0x032E,
-    0x0324,
-    0x8321,
-    0x0360,
-    0x8365,
-    0x836F,
-    0x036A,
-    0x837B,
-    0x037E,
-    0x0374,
-    0x8371,
-    0x8353,
-    0x0356,
-    0x035C,
-    0x8359,
-    0x0348,
-    0x834D,
-    0x8347,
-    0x0342,
-    0x03C0,
-    0x83C5,
-    0x83CF,
-    0x03CA,
-    0x83DB,
-    0x03DE,
-    0x03D4,
-    0x83D1,
-    0x83F3,
-    0x03F6,
-    0x03FC,
-    0x83F9,
-    0x03E8,
-    0x83ED,
-    0x83E7,
-    0x03E2,
-    0x83A3,
-    0x03A6,
-    0x03AC,
-    0x83A9,
-    0x03B8,
-    0x83BD,
-    0x83B7,
-    0x03B2,
-    0x0390,
-    0x8395,
-    0x839F,
-    0x039A,
-    0x838B,
-    0x038E,
-    0x0384,
-    0x8381,
-    0x0280,
-    0x8285,
-    0x828F,
-    0x028A,
-    0x829B,
-    0x029E,
-    0x0294,
-    0x8291,
-    0x82B3,
-    0x02B6,
-    0x02BC,
-    0x82B9,
-    0x02A8,
-    0x82AD,
-    0x82A7,
-    0x02A2,
-    0x82E3,
-    0x02E6,
-    0x02EC,
-    0x82E9,
-    0x02F8,
-    0x82FD,
-    0x82F7,
-    0x02F2,
-    0x02D0,
-    0x82D5,
-    0x82DF,
-    0x02DA,
-    0x82CB,
-    0x02CE,
-    0x02C4,
-    0x82C1,
-    0x8243,
-    0x0246,
-    0x024C,
-    0x8249,
-    0x0258,
-    0x825D,
-    0x8257,
-    0x0252,
-    0x0270,
-    0x8275,
-    0x827F,
-    0x027A,
-    0x826B,
-    0x026E,
-    0x0264,
-    0x8261,
-    0x0220,
-    0x8225,
-    0x822F,
-    0x022A,
-    0x823B,
-    0x023E,
-    0x0234,
-    0x8231,
-    0x8213,
-    0x0216,
-    0x021C,
-    0x8219,
-    0x0208,
-    0x820D,
-    0x8207,
-    0x0202,
-)
-
-CRC16_CCITT = (
-    0x0000,
-    0x1021,
-    0x2042,
-    0x3063,
-    0x4084,
-    0x50A5,
-    0x60C6,
-    0x70E7,
-    0x8108,
-    0x9129,
-    0xA14A,
-    0xB16B,
-    0xC18C,
-    0xD1AD,
-    0xE1CE,
-    0xF1EF,
-    0x1231,
-    0x0210,
-    0x3273,
-    0x2252,
-    0x52B5,
-    0x4294,
-    0x72F7,
-    0x62D6,
-    0x9339,
-    0x8318,
-    0xB37B,
-    0xA35A,
-    0xD3BD,
-    0xC39C,
-    0xF3FF,
-    0xE3DE,
-    0x2462,
-    0x3443,
-    0x0420,
-    0x1401,
-    0x64E6,
-    0x74C7,
-    0x44A4,
-    0x5485,
-    0xA56A,
-    0xB54B,
-    0x8528,
-    0x9509,
-    0xE5EE,
-    0xF5CF,
-    0xC5AC,
-    0xD58D,
-    0x3653,
-    0x2672,
-    0x1611,
-    0x0630,
-    0x76D7,
-    0x66F6,
-    0x5695,
-    0x46B4,
-    0xB75B,
-    0xA77A,
-    0x9719,
-    0x8738,
-    0xF7DF,
-    0xE7FE,
-    0xD79D,
-    0xC7BC,
-    0x48C4,
-    0x58E5,
-    0x6886,
-    0x78A7,
-    0x0840,
-    0x1861,
-    0x2802,
-    0x3823,
-    0xC9CC,
-    0xD9ED,
-    0xE98E,
-    0xF9AF,
-    0x8948,
-    0x9969,
-    0xA90A,
-    0xB92B,
-    0x5AF5,
-    0x4AD4,
-    0x7AB7,
-    0x6A96,
-    0x1A71,
-    0x0A50,
-    0x3A33,
-    0x2A12,
-    0xDBFD,
-    0xCBDC,
-    0xFBBF,
-    0xEB9E,
-    0x9B79,
-    0x8B58,
-    0xBB3B,
-    0xAB1A,
-    0x6CA6,
-    0x7C87,
-    0x4CE4,
-    0x5CC5,
-    0x2C22,
-    0x3C03,
-    0x0C60,
-    0x1C41,
-    0xEDAE,
-    0xFD8F,
-    0xCDEC,
-    0xDDCD,
-    0xAD2A,
-    0xBD0B,
-    0x8D68,
-    0x9D49,
-    0x7E97,
-    0x6EB6,
-    0x5ED5,
-    0x4EF4,
-    0x3E13,
-    0x2E32,
-    0x1E51,
-    0x0E70,
-    0xFF9F,
-    0xEFBE,
-    0xDFDD,
-    0xCFFC,
-    0xBF1B,
-    0xAF3A,
-    0x9F59,
-    0x8F78,
-    0x9188,
-    0x81A9,
-    0xB1CA,
-    0xA1EB,
-    0xD10C,
-    0xC12D,
-    0xF14E,
-    0xE16F,
-    0x1080,
-    0x00A1,
-    0x30C2,
-    0x20E3,
-    0x5004,
-    0x4025,
-    0x7046,
-    0x6067,
-    0x83B9,
-    0x9398,
-    0xA3FB,
-    0xB3DA,
-    0xC33D,
-    0xD31C,
-    0xE37F,
-    0xF35E,
-    0x02B1,
-    0x1290,
-    0x22F3,
-    0x32D2,
-    0x4235,
-    0x5214,
-    0x6277,
-    0x7256,
-    0xB5EA,
-    0xA5CB,
-    0x95A8,
-    0x8589,
-    0xF56E,
-    0xE54F,
-    0xD52C,
-    0xC50D,
-    0x34E2,
-    0x24C3,
-    0x14A0,
-    0x0481,
-    0x7466,
-    0x6447,
-    0x5424,
-    0x4405,
-    0xA7DB,
-    0xB7FA,
-    0x8799,
-    0x97B8,
-    0xE75F,
-    0xF77E,
-    0xC71D,
-    0xD73C,
-    0x26D3,
-    0x36F2,
-    0x0691,
-    0x16B0,
-    0x6657,
-    0x7676,
-    0x4615,
-    0x5634,
-    0xD94C,
-    0xC96D,
-    0xF90E,
-    0xE92F,
-    0x99C8,
-    0x89E9,
-    0xB98A,
-    0xA9AB,
-    0x5844,
-    0x4865,
-    0x7806,
-    0x6827,
-    0x18C0,
-    0x08E1,
-    0x3882,
-    0x28A3,
-    0xCB7D,
-    0xDB5C,
-    0xEB3F,
-    0xFB1E,
-    0x8BF9,
-    0x9BD8,
-    0xABBB,
-    0xBB9A,
-    0x4A75,
-    0x5A54,
-    0x6A37,
-    0x7A16,
-    0x0AF1,
-    0x1AD0,
-    0x2AB3,
-    0x3A92,
-    0xFD2E,
-    0xED0F,
-    0xDD6C,
-    0xCD4D,
-    0xBDAA,
-    0xAD8B,
-    0x9DE8,
-    0x8DC9,
-    0x7C26,
-    0x6C07,
-    0x5C64,
-    0x4C45,
-    0x3CA2,
-    0x2C83,
-    0x1CE0,
-    0x0CC1,
-    0xEF1F,
-    0xFF3E,
-    0xCF5D,
-    0xDF7C,
-    0xAF9B,
-    0xBFBA,
-    0x8FD9,
-    0x9FF8,
-    0x6E17,
-    0x7E36,
-    0x4E55,
-    0x5E74,
-    0x2E93,
-    0x3EB2,
-    0x0ED1,
-    0x1EF0,
-)
+    CHK_CRC_8 = 11
+    CHK_CRC_64 = 12
+    CHK_ADD_22_BE = 13
+    CHK_ADD_24_BE = 14
+    CHK_ADD_44_BE = 15
 
 
 def reflect(data, nBits):
@@ -648,22 +150,35 @@ def reflect(data, nBits):
     return reflection
 
 
-class Crc16:
-    """Calculate CRC (16-bit)
+class Crc:
+    """Table-driven CRC engine following the Rocksoft(tm) model [1]_
 
+    The lookup table is computed once per instance (in reflected form if
+    `refin` is set), so input bytes never need to be bit-reversed.
 
     Parameters
     ----------
-    table: list-like
-        lookup table for CRC calculation
-    initalRemainder : int
-        value to start with
-    finalXorValue : int
-        final XOR value
-    reflectData : bool
-        reflect input data
-    reflectRemainder : bool
-        reflect output data
+    width : int
+        width in bits of the CRC (1 .. 64)
+    poly : int
+        generator polynomial, normal (non-reflected) notation, without top bit
+    init : int
+        initial register value
+    refin : bool
+        reflect input bytes
+    refout : bool
+        reflect final register value
+    xorout : int
+        value XORed to the final register value
+
+    Examples
+    --------
+    >>> crc8 = Crc(8, 0x07)
+    >>> hex(crc8(b"123456789"))
+    '0xf4'
+    >>> crc16_modbus = Crc(16, 0x8005, init=0xFFFF, refin=True, refout=True)
+    >>> hex(crc16_modbus(b"123456789"))
+    '0x4b37'
 
     .. [1] A PAINLESS GUIDE TO CRC ERROR DETECTION ALGORITHMS
            http://www.ross.net/crc/download/crc_v3.txt
@@ -674,33 +189,113 @@ class Crc16:
            http://zorc.breitbandkatze.de/crc.html
     """
 
-    WIDTH = 16
-
-    def __init__(self, table, initalRemainder, finalXorValue, reflectData, reflectRemainder):
-        self.table = table
-        self.initalRemainder = initalRemainder
-        self.finalXorValue = finalXorValue
-        self.reflectData = reflectData
-        self.reflectRemainder = reflectRemainder
+    def __init__(self, width, poly, init=0, refin=False, refout=False, xorout=0):
+        if not (1 <= width <= 64):
+            raise ValueError("CRC width must be between 1 and 64.")
+        self.width = width
+        self.mask = (1 << width) - 1
+        self.poly = poly & self.mask
+        self.init = init & self.mask
+        self.refin = refin
+        self.refout = refout
+        self.xorout = xorout & self.mask
+        # Non-reflected CRCs narrower than a byte are computed left-aligned in an 8-bit register.
+        self._shift = max(8 - width, 0)
+        if refin:
+            self.table = self._reflected_table(reflect(self.poly, width))
+            self._register = reflect(self.init, width)
+        else:
+            self.table = self._normal_table(self.poly << self._shift, width + self._shift)
+            self._register = self.init
+        self._zlib = (width, self.poly, self.init, refin, refout, self.xorout) == _ZLIB_CRC32
+        self._native = CrcEngine(width, self.poly, self.init, refin, refout, self.xorout) if CrcEngine is not None else None
+
+    @staticmethod
+    def _reflected_table(poly):
+        table = []
+        for value in range(256):
+            for _ in range(8):
+                value = (value >> 1) ^ poly if value & 1 else value >> 1
+            table.append(value)
+        return tuple(table)
+
+    @staticmethod
+    def _normal_table(poly, width):
+        top_bit = 1 << (width - 1)
+        mask = (1 << width) - 1
+        table = []
+        for value in range(256):
+            value <<= width - 8
+            for _ in range(8):
+                value = ((value << 1) ^ poly if value & top_bit else value << 1) & mask
+            table.append(value)
+        return tuple(table)
 
     def __call__(self, frame):
-        remainder = self.initalRemainder
-        for ch in frame:
-            data = self.reflectIn(ch, remainder)
-            remainder = (self.table[data] ^ (remainder << 8)) & 0xFFFF
-        return self.reflectOut(remainder)
-
-    def reflectIn(self, ch, remainder):
-        if self.reflectData:
-            return (reflect(ch, 8) ^ (remainder >> (self.WIDTH - 8))) & 0xFF
+        if self._zlib:
+            return CRC32(frame)
+        if self._native is not None:
+            try:
+                return self._native(frame)
+            except (TypeError, BufferError):
+                pass  # Not a (contiguous) buffer, e.g. a list of integers or a strided memoryview.
+        return self._finish(self._update(self._register, frame))
+
+    def _update(self, crc, frame):
+        """Feed `frame` into a raw register (bit-reversed if `refin`), return the new register."""
+        if self._native is not None:
+            try:
+                return self._native.update(crc, frame)
+            except (TypeError, BufferError):
+                pass
+        table = self.table
+        if self.refin:
+            for ch in frame:
+                crc = table[(crc ^ ch) & 0xFF] ^ (crc >> 8)
         else:
-            return (ch ^ (remainder >> (self.WIDTH - 8))) & 0xFF
+            width = self.width + self._shift
+            shift = width - 8
+            mask = (1 << width) - 1
+            crc <<= self._shift
+            for ch in frame:
+                crc = table[((crc >> shift) ^ ch) & 0xFF] ^ ((crc << 8) & mask)
+            crc >>= self._shift
+        return crc
+
+    def _finish(self, crc):
+        if self.refin != self.refout:
+            crc = reflect(crc, self.width)
+        return crc ^ self.xorout
+
+    def __repr__(self):
+        return (
+            f"Crc(width={self.width}, poly=0x{self.poly:X}, init=0x{self.init:X}, "
+            f"refin={self.refin}, refout={self.refout}, xorout=0x{self.xorout:X})"
+        )
+
+
+class Crc16(Crc):
+    """16-bit CRC, kept for backward compatibility (use `Crc`)
 
-    def reflectOut(self, remainder):
-        if self.reflectRemainder:
-            return reflect(remainder, 16) ^ self.finalXorValue
-        else:
-            return remainder ^ self.finalXorValue
+    Parameters
+    ----------
+    table: list-like
+        (non-reflected) lookup table for CRC calculation; only used to
+        derive the polynomial
+    initalRemainder : int
+        value to start with
+    finalXorValue : int
+        final XOR value
+    reflectData : bool
+        reflect input data
+    reflectRemainder : bool
+        reflect output data
+    """
+
+    WIDTH = 16
+
+    def __init__(self, table, initalRemainder, finalXorValue, reflectData, reflectRemainder):
+        super().__init__(self.WIDTH, table[1], initalRemainder, reflectData, reflectRemainder, finalXorValue)
 
 
 def adder(modulus):
@@ -724,13 +319,21 @@ def adder(modulus):
 
     """
 
+    bits = modulus.bit_length() - 1
+    native = word_sum is not None and modulus == 1 << bits and bits <= 64
+
     def add(frame):
+        if native:
+            try:
+                return word_sum(frame, 1, bits)
+            except (TypeError, BufferError):
+                pass  # Not a (contiguous) buffer, e.g. a list of integers or a strided memoryview.
         return sum(frame) % modulus
 
     return add
 
 
-def wordSum(modulus, step):
+def wordSum(modulus, step, byteorder="little"):
     """Factory function for (double-)word modulus sums
 
     Parameters
@@ -739,22 +342,61 @@ def wordSum(modulus, step):
     step : [2, 4]
         2 - word wise
         4 - double-word wise
+    byteorder : ["little", "big"]
+        byte order of the words
 
     Returns
     -------
     function
-        summation function
+        summation function; a trailing partial word is zero-padded
+
+    Examples
+    --------
+    >>> wordSum(2**16, 2)(b"\\x01\\x02\\x03")
+    516
+    >>> wordSum(2**16, 2, "big")(b"\\x01\\x02\\x03")
+    1026
     """
+    if step not in (2, 4):
+        raise NotImplementedError("Only WORDs or DWORDs are supported.")
+    if byteorder not in ("little", "big"):
+        raise ValueError("byteorder must be either 'little' or 'big'.")
+    little_endian = byteorder == "little"
+    dtype = f"{'<' if little_endian else '>'}u{step}"
+    bits = modulus.bit_length() - 1
+    power_of_two = modulus == 1 << bits and bits <= 64
+    native = word_sum is not None and power_of_two
 
     def add(frame):
-        if step == 2:
-            mask = "<H"
-        elif step == 4:
-            mask = "<I"
-        else:
-            raise NotImplementedError("Only WORDs or DWORDs are supported.")
-        x = [struct.unpack(mask, frame[x : x + step])[0] for x in range(0, len(frame), step)]
-        return sum(x) % modulus
+        if native:
+            try:
+                return word_sum(frame, step, bits, little_endian)
+            except (TypeError, BufferError):
+                pass  # Not a (contiguous) buffer, e.g. a list of integers or a strided memoryview.
+        try:
+            view = memoryview(frame).cast("B")
+        except TypeError:
+            view = memoryview(bytes(frame))
+        count, tail = divmod(len(view), step)
+        total = None
+        if len(view) >= _NUMPY_MIN_SIZE:
+            try:
+                import numpy as np
+            except ImportError:
+                pass
+            else:
+                words = np.frombuffer(view, dtype=dtype, count=count)
+                # uint64 wraps modulo 2**64, which is harmless for power-of-two moduli.
+                total = int(words.sum(dtype=np.uint64)) if power_of_two else sum(words.tolist())
+        if total is None:
+            words = array(_WORD_TYPECODES[step])
+            words.frombytes(view[: count * step])
+            if byteorder != sys.byteorder:
+                words.byteswap()
+            total = sum(words)
+        if tail:
+            total += int.from_bytes(bytes(view[-tail:]).ljust(step, b"\x00"), byteorder)
+        return total % modulus
 
     return add
 
@@ -765,17 +407,472 @@ ADD14 = adder(2**32)
 ADD22 = wordSum(2**16, 2)
 ADD24 = wordSum(2**32, 2)
 ADD44 = wordSum(2**32, 4)
-CRC16 = Crc16(CRC16, 0x0000, 0x0000, True, True)
-CRC16_CCITT = Crc16(CRC16_CCITT, 0xFFFF, 0x0000, False, False)
+ADD22_BE = wordSum(2**16, 2, "big")
+ADD24_BE = wordSum(2**32, 2, "big")
+ADD44_BE = wordSum(2**32, 4, "big")
+CRC16 = Crc(16, 0x8005, init=0x0000, refin=True, refout=True, xorout=0x0000)  # CRC-16/ARC
+CRC16_CCITT = Crc(16, 0x1021, init=0xFFFF, refin=False, refout=False, xorout=0x0000)  # CRC-16/CCITT-FALSE
+
+
+CRC8 = Crc(8, 0x07, init=0x00, refin=False, refout=False, xorout=0x00)  # CRC-8/SMBUS
+CRC64 = Crc(64, 0x42F0E1EBA9EA3693, init=2**64 - 1, refin=True, refout=True, xorout=2**64 - 1)  # CRC-64/XZ
+
+
+_CRC32 = Crc(32, 0x04C11DB7, init=0xFFFFFFFF, refin=True, refout=True, xorout=0xFFFFFFFF)
 
 
 def CRC32(x):
-    return zlib.crc32(bytes(x)) & 0xFFFFFFFF
+    try:
+        return zlib.crc32(x) & 0xFFFFFFFF
+    except (TypeError, BufferError):
+        return zlib.crc32(bytes(x)) & 0xFFFFFFFF
+
+
+CRC32_POLYNOMIAL = 0xEDB88320  # reflected
+
+
+def crc32_combine(crc1, crc2, length2):
+    """Combine two CRC-32 values like `zlib.crc32_combine()`
+
+    Parameters
+    ----------
+    crc1 : int
+        CRC-32 of the first block
+    crc2 : int
+        CRC-32 of the second block
+    length2 : int
+        length in bytes of the second block
+
+    Returns
+    -------
+    int
+        CRC-32 of both blocks concatenated
+
+    Examples
+    --------
+    >>> crc32_combine(zlib.crc32(b"Hello "), zlib.crc32(b"World"), 5) == zlib.crc32(b"Hello World")
+    True
+    """
+    if length2 <= 0:
+        return crc1
+    return _crc32_multmodp(_crc32_x2nmodp(length2, 3), crc1) ^ crc2
+
+
+def _crc32_multmodp(a, b):
+    """Multiply two polynomials modulo the CRC-32 polynomial (reflected bit order)."""
+    m = 1 << 31
+    p = 0
+    while True:
+        if a & m:
+            p ^= b
+            if (a & (m - 1)) == 0:
+                break
+        m >>= 1
+        b = (b >> 1) ^ CRC32_POLYNOMIAL if b & 1 else b >> 1
+    return p
+
+
+def _crc32_x2n_table():
+    p = 1 << 30  # x**1
+    table = [p]
+    for _ in range(31):
+        p = _crc32_multmodp(p, p)
+        table.append(p)
+    return table
+
+
+_CRC32_X2N = _crc32_x2n_table()  # x**(2**n) modulo the polynomial.
+
+
+@functools.lru_cache(maxsize=64)
+def _crc32_x2nmodp(n, k):
+    """x**(n * 2**k) modulo the CRC-32 polynomial, i.e. the operator for appending n * 2**k / 8 zero bytes."""
+    p = 1 << 31  # x**0
+    while n:
+        if n & 1:
+            p = _crc32_multmodp(_CRC32_X2N[k & 31], p)
+        n >>= 1
+        k += 1
+    return p
+
+
+@functools.lru_cache(maxsize=32)
+def _crc32_shift_tables(length):
+    """Byte-wise lookup tables for `crc32_combine(crc, 0, length)`
+
+    Appending zero bytes is linear over GF(2), so the operator is applied as
+    four table lookups (one per register byte) instead of a polynomial product.
+    """
+    return tuple(tuple(crc32_combine(value << shift, 0, length) for value in range(256)) for shift in (0, 8, 16, 24))
 
 
-def userDefined(x):
-    """User defined algorithms are not supported yet."""
-    raise NotImplementedError("Checksum method 'CHK_USER_DEFINED' not supported yet.")
+@functools.lru_cache(maxsize=64)
+def crc32_fill(value, count):
+    """CRC-32 of `count` bytes of `value`, without materialising them
+
+    Runs of filler bytes are assembled by repeated doubling with `crc32_combine`,
+    so the cost is O(log count) regardless of the size of the run.
+
+    Parameters
+    ----------
+    value : int
+        filler byte (0 .. 255)
+    count : int
+        number of bytes
+
+    Returns
+    -------
+    int
+        same value as `zlib.crc32(bytes([value]) * count)`
+
+    Examples
+    --------
+    >>> crc32_fill(0xFF, 1000) == zlib.crc32(b"\\xff" * 1000)
+    True
+    """
+    result = 0
+    run = zlib.crc32(bytes((value,)))
+    run_length = 1
+    while count:
+        if count & 1:
+            result = crc32_combine(result, run, run_length)
+        count >>= 1
+        if count:
+            run = crc32_combine(run, run, run_length)
+            run_length <<= 1
+    return result
+
+
+def crc32_parallel(buffer, workers=None, chunk_size=1 << 22):
+    """CRC-32 of a large buffer, computed chunk-wise in a thread pool
+
+    `zlib.crc32` releases the GIL, so chunks are processed concurrently;
+    the partial results are merged with `crc32_combine`.
+
+    Parameters
+    ----------
+    buffer : buffer
+        any contiguous buffer-protocol object (not copied)
+    workers : int, optional
+        number of threads, defaults to the number of CPUs
+    chunk_size : int
+        minimal chunk size in bytes; smaller buffers are processed directly
+
+    Returns
+    -------
+    int
+        same value as `zlib.crc32(buffer)`
+    """
+    view = memoryview(buffer).cast("B")
+    size = len(view)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or size < 2 * chunk_size:
+        return zlib.crc32(view)
+    import concurrent.futures
+
+    chunk_size = max(chunk_size, -(-size // workers))
+    offsets = range(0, size, chunk_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+        crcs = list(pool.map(lambda offset: zlib.crc32(view[offset : offset + chunk_size]), offsets))
+    result = crcs[0]
+    for offset, crc in zip(offsets[1:], crcs[1:]):
+        result = crc32_combine(result, crc, min(chunk_size, size - offset))
+    return result
+
+
+ADDITIVE_ALGORITHMS = {
+    # name: (modulus, word size)
+    "CHK_ADD_11": (2**8, 1),
+    "CHK_ADD_12": (2**16, 1),
+    "CHK_ADD_14": (2**32, 1),
+    "CHK_ADD_22": (2**16, 2),
+    "CHK_ADD_24": (2**32, 2),
+    "CHK_ADD_44": (2**32, 4),
+    "CHK_ADD_22_BE": (2**16, 2),
+    "CHK_ADD_24_BE": (2**32, 2),
+    "CHK_ADD_44_BE": (2**32, 4),
+}
+
+
+class BlockChecksums:
+    """Incrementally maintained checksum of a mutable buffer
+
+    The buffer is split into fixed size blocks, whose checksums are cached.
+    After a write only the affected blocks are invalidated (see `invalidate`), so
+    recomputing a region checksum costs O(dirty blocks) checksum work plus
+    one cheap combination step per block.
+
+    Parameters
+    ----------
+    algo : str
+        `CHK_CRC_32` or one of the additive algorithms (`CHK_ADD_*`);
+        other algorithms can't be combined block-wise
+    block_size : int
+        size of blocks in bytes, must be a multiple of 4
+
+    Examples
+    --------
+    >>> data = bytearray(1 << 20)
+    >>> tracker = BlockChecksums("CHK_CRC_32")
+    >>> tracker.checksum(data) == CRC32(data)
+    True
+    >>> data[1000:1004] = b"ABCD"
+    >>> tracker.invalidate(1000, 4)
+    >>> tracker.checksum(data) == CRC32(data)
+    True
+    """
+
+    def __init__(self, algo="CHK_CRC_32", block_size=4096):
+        if algo != "CHK_CRC_32" and algo not in ADDITIVE_ALGORITHMS:
+            raise NotImplementedError(f"Algorithm '{algo}' not supported by block-wise checksums.")
+        if block_size <= 0 or block_size % 4:
+            raise ValueError("block_size must be a positive multiple of 4.")
+        self.algo = algo
+        self.block_size = block_size
+        self._function = ALGO[algo]
+        self._blocks = []
+
+    def invalidate(self, offset=0, length=None):
+        """Mark blocks overlapping `offset` .. `offset + length` as dirty
+
+        Parameters
+        ----------
+        offset : int
+        length : int or None
+            None invalidates the whole buffer (e.g. after resizing it)
+        """
+        if length is None:
+            self._blocks = []
+            return
+        if length <= 0:
+            return
+        first = offset // self.block_size
+        last = min((offset + length - 1) // self.block_size + 1, len(self._blocks))
+        for idx in range(first, last):
+            self._blocks[idx] = None
+
+    def _block(self, view, idx):
+        value = self._blocks[idx]
+        if value is None:
+            start = idx * self.block_size
+            value = self._blocks[idx] = self._function(view[start : start + self.block_size])
+        return value
+
+    def checksum(self, data, offset=0, length=None):
+        """Calculate the checksum of `data[offset : offset + length]`
+
+        Parameters
+        ----------
+        data : buffer
+            the tracked buffer
+        offset : int
+        length : int or None
+            None means up to the end of `data`
+
+        Returns
+        -------
+        int
+        """
+        size = len(data)
+        if length is None:
+            length = size - offset
+        end = offset + length
+        block_size = self.block_size
+        block_count = size // block_size
+        if len(self._blocks) != block_count:
+            self._blocks = [None] * block_count
+        view = memoryview(data)
+        first = -(-offset // block_size)
+        last = end // block_size
+        if self.algo == "CHK_CRC_32":
+            if first >= last:
+                return zlib.crc32(view[offset:end])
+            crc = zlib.crc32(view[offset : first * block_size])
+            t0, t1, t2, t3 = _crc32_shift_tables(block_size)
+            for idx in range(first, last):  # Inlined `crc32_combine(crc, block, block_size)`.
+                crc = t0[crc & 0xFF] ^ t1[(crc >> 8) & 0xFF] ^ t2[(crc >> 16) & 0xFF] ^ t3[crc >> 24] ^ self._block(view, idx)
+            return zlib.crc32(view[last * block_size : end], crc)
+        modulus, step = ADDITIVE_ALGORITHMS[self.algo]
+        if first >= last or offset % step:
+            # Words wouldn't line up with cached blocks.
+            return self._function(view[offset:end])
+        total = self._function(view[offset : first * block_size]) + self._function(view[last * block_size : end])
+        for idx in range(first, last):
+            total += self._block(view, idx)
+        return total % modulus
+
+
+class Checksum:
+    """Incremental checksum with a `hashlib`-like interface
+
+    Use `new()` to create instances. Data may be fed in arbitrary chunks,
+    the result equals `check()` over the concatenated data.
+    """
+
+    _FILL_BLOCK = 1 << 16
+
+    def __init__(self, name, width):
+        self.name = name
+        self.width = width
+
+    def update(self, data):
+        """Feed `data` (buffer or iterable of integers) into the checksum"""
+        raise NotImplementedError()
+
+    def update_fill(self, value, count):
+        """Feed `count` bytes of `value`, e.g. the filler of an address gap
+
+        Equivalent to `update(bytes([value]) * count)`, but never allocates
+        more than a small reusable block.
+        """
+        block = bytes((value,)) * min(count, self._FILL_BLOCK)
+        while count >= len(block) > 0:
+            self.update(block)
+            count -= len(block)
+        if count:
+            self.update(block[:count])
+
+    def digest(self):
+        """Return the checksum of all data fed so far
+
+        Returns
+        -------
+        int
+        """
+        raise NotImplementedError()
+
+    def hexdigest(self):
+        return f"{self.digest():0{(self.width + 3) // 4}x}"
+
+    def copy(self):
+        return copy.copy(self)
+
+    def __repr__(self):
+        return f"<{self.name} checksum object>"
+
+
+class _AdditiveChecksum(Checksum):
+    def __init__(self, name, modulus, step, byteorder="little"):
+        super().__init__(name, modulus.bit_length() - 1)
+        self._modulus = modulus
+        self._step = step
+        self._byteorder = byteorder
+        self._function = adder(modulus) if step == 1 else wordSum(modulus, step, byteorder)
+        self._sum = 0
+        self._pending = b""  # Incomplete word from the previous chunk.
+
+    def update(self, data):
+        if self._pending or not isinstance(data, (bytes, bytearray, memoryview)):
+            data = self._pending + bytes(data)
+        bulk = len(data) - len(data) % self._step
+        if bulk:
+            self._sum = (self._sum + self._function(data if bulk == len(data) else memoryview(data)[:bulk])) % self._modulus
+        self._pending = bytes(data[bulk:])
+
+    def update_fill(self, value, count):
+        head = min(count, -len(self._pending) % self._step)
+        if head:  # Complete the pending word first.
+            self.update(bytes((value,)) * head)
+            count -= head
+        words, tail = divmod(count, self._step)
+        if words:
+            word = int.from_bytes(bytes((value,)) * self._step, self._byteorder)
+            self._sum = (self._sum + words * word) % self._modulus
+        if tail:
+            self._pending = bytes((value,)) * tail
+
+    def digest(self):
+        if not self._pending:
+            return self._sum
+        return (self._sum + self._function(self._pending)) % self._modulus
+
+
+class _CrcChecksum(Checksum):
+    def __init__(self, name, engine):
+        super().__init__(name, engine.width)
+        self._engine = engine
+        self._register = 0 if engine._zlib else engine._register
+
+    def update(self, data):
+        if self._engine._zlib:
+            try:
+                self._register = zlib.crc32(data, self._register)
+            except (TypeError, BufferError):
+                self._register = zlib.crc32(bytes(data), self._register)
+        else:
+            self._register = self._engine._update(self._register, data)
+
+    def update_fill(self, value, count):
+        if self._engine._zlib:
+            self._register = crc32_combine(self._register, crc32_fill(value, count), count)
+        else:
+            super().update_fill(value, count)
+
+    def digest(self):
+        if self._engine._zlib:
+            return self._register
+        return self._engine._finish(self._register)
+
+
+def new(name, data=None, **params):
+    """Create an incremental checksum object (like `hashlib.new()`)
+
+    Parameters
+    ----------
+    name : str
+        algorithm name, see `ALGO`
+    data : buffer, optional
+        initial data passed to `update()`
+    params :
+        CRC parameters for `CHK_USER_DEFINED`, see `Crc`
+
+    Returns
+    -------
+    `Checksum`
+
+    Examples
+    --------
+    >>> crc = new("CHK_CRC_16")
+    >>> crc.update(b"1234")
+    >>> crc.update(b"56789")
+    >>> crc.digest() == check(b"123456789", "CHK_CRC_16")
+    True
+    """
+    if name in ADDITIVE_ALGORITHMS:
+        modulus, step = ADDITIVE_ALGORITHMS[name]
+        result = _AdditiveChecksum(name, modulus, step, "big" if name.endswith("_BE") else "little")
+    elif name == "CHK_CRC_32":
+        result = _CrcChecksum(name, _CRC32)
+    elif name == "CHK_USER_DEFINED":
+        if params.get("width") is None or params.get("poly") is None:
+            raise NotImplementedError("Checksum method 'CHK_USER_DEFINED' requires CRC parameters (at least 'width' and 'poly').")
+        result = _CrcChecksum(name, _crc_engine(**{"init": 0, "refin": False, "refout": False, "xorout": 0, **params}))
+    elif isinstance(ALGO.get(name), Crc):
+        result = _CrcChecksum(name, ALGO[name])
+    else:
+        raise NotImplementedError(f"Invalid algorithm '{name}'.")
+    if data is not None:
+        result.update(data)
+    return result
+
+
+@functools.lru_cache(maxsize=16)
+def _crc_engine(width, poly, init, refin, refout, xorout):
+    return Crc(width, poly, init, refin, refout, xorout)
+
+
+def userDefined(x, width=None, poly=None, init=0, refin=False, refout=False, xorout=0):
+    """CRC with user supplied Rocksoft(tm) model parameters (see `Crc`)
+
+    Examples
+    --------
+    >>> hex(check(b"123456789", "CHK_USER_DEFINED", width=8, poly=0x07))
+    '0xf4'
+    """
+    if width is None or poly is None:
+        raise NotImplementedError("Checksum method 'CHK_USER_DEFINED' requires CRC parameters (at least 'width' and 'poly').")
+    return _crc_engine(width, poly, init, refin, refout, xorout)(x)
 
 
 ALGO = {
@@ -785,20 +882,27 @@ ALGO = {
     "CHK_ADD_22": ADD22,
     "CHK_ADD_24": ADD24,
     "CHK_ADD_44": ADD44,
+    "CHK_ADD_22_BE": ADD22_BE,
+    "CHK_ADD_24_BE": ADD24_BE,
+    "CHK_ADD_44_BE": ADD44_BE,
     "CHK_CRC_16": CRC16,
     "CHK_CRC_16_CCITT": CRC16_CCITT,
     "CHK_CRC_32": CRC32,
     "CHK_USER_DEFINED": userDefined,
+    "CHK_CRC_8": CRC8,
+    "CHK_CRC_64": CRC64,
 }
 
 
-def check(frame, algo):
+def check(frame, algo, **params):
     """Calculate checksum using given algorithm
 
     Parameters
     ----------
     frame : list of integers
     algo : `ALGO`
+    params :
+        CRC parameters for `CHK_USER_DEFINED`, see `Crc`
 
     Returns
     -------
@@ -806,6 +910,6 @@ def check(frame, algo):
     """
     fun = ALGO.get(algo)
     if fun:
-        return fun(frame)
+        return fun(frame, **params)
     else:
         raise NotImplementedError(f"Invalid algorithm '{algo}'.")
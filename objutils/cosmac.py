@@ -62,6 +62,7 @@ class Reader(hexfile.Reader):
         (DATA2, r"AAAA DD"),
         (DATA3, r"DD"),
     )
+    SIGNATURES = (b"!M", b"?M")
 
     def __init__(self) -> None:
         """Initialize reader with address state tracking."""
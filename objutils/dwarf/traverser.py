@@ -700,13 +700,10 @@ class AttributeParser:
             .all()
         )
         sections = []
-        for item in (
-            self.session.query(model.Elf_Section.sh_addr, model.Elf_Section.section_image)
-            .filter(model.Elf_Section.progbits, model.Elf_Section.flag_alloc)
-            .all()
-        ):
-            if item[1] is not None:  # Check for section data.
-                sections.append(Section(*item))
+        for section in self.session.query(model.Elf_Section).filter(model.Elf_Section.progbits, model.Elf_Section.flag_alloc).all():
+            image = section.section_image  # Stored BLOB or served from the ELF file.
+            if image is not None:  # Check for section data.
+                sections.append(Section(section.sh_addr, image))
         self.image = Image(sections)
         debug_str_section = self.session.query(model.Elf_Section).filter_by(section_name=".debug_str").first()
         if debug_str_section:
@@ -47,10 +47,17 @@ When an ELF file is parsed, the parser automatically creates a .prgdb file
 - Optional DWARF debug information (via import_dwarf_to_db)
 
 The database is invalidated and rebuilt if:
-- The source ELF file is modified (detected via SHA512 hash)
+- The source ELF file is modified (detected via a cheap validation key built from
+  size, mtime and inode plus a BLAKE2 sample of the header tables; the full SHA512
+  hash is only computed as a fallback or on request)
 - The database schema changes (column validation)
 - The database file is manually deleted
 
+Parsing happens in phases (header, sections, segments, symbols, notes) that are
+loaded on first access and recorded in the database, so e.g. reading ``e_machine``
+or the ``.text`` section never pays for the symbol import. Pass ``lazy=False`` to
+parse everything up front.
+
 Pass ``in_memory=True`` to :class:`ElfParser` to skip all on-disk caching.
 All parsed data is then stored in a transient SQLite ``:memory:`` database
 that lives only for the lifetime of the :class:`ElfParser` instance::
@@ -231,6 +238,8 @@ ElfParser instance to avoid SQLAlchemy session conflicts.
 - Any platform with Python 3.9+ and SQLite support
 """
 
+from __future__ import annotations
+
 __copyright__ = """
    objutils - Object file library for Python.
 
@@ -255,11 +264,15 @@ __copyright__ = """
 
 import binascii
 import hashlib
+import importlib.util
 import os
 import re
+import struct
+import sys
 import time
 import typing
 from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
 from itertools import groupby
 from pathlib import Path
 
@@ -295,13 +308,33 @@ from construct import (
     singleton,
     this,
 )
-from sqlalchemy import func, not_
-from sqlalchemy.exc import SQLAlchemyError
-
 from objutils import Image, Section
-from objutils.elf import defs, model
-from objutils.elf.arm import attributes
-from objutils.utils import create_memorymapped_fileview
+from objutils.elf import defs
+from objutils.logger import Logger
+
+
+def _lazy_module(name: str) -> typing.Any:
+    """Import module `name` on first attribute access.
+
+    Keeps SQLAlchemy (pulled in by :mod:`objutils.elf.model`) out of processes
+    that only use ``ElfParser(..., backend="direct")``.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+model = _lazy_module("objutils.elf.model")
+
+from objutils.elf.arm import attributes  # noqa: E402
+from objutils.elf import tables  # noqa: E402
+from objutils.utils import create_memorymapped_fileview, locked_file
 
 MAGIC: bytes = b"\x7fELF"
 
@@ -515,21 +548,28 @@ class DBAPI:
     to access the SQLAlchemy session and query interface.
     """
 
+    #: Parsing phase (see :attr:`ElfParser.PHASES`) that must be loaded before querying.
+    PHASE: str = "sections"
+
     def __init__(self, parent: "ElfParser") -> None:
         """Initialize DBAPI with reference to parent ElfParser.
 
         Args:
             parent: ElfParser instance that owns this API wrapper.
         """
-        self._session = parent.session
+        self._parent = parent
+        self._session = parent._session
 
     @property
     def session(self) -> typing.Any:
         """Get the SQLAlchemy database session.
 
+        Loads the parsing phase this API depends on on first access.
+
         Returns:
             SQLAlchemy session for database queries.
         """
+        self._parent.load_phases(self.PHASE)
         return self._session
 
     @property
@@ -602,6 +642,9 @@ class SectionAPI(DBAPI):
             ... )
         """
         query = self.query(model.Elf_Section)
+        if sections:
+            sections_list = [s for s in re.split(r"[ ,]", sections) if s]
+            query = query.filter(model.Elf_Section.section_name.in_(sections_list))
         if order_by_address:
             query = query.order_by(model.Elf_Section.sh_addr)
         else:
@@ -649,6 +692,8 @@ class SymbolAPI(DBAPI):
     binding (local/global/weak), type (function/object/etc.), and section.
     """
 
+    PHASE = "symbols"
+
     def get(
         self,
         symbol_name: str,
@@ -781,7 +826,7 @@ class SymbolAPI(DBAPI):
                     flt.append(defs.SymbolType.STT_COMMON)
                 elif item == "tls":
                     flt.append(defs.SymbolType.STT_TLS)
-                query = query.filter(model.Elf_Symbol.st_type.in_(flt))
+            query = query.filter(model.Elf_Symbol.st_type.in_(flt))
         if symbol_list:
             name_flt = frozenset(symbol_list)
             query = query.filter(model.Elf_Symbol.symbol_name.in_(name_flt))
@@ -821,28 +866,82 @@ class SymbolAPI(DBAPI):
         """
         syms = self.query(model.Elf_Symbol).filter(model.Elf_Symbol.st_shndx == defs.SectionName.SHN_ABS)
         syms = syms.filter(model.Elf_Symbol.symbol_name != "")
-        syms = syms.filter(func.regexp(model.Elf_Symbol.symbol_name, "_.*"))
+        syms = syms.filter(model.Elf_Symbol.symbol_name.regexp_match("_.*"))
         syms = syms.filter(model.Elf_Symbol.st_type == defs.SymbolType.STT_NOTYPE)
         return syms.order_by(model.Elf_Symbol.st_value).all()
 
 
-def calculate_crypto_hash(data: bytes) -> str:
+def calculate_crypto_hash(data: bytes | memoryview) -> str:
     """Calculate SHA512 hash of binary data.
 
     Args:
-        data: Binary data to hash.
+        data: Binary data to hash; any buffer (e.g. the memory-mapped file view)
+            is hashed in place, without copying.
 
     Returns:
         Hexadecimal string representation of SHA512 hash.
 
     Note:
         SHA512 is used for robust change detection of ELF files to determine
-        if the database cache should be invalidated.
+        if the database cache should be invalidated. As it reads every byte, it
+        is only used as a fallback to :func:`calculate_validation_key`.
     """
     sha = hashlib.sha512(data)
     return sha.hexdigest()
 
 
+VALIDATION_SAMPLE_EDGE: int = 4096
+
+
+def _header_table_ranges(data: bytes | memoryview) -> list[tuple[int, int]]:
+    """Return ``(offset, length)`` of the ELF header, program and section header tables."""
+    if len(data) < 52 or bytes(data[:4]) != MAGIC:
+        return []
+    byteorder = "<" if data[5] == 1 else ">"
+    if data[4] == 2:  # ELFCLASS64
+        if len(data) < 64:
+            return []
+        phoff, shoff = struct.unpack_from(f"{byteorder}QQ", data, 32)
+        phentsize, phnum, shentsize, shnum = struct.unpack_from(f"{byteorder}HHHH", data, 54)
+        ehsize = 64
+    else:
+        phoff, shoff = struct.unpack_from(f"{byteorder}II", data, 28)
+        phentsize, phnum, shentsize, shnum = struct.unpack_from(f"{byteorder}HHHH", data, 42)
+        ehsize = 52
+    return [(0, ehsize), (phoff, phentsize * phnum), (shoff, shentsize * shnum)]
+
+
+def calculate_validation_key(data: bytes | memoryview, filename: str | Path) -> str:
+    """Calculate a cheap cache-validation key for an ELF file.
+
+    The key combines ``st_size``, ``st_mtime_ns`` and ``st_ino`` with a BLAKE2b
+    digest over the ELF header, the program and section header tables and the
+    first/last :data:`VALIDATION_SAMPLE_EDGE` bytes of the file. Its cost does
+    not depend on the file size.
+
+    Args:
+        data: File contents (typically the memory-mapped view, sliced without copying).
+        filename: Path of the file, used for ``os.stat``.
+
+    Returns:
+        Key of the form ``"size:mtime_ns:inode:sample"``.
+    """
+    stat = os.stat(filename)
+    size = len(data)
+    sample = hashlib.blake2b(digest_size=16)
+    ranges = _header_table_ranges(data)
+    ranges.extend([(0, VALIDATION_SAMPLE_EDGE), (max(size - VALIDATION_SAMPLE_EDGE, 0), VALIDATION_SAMPLE_EDGE)])
+    for offset, length in ranges:
+        sample.update(data[offset : offset + length])
+    return f"{stat.st_size}:{stat.st_mtime_ns}:{stat.st_ino}:{sample.hexdigest()}"
+
+
+def _same_sampled_content(key_a: str, key_b: str) -> bool:
+    """Compare the content-related parts (size and sample digest) of two validation keys."""
+    parts_a, parts_b = key_a.split(":"), key_b.split(":")
+    return len(parts_a) == len(parts_b) == 4 and (parts_a[0], parts_a[3]) == (parts_b[0], parts_b[3])
+
+
 class ElfParser:
     """Parser and analyzer for ELF (Executable and Linkable Format) binary files.
 
@@ -888,6 +987,16 @@ class ElfParser:
 
     EI_NIDENT: int = 16
 
+    #: Independently loaded parsing phases, in dependency order.
+    PHASES: tuple[str, ...] = ("header", "sections", "segments", "symbols", "notes")
+    PHASE_DEPENDENCIES: dict[str, tuple[str, ...]] = {
+        "header": (),
+        "sections": ("header",),
+        "segments": ("header",),
+        "symbols": ("sections",),
+        "notes": ("sections",),
+    }
+
     DATATYPES32: dict[str, tuple[typing.Any, typing.Any]] = {
         "Addr": (Int32ul, Int32ub),  # 4 - Unsigned program address
         "Half": (Int16ul, Int16ub),  # 2 - Unsigned medium integer
@@ -926,7 +1035,27 @@ class ElfParser:
         ),
     )
 
-    def __init__(self, filename: str, in_memory: bool = False) -> None:
+    #: Available storage backends, see the ``backend`` argument of :meth:`__init__`.
+    BACKENDS: tuple[str, ...] = ("sqlite", "direct")
+
+    def __new__(cls, filename: str, *args: typing.Any, backend: str = "sqlite", **kws: typing.Any) -> ElfParser:
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"Unknown backend {backend!r}, expected one of {cls.BACKENDS}.")
+        if backend == "direct" and cls is ElfParser:
+            from objutils.elf.direct import DirectElfParser
+
+            cls = DirectElfParser
+        return super().__new__(cls)
+
+    def __init__(
+        self,
+        filename: str,
+        in_memory: bool = False,
+        verify_hash: bool = False,
+        store_images: bool = True,
+        lazy: bool = True,
+        backend: str = "sqlite",
+    ) -> None:
         """Initialize ElfParser with an ELF file.
 
         Creates or opens the associated .prgdb database file and parses the ELF
@@ -944,6 +1073,27 @@ class ElfParser:
             in_memory: If ``True``, use a transient in-memory SQLite database
                 instead of persisting a .prgdb file alongside the ELF file.
                 Defaults to ``False``.
+            verify_hash: If ``True``, always confirm an existing .prgdb cache with
+                a full SHA512 hash of the ELF file. By default the cache is
+                validated by :func:`calculate_validation_key` and the full hash is
+                only computed if file metadata changed but the sampled content did
+                not (e.g. after ``touch`` or a copy). Defaults to ``False``.
+            store_images: If ``False``, a newly built database stores only the
+                offsets and sizes of the sections; ``section_image`` is then
+                read on demand from the memory-mapped ELF file, which must stay
+                next to the .prgdb file. Defaults to ``True`` (self-contained BLOBs).
+            lazy: If ``True``, only the ELF header is parsed up front; sections,
+                segments, symbols and notes are parsed (and cached in the
+                database) on first access through :attr:`sections`,
+                :attr:`symbols`, :attr:`segments`, :attr:`notes` etc.
+                ``False`` parses everything immediately. Defaults to ``True``.
+            backend: ``"sqlite"`` (default) stores parsed data in a SQLite database
+                as described above. ``"direct"`` returns a
+                :class:`~objutils.elf.direct.DirectElfParser` that answers header,
+                :attr:`sections`, :attr:`symbols`, :attr:`segments` and
+                :meth:`create_image` from in-memory objects parsed straight from the
+                mapped file, without creating a database or importing SQLAlchemy;
+                the other arguments are ignored.
 
         Raises:
             FileNotFoundError: If the specified file doesn't exist.
@@ -957,12 +1107,22 @@ class ElfParser:
             >>> parser = ElfParser('firmware.elf', in_memory=True)
             >>> print(parser.e_machine)
         """
+        self.logger = Logger("ElfParser")
         self.fp = create_memorymapped_fileview(filename)
         self.filename = Path(filename)
         self._in_memory: bool = in_memory
+        self._verify_hash: bool = verify_hash
+        self._store_images: bool = store_images
+        self._lazy: bool = lazy
+        self._db_locked: bool = False
+        self._phases: set[str] = set()
+        self._meta: model.Meta | None = None
+        self._hash_value: str | None = None
+        self._program_headers: typing.Any = None
         self.db_name: Path | str = ":memory:" if in_memory else self.filename.with_suffix(model.DB_EXTENSION)
 
         self._images: dict[int, bytes | None] = {}
+        self._section_headers: dict[str, tuple] | None = None
         self._sections_by_name: OrderedDict[str, typing.Any] = OrderedDict()
         self.asciiCString: CString = CString(encoding="ascii")
 
@@ -1017,107 +1177,206 @@ class ElfParser:
 
         Side Effects:
             - Creates self.db (in-memory :class:`model.Model`) and self.session
-            - Parses and stores all ELF data via :meth:`load_data`
+            - Parses the ELF header (or, if not lazy, all phases) via :meth:`load_phases`
         """
-        hash_value = calculate_crypto_hash(self.fp.tobytes())
         self.db = model.Model(":memory:")
-        self.session = self.db.session
-        meta = model.Meta(hash_value=hash_value)
-        self.session.add(meta)
-        self.load_data()
+        self._session = self.db.session
+        self._session.info[model.IMAGE_SOURCE_KEY] = self.fp
+        self._meta = model.Meta(validation_key=calculate_validation_key(self.fp, self.filename), phases="")
+        self._session.add(self._meta)
+        self.load_phases(*(("header",) if self._lazy else self.PHASES))
 
     def create_db_on_demand(self) -> None:
         """Create or open the ELF database, validating and rebuilding as needed.
 
         This method implements the database lifecycle management:
         1. Check if .prgdb file exists
-        2. If exists, verify SHA512 hash matches the ELF file
+        2. If exists, compare the stored validation key (size, mtime, inode and
+           sampled BLAKE2 digest) with the ELF file; if only size/mtime/inode
+           differ, or ``verify_hash`` was requested, fall back to the SHA512 hash
         3. Validate database schema compatibility
         4. Rebuild if file modified, schema incompatible, or if first parse
         5. Initialize database session
 
         The database is rebuilt when:
         - No existing database is found
-        - ELF file has been modified (SHA512 hash mismatch)
+        - ELF file has been modified (sampled digest or SHA512 hash mismatch)
         - Database schema is outdated or incompatible
         - Required columns are missing from expected tables
 
+        Several processes may open the same ELF file at once (e.g. parallel test
+        workers): validation and rebuild run under an advisory lock on
+        ``<name>.prgdb.lock`` (see :meth:`_db_lock`), so exactly one process builds
+        the database while the others wait and then reuse it. A new database is
+        built in a temporary file and renamed over the old one, so readers never
+        see a half-written .prgdb; SQLite runs in WAL mode, so readers do not block
+        a process loading further phases.
+
         Side Effects:
             - Creates/updates self.db and self.session
             - Creates .prgdb file if needed
-            - Parses and stores ELF data if database is new
+            - Parses the ELF header (or, if not lazy, all phases) if database is new;
+              further phases are parsed on demand and recorded in ``Meta.phases``
         """
-        db_exists = self.db_name.exists()
-        new_db = False
-        hash_value = calculate_crypto_hash(self.fp.tobytes())
-        if db_exists:
-            db = model.Model(self.db_name)
+        with self._db_lock():
+            validation_key = calculate_validation_key(self.fp, self.filename)
+            valid, hash_value = self._validate_db(validation_key)
+            if not valid:
+                self._build_db(validation_key, hash_value)
+            self._open_db()
+
+    def _validate_db(self, validation_key: str) -> tuple[bool, str | None]:
+        """Check whether an existing .prgdb can be reused.
+
+        Returns:
+            ``(valid, hash_value)``; ``hash_value`` is the SHA512 of the ELF file
+            if it had to be computed, else ``None``.
+        """
+        from sqlalchemy.exc import SQLAlchemyError
+
+        if not self.db_name.exists():
+            return False, None
+        hash_value = None
+        db = model.Model(self.db_name)
+        try:
             session = db.session
-            meta = session.query(model.Meta).first()
-            if meta:
-                pass
-                # TODO: log.debug
-                # print(f"Calculated hash: {hash_value} DB-hash: {meta.hash_value} EQ: {hash_value == meta.hash_value}")
-            if (meta is None) or (hash_value != meta.hash_value):
-                new_db = True
-                try:
-                    db.close()
-                finally:
-                    try:
-                        os.unlink(self.db_name)
-                    except OSError as e:
-                        print(f"{e}")
-            else:
-                # Validate schema compatibility (e.g., required columns exist)
-                try:
-                    from sqlalchemy import inspect as sa_inspect
+            try:
+                meta = session.query(model.Meta).first()
+            except SQLAlchemyError:
+                meta = None
+            if meta is None:
+                return False, hash_value
+            if self._verify_hash or meta.validation_key != validation_key:
+                if meta.validation_key and not _same_sampled_content(meta.validation_key, validation_key):
+                    return False, hash_value  # Size or header tables changed, no need to hash the whole file.
+                hash_value = calculate_crypto_hash(self.fp)
+                if hash_value != meta.hash_value:
+                    return False, hash_value
+                if meta.validation_key != validation_key:
+                    meta.validation_key = validation_key  # Touched/copied, but unchanged.
+                    session.commit()
+            # Validate schema compatibility (e.g., required columns exist)
+            from sqlalchemy import inspect as sa_inspect
+
+            inspector = sa_inspect(db.engine)
+            try:
+                die_cols = [c["name"] for c in inspector.get_columns("debuginformationentry")]
+            except SQLAlchemyError:
+                die_cols = []
+            try:
+                dieattr_cols = [c["name"] for c in inspector.get_columns("dieattribute")]
+            except SQLAlchemyError:
+                dieattr_cols = []
+            required_die_cols = {"tag", "offset", "parent_id"}
+            required_dieattr_cols = {"entry_id"}
+            # Invalidate outdated schema: rebuild database
+            return required_die_cols.issubset(set(die_cols)) and required_dieattr_cols.issubset(set(dieattr_cols)), hash_value
+        except (OSError, SQLAlchemyError):
+            # If inspection fails for any reason, rebuild to be safe
+            return False, hash_value
+        finally:
+            # Close the preliminary connection before opening the main one to avoid file locking.
+            db.close()
 
-                    inspector = sa_inspect(db.engine)
-                    try:
-                        die_cols = [c["name"] for c in inspector.get_columns("debuginformationentry")]
-                    except SQLAlchemyError:
-                        die_cols = []
-                    try:
-                        dieattr_cols = [c["name"] for c in inspector.get_columns("dieattribute")]
-                    except SQLAlchemyError:
-                        dieattr_cols = []
-                    required_die_cols = {"tag", "offset", "parent_id"}
-                    required_dieattr_cols = {"entry_id"}
-                    if (not required_die_cols.issubset(set(die_cols))) or (not required_dieattr_cols.issubset(set(dieattr_cols))):
-                        # Invalidate outdated schema: rebuild database
-                        new_db = True
-                        try:
-                            db.close()
-                        finally:
-                            try:
-                                os.unlink(self.db_name)
-                            except OSError as e:
-                                print(f"{e}")
-                    else:
-                        # Close the preliminary connection before opening the main one to avoid file locking.
-                        db.close()
-                except (OSError, SQLAlchemyError):
-                    # If inspection fails for any reason, rebuild to be safe
-                    new_db = True
-                    try:
-                        db.close()
-                    finally:
-                        try:
-                            os.unlink(self.db_name)
-                        except OSError as e:
-                            print(f"{e}")
+    def _build_db(self, validation_key: str, hash_value: str | None) -> None:
+        """Parse the ELF header (or, if not lazy, all phases) into a new .prgdb.
+
+        The database is written to ``<name>.prgdb.<pid>.tmp``. If there is no
+        .prgdb yet, the file is simply renamed into place. A stale database is
+        not replaced on disk, as other processes may still have it open in WAL
+        mode, and a new file would be paired with their ``-wal``/``-shm`` files.
+        It is overwritten through SQLite instead (see :meth:`_copy_db`).
+        """
+        tmp_name = self.db_name.with_name(f"{self.db_name.name}.{os.getpid()}.tmp")
+        for leftover in (tmp_name, Path(f"{tmp_name}-wal"), Path(f"{tmp_name}-shm")):
+            leftover.unlink(missing_ok=True)  # From a crashed build with the same PID.
+        if hash_value is None:
+            hash_value = calculate_crypto_hash(self.fp)
+        self.db = model.Model(tmp_name)
+        self._session = self.db.session
+        self._session.info[model.IMAGE_SOURCE_KEY] = self.fp
+        self._meta = model.Meta(
+            hash_value=hash_value,
+            validation_key=validation_key,
+            image_file=None if self._store_images else self.filename.name,
+            phases="",
+        )
+        self._hash_value = hash_value
+        self._session.add(self._meta)
+        try:
+            self.load_phases(*(("header",) if self._lazy else self.PHASES))
+        except BaseException:
+            self.db.close()
+            tmp_name.unlink(missing_ok=True)
+            raise
+        self.db.close()  # Checkpoints the WAL, the file is self-contained now.
+        if not self.db_name.exists() and not Path(f"{self.db_name}-wal").exists():
+            os.replace(tmp_name, self.db_name)
+        elif self._copy_db(tmp_name):
+            tmp_name.unlink()
         else:
-            new_db = True
+            os.replace(tmp_name, self.db_name)
+
+    def _copy_db(self, source: Path) -> bool:
+        """Overwrite :attr:`db_name` with the database `source` using SQLite's backup API.
+
+        Goes through SQLite's locking and WAL, so connections of other processes
+        stay consistent: open read transactions keep their snapshot, later ones
+        see the new contents.
+
+        Returns:
+            ``False`` if :attr:`db_name` is not a (readable) SQLite database, i.e.
+            nobody can be using it and it may be replaced on disk.
+        """
+        import sqlite3
+
+        src = sqlite3.connect(source)
+        try:
+            dst = sqlite3.connect(self.db_name, timeout=model.SQLITE_TIMEOUT_SECONDS)
+            try:
+                src.backup(dst)
+            except sqlite3.DatabaseError as e:
+                if isinstance(e, sqlite3.OperationalError):  # E.g. locked, not a problem of the file.
+                    raise
+                return False  # Not a database or corrupt.
+            finally:
+                dst.close()
+        finally:
+            src.close()
+        return True
+
+    def _open_db(self) -> None:
+        """Open the (valid) .prgdb and restore the parser state from it."""
         self.db = model.Model(self.db_name)
-        self.session = self.db.session
-        if new_db:
-            meta = model.Meta(hash_value=hash_value)
-            self.session.add(meta)
-            self.load_data()
+        self._session = self.db.session
+        self._session.info[model.IMAGE_SOURCE_KEY] = self.fp
+        self._program_headers = None  # ORM objects of a previous session.
+        self._meta = self._session.query(model.Meta).first()
+        self._hash_value = self._meta.hash_value
+        if self._meta.phases is None:  # Built before phases were tracked, i.e. complete.
+            self._phases = set(self.PHASES)
         else:
-            self._header = self.session.query(model.Elf_Header).first()
-            self._program_headers = self.session.query(model.Elf_ProgramHeaders).all()
-            self.set_data_types(self)
+            self._phases = set(filter(None, self._meta.phases.split(",")))
+        self._header = self._session.query(model.Elf_Header).first()
+        self.set_data_types(self)
+        if not self._lazy:
+            self.load_phases(*self.PHASES)
+
+    @contextmanager
+    def _db_lock(self) -> typing.Iterator[None]:
+        """Inter-process lock for building the .prgdb and loading phases into it.
+
+        Reentrant within this parser; a no-op for in-memory databases.
+        """
+        if self._in_memory or self._db_locked:
+            yield
+            return
+        with locked_file(f"{self.db_name}.lock"):
+            self._db_locked = True
+            try:
+                yield
+            finally:
+                self._db_locked = False
 
     def close(self) -> None:
         """Release database and file resources."""
@@ -1134,17 +1393,17 @@ class ElfParser:
     def load_data(self) -> None:
         """Parse ELF file and populate database.
 
-        Performs the main ELF parsing workflow:
-        1. Parse basic header (first 16 bytes) to determine architecture
-        2. Parse extended header (e_type, e_machine, e_entry, etc.)
-        3. Parse section headers and extract section data
-        4. Parse program headers (segments)
-        5. Create section-to-segment mapping
-        6. Parse symbol tables (if present)
-        7. Commit all data to database
+        Performs the complete ELF parsing workflow, i.e. loads all
+        :attr:`PHASES` that are not already present in the database:
+        1. Parse basic and extended header to determine architecture
+        2. Parse section headers and extract section data
+        3. Parse program headers (segments) and create section-to-segment mapping
+        4. Parse symbol tables (if present)
+        5. Parse notes and .comment section
+        6. Commit all data to database
 
-        This method is called only once per ELF file, when creating a new database.
-        Subsequent parser instances reuse the existing database.
+        With ``lazy=True`` (the default) phases are loaded on first use instead;
+        calling this method forces everything in.
 
         Side Effects:
             - Sets self._header, self._program_headers, self._section_headers
@@ -1152,6 +1411,58 @@ class ElfParser:
             - Populates self._sections_by_name
             - Commits all parsed data to database via self.session.commit()
         """
+        self.load_phases(*self.PHASES)
+
+    def load_phases(self, *phases: str) -> None:
+        """Make sure the given parsing phases (and their dependencies) are loaded.
+
+        Each phase is parsed at most once per database; the set of loaded phases
+        is recorded in ``Meta.phases`` so a cached .prgdb continues where it left off.
+        A phase is committed in one transaction together with its ``Meta.phases``
+        entry; on error it is rolled back completely and can simply be retried.
+        Phases are loaded under the .prgdb lock and phases loaded by other processes
+        in the meantime are skipped.
+
+        Args:
+            *phases: Names from :attr:`PHASES`.
+
+        Raises:
+            ValueError: On unknown phase names.
+        """
+        if all(phase in self._phases for phase in phases):
+            return
+        with self._db_lock():
+            self._refresh_phases()
+            for phase in phases:
+                if phase in self._phases:
+                    continue
+                if phase not in self.PHASE_DEPENDENCIES:
+                    raise ValueError(f"Unknown parsing phase {phase!r}, expected one of {self.PHASES}.")
+                self.load_phases(*self.PHASE_DEPENDENCIES[phase])
+                # One transaction per phase: its rows and the Meta.phases entry are
+                # committed together, or nothing at all.
+                try:
+                    getattr(self, f"_load_{phase}")()
+                    if self._meta is not None:
+                        self._meta.phases = ",".join(p for p in self.PHASES if p in self._phases or p == phase)
+                    self._session.commit()
+                except BaseException:
+                    self._session.rollback()
+                    raise
+                self._phases.add(phase)
+
+    def _refresh_phases(self) -> None:
+        """Pick up phases another process has loaded into the shared .prgdb meanwhile."""
+        if self._in_memory or self._meta is None:
+            return
+        self._session.commit()  # End the read transaction, so the query sees other processes' commits.
+        hash_value, phases = self._session.query(model.Meta.hash_value, model.Meta.phases).one()
+        if hash_value != self._hash_value:
+            raise ValueError(f"{str(self.db_name)!r} has been rebuilt for a modified {str(self.filename)!r}, reopen it.")
+        self._phases |= set(self.PHASES) if phases is None else set(filter(None, phases.split(",")))
+
+    def _load_header(self) -> None:
+        """Parse basic and extended ELF header."""
         basic_header = ElfParser.BasicHeader.parse(self.fp)
         bh_fields = basic_header.header.fields
         self.set_data_types(bh_fields)
@@ -1177,13 +1488,96 @@ class ElfParser:
             e_shnum=eh_fields.e_shnum,
             e_shstrndx=eh_fields.e_shstrndx,
         )
-        self.session.add(self._header)
+        self._session.add(self._header)
+
+    def _load_sections(self) -> None:
         self._parse_section_headers()
+
+    def _load_segments(self) -> None:
         self._parse_program_headers()
         self.create_section_to_segment_mapping()
-        for section in self._symbol_sections:
-            self._parse_symbol_section(section)
-        self.session.commit()
+
+    _SYMBOL_INSERT = (
+        "INSERT INTO elf_symbol "
+        "(st_name, st_value, st_size, st_bind, st_type, st_other, st_shndx, symbol_name, section_name, access) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
+    # Symbol tables from this size on are imported via hexfiles_ext.parse_symbol_columns.
+    _COLUMNAR_MIN_SYMBOLS = 50_000
+
+    def _load_symbols(self) -> None:
+        symbol_sections = (
+            self._session.query(model.Elf_Section)
+            .filter(model.Elf_Section.sh_type.in_((defs.SectionType.SHT_SYMTAB, defs.SectionType.SHT_DYNSYM)))
+            .order_by(model.Elf_Section.index)
+            .all()
+        )
+        # Maintaining the secondary indexes row by row is much slower than
+        # building them once, so drop them for the bulk load. pysqlite only
+        # begins a transaction before DML; begin explicitly, so that the drop is
+        # part of the phase transaction and rolled back with it (see load_phases).
+        connection = self._session.connection()
+        if not connection.connection.driver_connection.in_transaction:
+            connection.exec_driver_sql("BEGIN")
+        indexes = model.Elf_Symbol.__table__.indexes
+        for index in indexes:
+            index.drop(connection, checkfirst=True)
+        section_map = self._section_index_map() if symbol_sections else {}
+        for section in symbol_sections:
+            self._parse_symbol_section(section, section_map)
+        for index in indexes:
+            index.create(connection, checkfirst=True)
+
+    def _load_notes(self) -> None:
+        """Parse NOTE sections and the .comment section."""
+        sections = (
+            self._session.query(model.Elf_Section)
+            .filter((model.Elf_Section.sh_type == defs.SectionType.SHT_NOTE) | (model.Elf_Section.section_name == ".comment"))
+            .order_by(model.Elf_Section.index)
+            .all()
+        )
+        for section in sections:
+            image = self._section_bytes(section.index)
+            if section.sh_type == defs.SectionType.SHT_NOTE:
+                note_obj = self._parse_note(image)
+                if note_obj:
+                    self._session.add(
+                        model.Elf_Note(
+                            section_name=section.section_name,
+                            type=note_obj.type,
+                            name=note_obj.name,
+                            desc=note_obj.desc,
+                        )
+                    )
+            else:
+                cmt_text = self._parse_comment(image)
+                if cmt_text:
+                    self._session.add(model.Elf_Comment(text=cmt_text))
+
+    def _section_index_map(self) -> dict[int, tuple[str, int]]:
+        """Map ``st_shndx`` to ``(section_name, sh_flags)`` for symbol import.
+
+        Built from the section headers parsed in this process, or with a single
+        query when the sections phase was loaded from an existing .prgdb.
+        Reserved indices (``SHN_UNDEF``, ``SHN_ABS``, ...) map to their names
+        with no flags.
+        """
+        if self._section_headers is not None:
+            headers = self._section_headers
+            mapping = dict(enumerate(zip(headers["section_name"], headers["sh_flags"])))
+        else:
+            rows = self._session.query(model.Elf_Section.index, model.Elf_Section.section_name, model.Elf_Section.sh_flags)
+            mapping = {index: (name, flags) for index, name, flags in rows}
+        mapping.update((ndx, (defs.special_section_name(ndx), 0)) for ndx in defs.SpecialSections)
+        return mapping
+
+    def _section_bytes(self, index: int) -> bytes | None:
+        """Return the contents of section `index`, caching them in ``self._images``."""
+        if index not in self._images:
+            section = self._session.query(model.Elf_Section).filter(model.Elf_Section.index == index).first()
+            self._images[index] = section.section_image if section is not None else None
+        return self._images[index]
 
     def _parser_extended_header(self) -> typing.Any:
         """Parse the ELF extended header (post-identification bytes).
@@ -1218,28 +1612,13 @@ class ElfParser:
         )
         return ExtendedHeader.parse(self.fp[self.EI_NIDENT :])
 
-    def _parse_section_headers(self) -> None:
-        """Parse section headers and extract section data from ELF file.
-
-        Reads all section headers from the ELF file and:
-        1. Extracts binary data for each section
-        2. Resolves section names from the string table
-        3. Identifies symbol tables for later parsing
-        4. Parses special section types (NOTE, COMMENT)
-        5. Stores all section metadata in database
+    def _section_header_struct(self) -> Struct:
+        """``construct`` definition of the section header table.
 
-        This method populates:
-        - self._section_headers: List of parsed section header entries
-        - self._images: Dictionary mapping section index to binary data
-        - self._sections_by_name: Dictionary mapping section names to entries
-        - self._symbol_sections: List of symbol table sections for parsing
-
-        Side Effects:
-            - Populates database with Elf_Section entries
-            - Parses NOTE sections into Elf_Note entries
-            - Parses .comment section into Elf_Comment entries
+        Reference implementation for :func:`objutils.elf.tables.iter_table`;
+        the parser itself uses the latter, the test-suite compares both.
         """
-        SectionHeaders = Struct(
+        return Struct(
             "sections"
             / Array(
                 lambda ctx: self.e_shnum,
@@ -1255,65 +1634,62 @@ class ElfParser:
                     "sh_info" / self.Word,
                     "sh_addralign" / self.Xword,
                     "sh_entsize" / self.Xword,
-                    "allocate" / Computed(lambda ctx: (ctx.sh_type not in (0, 8) and ctx.sh_size > 0)),
                 ),
             )
         )
+
+    def _parse_section_headers(self) -> None:
+        """Parse section headers and extract section data from ELF file.
+
+        Reads all section headers from the ELF file and:
+        1. Extracts binary data for each section
+        2. Resolves section names from the string table
+        3. Stores all section metadata in database
+
+        The header table is unpacked in one go by :func:`objutils.elf.tables.read_columns`;
+        section names are decoded straight from the section header string table.
+        Symbol tables, NOTE and COMMENT sections are parsed by their own phases
+        (see :meth:`load_phases`).
+
+        This method populates:
+        - self._section_headers: Section header table as columns (``{"sh_type": (...), ...}``),
+          including the resolved ``section_name``
+        - self._images: Dictionary mapping section index to binary data (stored images only)
+        - self._sections_by_name: Dictionary mapping section names to header dicts
+
+        Side Effects:
+            - Populates database with Elf_Section entries
+        """
+        if not hasattr(self, "e_shnum"):
+            return
+        self._section_headers = tables.read_columns(
+            self.fp, "shdr", self.b64, self._endianess, self.e_shoff, self.e_shnum, self.e_shentsize if self.e_shnum else 0
+        )
+        rows = list(zip(*(self._section_headers[name] for name in tables.SHDR_FIELDS)))
+        shstrtab = b""
+        if self.e_shstrndx < len(rows):
+            _, sh_type, _, _, sh_offset, sh_size, *_ = rows[self.e_shstrndx]
+            if sh_type != defs.SectionType.SHT_NOBITS:
+                shstrtab = self.fp[sh_offset : sh_offset + sh_size].tobytes()
         sections = []
-        self._symbol_sections = []
-        if hasattr(self, "e_shnum"):
-            self._section_headers = SectionHeaders.parse(self.fp[self.e_shoff :])
-            for idx, section in enumerate(self._section_headers.sections):
-                if section.allocate:
-                    image = self.fp[section.sh_offset : section.sh_offset + section.sh_size]
-                else:
-                    image = None
-                if image is not None:
-                    image = image.tobytes()
+        names = []
+        for idx, row in enumerate(rows):
+            header = dict(zip(tables.SHDR_FIELDS, row))
+            header["index"] = idx
+            header["section_name"] = name = tables.cstring(shstrtab, header["sh_name"])
+            names.append(name)
+            image = None
+            if self._store_images and header["sh_type"] not in (0, 8) and header["sh_size"] > 0:
+                image = self.fp[header["sh_offset"] : header["sh_offset"] + header["sh_size"]].tobytes()
                 self._images[idx] = image
-                section.image = image
-            for idx, section in enumerate(self._section_headers.sections):
-                name = self.get_string(self.e_shstrndx, section.sh_name)
-                section.name = name
-                self._sections_by_name[name] = section
-                image = self._images[idx]
-                if section.sh_type == defs.SectionType.SHT_NOTE:
-                    note_obj = self._parse_note(image)
-                    if note_obj:
-                        note = model.Elf_Note(
-                            section_name=name,
-                            type=note_obj.type,
-                            name=note_obj.name,
-                            desc=note_obj.desc,
-                        )
-                        sections.append(note)
-                elif section.sh_type in (
-                    defs.SectionType.SHT_SYMTAB,
-                    defs.SectionType.SHT_DYNSYM,
-                ):
-                    self._symbol_sections.append(section)
-                elif name == ".comment":
-                    cmt_text = self._parse_comment(image)
-                    if cmt_text:
-                        comment = model.Elf_Comment(text=cmt_text)
-                        sections.append(comment)
-                db_sec = model.Elf_Section(
-                    index=idx,
-                    section_name=name,
-                    sh_name=section.sh_name,
-                    sh_type=section.sh_type,
-                    sh_flags=section.sh_flags,
-                    sh_addr=section.sh_addr,
-                    sh_offset=section.sh_offset,
-                    sh_size=section.sh_size,
-                    sh_link=section.sh_link,
-                    sh_info=section.sh_info,
-                    sh_addralign=section.sh_addralign,
-                    sh_entsize=section.sh_entsize,
-                    section_image=image,
-                )
-                sections.append(db_sec)
-            self.session.bulk_save_objects(sections)
+            header["section_image"] = image
+            self._sections_by_name[name] = header
+            sections.append(header)
+        self._section_headers["section_name"] = tuple(names)
+        # Core executemany instead of ORM objects: constructing tens of thousands of
+        # Elf_Section instances costs far more than unpacking the table itself.
+        if sections:
+            self._session.execute(model.Elf_Section.__table__.insert(), sections)
 
     def get_string(self, table_index: int, entry: int) -> str:
         """Get a null-terminated string from a string table by offset.
@@ -1341,7 +1717,7 @@ class ElfParser:
             >>> section_name = parser.get_string(shstrtab_index, section.sh_name)
             >>> print(section_name)  # '.text'
         """
-        if entry > len(self._images[table_index]):
+        if entry > len(self._section_bytes(table_index) or b""):
             return ""
         name = self.asciiCString.parse(self._images[table_index][entry:])
         return name
@@ -1371,8 +1747,11 @@ class ElfParser:
         Program header structure for 64-bit ELF:
             - Field order differs: p_flags comes after p_type and before p_offset
 
+        The table is unpacked by :func:`objutils.elf.tables.iter_table`, which
+        takes care of the differing field order.
+
         Side Effects:
-            - Sets self._program_headers to list of parsed segment structures
+            - Sets self._program_headers to the list of model.Elf_ProgramHeaders entries
             - Populates database with model.Elf_ProgramHeaders entries
             - Commits changes to database via self.session
 
@@ -1383,7 +1762,22 @@ class ElfParser:
             - Each segment may contain multiple sections (determined later by
               section_in_segment checks)
         """
-        ProgramHeaders = Struct(
+        if hasattr(self, "e_shnum"):
+            names = tables.field_names("phdr", self.b64)
+            entsize = self.e_phentsize if self.e_phnum else 0
+            self._program_headers = []
+            for row in tables.iter_table(self.fp, "phdr", self.b64, self._endianess, self.e_phoff, self.e_phnum, entsize):
+                header = model.Elf_ProgramHeaders(**dict(zip(names, row)))
+                self._session.add(header)
+                self._program_headers.append(header)
+
+    def _program_header_struct(self) -> Struct:
+        """``construct`` definition of the program header table.
+
+        Reference implementation for :func:`objutils.elf.tables.iter_table`;
+        the parser itself uses the latter, the test-suite compares both.
+        """
+        return Struct(
             "segments"
             / Array(
                 lambda ctx: self.e_phnum,
@@ -1413,22 +1807,8 @@ class ElfParser:
                 ),
             )
         )
-        if hasattr(self, "e_shnum"):
-            self._program_headers = ProgramHeaders.parse(self.fp[self.e_phoff :]).segments
-            for segment in self._program_headers:
-                header = model.Elf_ProgramHeaders(
-                    p_type=segment.p_type,
-                    p_offset=segment.p_offset,
-                    p_vaddr=segment.p_vaddr,
-                    p_paddr=segment.p_paddr,
-                    p_filesz=segment.p_filesz,
-                    p_memsz=segment.p_memsz,
-                    p_flags=segment.p_flags,
-                    p_align=segment.p_align,
-                )
-                self.session.add(header)
 
-    def _parse_symbol_section(self, section: typing.Any) -> None:
+    def _parse_symbol_section(self, section: typing.Any, section_map: dict[int, tuple[str, int]] | None = None) -> None:
         """Parse symbol table section and populate database with symbol entries.
 
         Parses all symbol entries from a symbol table section (SHT_SYMTAB or SHT_DYNSYM)
@@ -1447,86 +1827,166 @@ class ElfParser:
         Symbol table structure for 64-bit ELF (Elf64_Sym, 24 bytes):
             - Field order differs: st_name, st_info, st_other, st_shndx, st_value, st_size
 
-        The method first tries to use the C++ extension ``hexfiles_ext.parse_symbol_table``
-        for maximum performance.  If the extension is not available (e.g. not yet built),
-        it falls back to the ``construct``-based pure-Python parser.
+        The method first tries to use the C++ extension: ``hexfiles_ext.parse_symbol_columns``
+        for large tables (NumPy columns instead of one dict per symbol, see
+        :meth:`_symbol_rows_from_columns`), ``hexfiles_ext.parse_symbol_table`` otherwise.
+        If the extension is not available (e.g. not yet built), it falls back to
+        :meth:`_parse_symbol_section_struct` (``struct.iter_unpack``), and only if that fails
+        to the ``construct``-based :meth:`_parse_symbol_section_py`.
 
-        In both cases, section-name resolution (shndx → section_name, sh_flags) is done
-        in Python with a local cache to avoid repeated SQLAlchemy queries for the same
-        section index.
+        Section-name resolution (shndx → section_name, sh_flags) uses ``section_map``
+        (see :meth:`_section_index_map`); the C++ extension applies it itself, the
+        Python parsers are resolved afterwards. No per-section queries are issued.
 
         Args:
-            section: Parsed construct Container for the symbol-table section.
-                Must have ``sh_link`` (string-table section index) and ``image`` (raw bytes).
+            section: :class:`model.Elf_Section` of the symbol table; ``sh_link`` is the
+                index of the associated string-table section.
+            section_map: ``st_shndx -> (section_name, sh_flags)``; built on demand
+                if not given.
 
         Side Effects:
-            - Bulk inserts model.Elf_Symbol entries into database
-            - Commits transaction on success, rolls back on error
+            - Bulk inserts the symbols into the database with a single Core
+              ``executemany`` (no per-symbol ORM objects); committed together
+              with the whole ``symbols`` phase by :meth:`load_phases`
         """
         sh_link = section.sh_link
-        symtab_bytes: bytes = section.image or b""
-        strtab_bytes: bytes = self._images.get(sh_link) or b""
+        if section_map is None:
+            section_map = self._section_index_map()
+        symtab_bytes: bytes = self._section_bytes(section.index) or b""
+        strtab_bytes: bytes = self._section_bytes(sh_link) or b""
 
         # ── Fast path: C++ extension ──────────────────────────────────────
+        # Large tables go through the columnar variant (NumPy arrays, no dict per
+        # symbol); it only pays for the NumPy import from a few ten thousand symbols on.
+        rows: list[tuple] | None = None
         raw_symbols: list[dict] | None = None
+        num_symbols = len(symtab_bytes) // (24 if self.b64 else 16)
         try:
-            from objutils.hexfiles_ext import parse_symbol_table as _cpp_parse  # type: ignore[import]
+            if num_symbols >= self._COLUMNAR_MIN_SYMBOLS or "numpy" in sys.modules:
+                from objutils.hexfiles_ext import parse_symbol_columns  # type: ignore[import]
 
-            raw_symbols = _cpp_parse(
-                symtab_bytes,
-                strtab_bytes,
-                self.b64,
-                self._endianess == "<",
-            )
+                columns = parse_symbol_columns(symtab_bytes, strtab_bytes, self.b64, self._endianess == "<")
+                rows = self._symbol_rows_from_columns(columns, section_map)
+            else:
+                from objutils.hexfiles_ext import parse_symbol_table as _cpp_parse  # type: ignore[import]
+
+                raw_symbols = _cpp_parse(symtab_bytes, strtab_bytes, self.b64, self._endianess == "<", section_map)
         except Exception:
             pass  # fall through to pure-Python path
 
-        if raw_symbols is None:
-            # ── Fallback: construct-based parser ─────────────────────────
-            raw_symbols = self._parse_symbol_section_py(symtab_bytes, strtab_bytes, sh_link)
-
-        # ── Section-name resolution (Python, with cache) ──────────────────
-        # Cache: shndx -> (section_name: str, sh_flags: int)
-        section_cache: dict[int, tuple[str, int]] = {}
-        symbols = []
-
-        for sym in raw_symbols:
-            shndx: int = sym["st_shndx"]
-            if shndx in defs.SpecialSections:
-                section_name = defs.special_section_name(shndx)
-                access = 0
-            elif shndx in section_cache:
-                section_name, access = section_cache[shndx]
-            else:
-                section_header = self.session.query(model.Elf_Section).filter(model.Elf_Section.index == shndx).first()
-                if section_header:
-                    section_name = section_header.section_name
-                    access = section_header.sh_flags
+        if rows is None:
+            if raw_symbols is None:
+                # ── Pure Python: struct.iter_unpack ──────────────────────
+                try:
+                    raw_symbols = self._parse_symbol_section_struct(symtab_bytes, strtab_bytes)
+                except (struct.error, ValueError) as e:
+                    self.logger.warn(f"parse symbol section (struct): {e}, falling back to construct.")
+
+            if raw_symbols is None:
+                # ── Fallback: construct-based parser ─────────────────────
+                raw_symbols = self._parse_symbol_section_py(symtab_bytes, strtab_bytes, sh_link)
+
+            # ── Section-name resolution (unless done by the extension) ────
+            rows = []
+            for sym in raw_symbols:
+                shndx: int = sym["st_shndx"]
+                if "section_name" in sym:
+                    section_name, access = sym["section_name"], sym["access"]
                 else:
-                    section_name = str(shndx)
-                    access = 0
-                section_cache[shndx] = (section_name, access)
-
-            db_sym = model.Elf_Symbol(
-                st_name=sym["st_name"],
-                st_value=sym["st_value"],
-                st_size=sym["st_size"],
-                st_bind=sym["st_bind"],
-                st_type=sym["st_type"],
-                st_other=sym["st_other"],
-                st_shndx=shndx,
-                symbol_name=sym["symbol_name"],
-                section_name=section_name,
-                access=access,
+                    section_name, access = section_map.get(shndx) or (str(shndx), 0)
+                rows.append(
+                    (
+                        sym["st_name"],
+                        sym["st_value"],
+                        sym["st_size"],
+                        sym["st_bind"],
+                        sym["st_type"],
+                        sym["st_other"],
+                        shndx,
+                        sym["symbol_name"],
+                        section_name,
+                        access,
+                    )
+                )
+
+        if rows:
+            # Straight to the driver's executemany: even Core inserts spend more
+            # time binding parameters per row than SQLite spends storing them.
+            self._session.connection().exec_driver_sql(self._SYMBOL_INSERT, rows)
+
+    @staticmethod
+    def _symbol_rows_from_columns(columns: dict[str, typing.Any], section_map: dict[int, tuple[str, int]]) -> list[tuple]:
+        """Build ``elf_symbol`` insert rows from :func:`tables.symbol_columns` output.
+
+        Every column is converted with a single ``tolist()``; section names are
+        resolved once per distinct ``st_shndx`` and spread with ``np.unique``'s
+        inverse index.
+        """
+        import numpy as np
+
+        st_info = columns["st_info"]
+        st_shndx = columns["st_shndx"]
+        indices, inverse = np.unique(st_shndx, return_inverse=True)
+        resolved = [section_map.get(shndx) or (str(shndx), 0) for shndx in indices.tolist()]
+        sections = [resolved[idx] for idx in inverse.tolist()]
+        return list(
+            zip(
+                columns["st_name"].tolist(),
+                columns["st_value"].tolist(),
+                columns["st_size"].tolist(),
+                (st_info >> 4).tolist(),
+                (st_info & 0x0F).tolist(),
+                columns["st_other"].tolist(),
+                st_shndx.tolist(),
+                tables.column_names(columns),
+                [section[0] for section in sections],
+                [section[1] for section in sections],
             )
-            symbols.append(db_sym)
+        )
 
-        try:
-            self.session.bulk_save_objects(symbols)
-            self.session.commit()
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            print(f"{e}")
+    def _parse_symbol_section_struct(self, symtab_bytes: bytes, strtab_bytes: bytes) -> list[dict]:
+        """Pure-Python symbol-table parser based on :func:`struct.iter_unpack`.
+
+        Used when the C++ extension is unavailable. Entries are unpacked by
+        :func:`objutils.elf.tables.iter_table`, names are resolved through a
+        :class:`objutils.elf.tables.StringTable` built once per string table.
+
+        Args:
+            symtab_bytes: Raw bytes of the symbol-table section.
+            strtab_bytes: Raw bytes of the associated string-table section.
+
+        Returns:
+            List of dicts with keys matching the C++ extension output.
+        """
+        names = tables.StringTable(strtab_bytes)
+        entries = tables.iter_table(symtab_bytes, "sym", self.b64, self._endianess)
+        if self.b64:
+            return [
+                {
+                    "st_name": st_name,
+                    "st_value": st_value,
+                    "st_size": st_size,
+                    "st_bind": st_info >> 4,
+                    "st_type": st_info & 0x0F,
+                    "st_other": st_other,
+                    "st_shndx": st_shndx,
+                    "symbol_name": names[st_name],
+                }
+                for st_name, st_info, st_other, st_shndx, st_value, st_size in entries
+            ]
+        return [
+            {
+                "st_name": st_name,
+                "st_value": st_value,
+                "st_size": st_size,
+                "st_bind": st_info >> 4,
+                "st_type": st_info & 0x0F,
+                "st_other": st_other,
+                "st_shndx": st_shndx,
+                "symbol_name": names[st_name],
+            }
+            for st_name, st_value, st_size, st_info, st_other, st_shndx in entries
+        ]
 
     def _parse_symbol_section_py(
         self,
@@ -1534,8 +1994,8 @@ class ElfParser:
         strtab_bytes: bytes,
         sh_link: int,
     ) -> list[dict]:
-        """Pure-Python fallback for symbol-table parsing (used when the C++ extension
-        is unavailable).
+        """``construct``-based symbol-table parser, the last-resort fallback and
+        reference implementation for :meth:`_parse_symbol_section_struct`.
 
         Uses the ``construct`` library to parse Elf32_Sym / Elf64_Sym entries and
         resolves symbol names via :meth:`get_string`.
@@ -2292,6 +2752,19 @@ class ElfParser:
         """
         return self._endianess
 
+    @property
+    def session(self) -> typing.Any:
+        """SQLAlchemy session of the fully loaded database.
+
+        Loads all remaining parsing phases, as arbitrary queries may touch any table.
+        Prefer :attr:`sections`, :attr:`symbols` etc., which load only what they need.
+
+        Returns:
+            Session: SQLAlchemy ORM session.
+        """
+        self.load_phases(*self.PHASES)
+        return self._session
+
     @property
     def segments(self) -> list:
         """Program header entries (segments).
@@ -2299,6 +2772,9 @@ class ElfParser:
         Returns:
             list: List of program header entries defining memory segments for loading.
         """
+        self.load_phases("segments")
+        if self._program_headers is None:
+            self._program_headers = self._session.query(model.Elf_ProgramHeaders).order_by(model.Elf_ProgramHeaders.rid).all()
         return self._program_headers
 
     @property
@@ -2308,7 +2784,8 @@ class ElfParser:
         Returns:
             dict: Parsed ARM build attributes from .ARM.attributes section, empty dict if not present or non-ARM.
         """
-        res = self.query(model.Elf_Section).filter(model.Elf_Section.section_name == ".ARM.attributes").first()
+        self.load_phases("sections")
+        res = self._session.query(model.Elf_Section).filter(model.Elf_Section.section_name == ".ARM.attributes").first()
         if res:
             return attributes.parse(res.section_image, byteorder=self.endianess)
         else:
@@ -2321,7 +2798,8 @@ class ElfParser:
         Returns:
             str | None: Text from .comment section if present, None otherwise.
         """
-        comment = self.query(model.Elf_Comment).first()
+        self.load_phases("notes")
+        comment = self._session.query(model.Elf_Comment).first()
         if comment:
             return comment.text
         else:
@@ -2334,7 +2812,8 @@ class ElfParser:
         Returns:
             list: List of ELF note entries containing build metadata, empty list if none present.
         """
-        notes = self.query(model.Elf_Note).order_by(model.Elf_Note.section_name).all()
+        self.load_phases("notes")
+        notes = self._session.query(model.Elf_Note).order_by(model.Elf_Note.section_name).all()
         if notes:
             return notes
         else:
@@ -2420,7 +2899,10 @@ class ElfParser:
         See Also:
             - Look at `scripts/oj_elf_extract.py` for detailed create_image() usage examples.
         """
-        query = self.query(model.Elf_Section)
+        from sqlalchemy import not_
+
+        self.load_phases("sections")
+        query = self._session.query(model.Elf_Section)
         # query = query.filter(
         #    model.Elf_Section.flag_alloc is True,
         #    model.Elf_Section.has_content is True,
@@ -2433,10 +2915,10 @@ class ElfParser:
         # print("SECTIONS", sections)
 
         if include_pattern:
-            query = query.filter(func.regexp(model.Elf_Section.section_name, include_pattern))
+            query = query.filter(model.Elf_Section.section_name.regexp_match(include_pattern))
 
         if exclude_pattern:
-            query = query.filter(not_(func.regexp(model.Elf_Section.section_name, exclude_pattern)))
+            query = query.filter(not_(model.Elf_Section.section_name.regexp_match(exclude_pattern)))
 
         query = query.order_by(model.Elf_Section.sh_addr)
         result = []
@@ -2444,14 +2926,17 @@ class ElfParser:
             callback("start", None)
         for section in query.all():
             if (
-                section.section_image is None
+                not section.has_content
                 or (section.sh_flags & defs.SectionFlags.SHF_ALLOC) != defs.SectionFlags.SHF_ALLOC
                 or section.sh_type in (defs.SectionType.SHT_NOBITS, defs.SectionType.SHT_NULL)
             ):
                 continue
+            image = section._section_image
+            if image is None:  # Offsets only: slice the mapped file, copied once into the Section.
+                image = self.fp[section.sh_offset : section.sh_offset + section.sh_size]
             if callback:
                 callback("section", section)
-            result.append(Section(section.sh_addr, section.section_image))
+            result.append(Section(section.sh_addr, image))
         img = Image(result, join=join)
         if callback:
             callback("stop", None)
@@ -2531,6 +3016,8 @@ def import_dwarf_to_db(
         - Database schema created/validated automatically
         - File locking handled transparently
     """
+    from sqlalchemy.exc import SQLAlchemyError
+
     # Local import to avoid potential circular import at module import time.
     from objutils.dwarf import DwarfProcessor
 
@@ -0,0 +1,587 @@
+#!/usr/bin/env python
+"""SQLAlchemy-free ELF access for ``ElfParser(..., backend="direct")``.
+
+Workflows like ``oj-elf-extract`` or hex conversion in CI only need the ELF
+header, the section table and :meth:`~objutils.elf.ElfParser.create_image`.
+:class:`DirectElfParser` answers these from plain Python objects unpacked with
+:mod:`struct` straight from the memory-mapped file -- no .prgdb file, no
+SQLAlchemy engine or session, and SQLAlchemy is never imported.
+
+Section and symbol objects expose the same attributes as
+:class:`~objutils.elf.model.Elf_Section` and :class:`~objutils.elf.model.Elf_Symbol`
+(``section_name``, ``sh_*``, ``section_image``, ``symbol_name``, ``st_*``,
+flag properties), so code written against the SQLite backend keeps working as
+long as it sticks to :attr:`sections`, :attr:`symbols`, :attr:`segments` and
+:meth:`create_image` instead of raw session queries.
+
+Example::
+
+    from objutils.elf import ElfParser
+
+    parser = ElfParser("firmware.elf", backend="direct")
+    text = parser.sections.get(".text")
+    image = parser.create_image(exclude_pattern=r"^\\.debug")
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+   objutils - Object file library for Python.
+
+  (C) 2010-2025 by Christoph Schueler <cpu12.gems@googlemail.com>
+
+  All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import re
+import struct
+import typing
+from collections import OrderedDict, namedtuple
+from itertools import groupby
+from pathlib import Path
+from types import SimpleNamespace
+
+from construct import CString
+
+from objutils import Image, Section
+from objutils.elf import ElfParser, defs, filter_symbols, tables
+from objutils.elf.arm import attributes
+from objutils.utils import create_memorymapped_fileview
+
+# ELF header layout after e_ident, indexed by ELF class (False: ELFCLASS32, True: ELFCLASS64).
+EHDR_FORMAT = {False: "HHIIIIIHHHHHH", True: "HHIQQQIHHHHHH"}
+
+
+ProgramHeader = namedtuple("ProgramHeader", "p_type p_offset p_vaddr p_paddr p_filesz p_memsz p_flags p_align")
+Note = namedtuple("Note", "section_name type name desc")
+
+
+def _section_flag(mask: int) -> property:
+    return property(lambda self: self.test_flags(mask), doc=f"True if {defs.SectionFlags(mask).name} is set.")
+
+
+class DirectSection:
+    """Section header read from the mapped ELF file (mirrors :class:`model.Elf_Section`)."""
+
+    __slots__ = (
+        "_view",
+        "index",
+        "section_name",
+        "sh_name",
+        "sh_type",
+        "sh_flags",
+        "sh_addr",
+        "sh_offset",
+        "sh_size",
+        "sh_link",
+        "sh_info",
+        "sh_addralign",
+        "sh_entsize",
+    )
+
+    def __init__(self, view: memoryview, index: int, fields: tuple[int, ...]) -> None:
+        self._view = view
+        self.index = index
+        self.section_name = ""
+        (
+            self.sh_name,
+            self.sh_type,
+            self.sh_flags,
+            self.sh_addr,
+            self.sh_offset,
+            self.sh_size,
+            self.sh_link,
+            self.sh_info,
+            self.sh_addralign,
+            self.sh_entsize,
+        ) = fields
+
+    def __repr__(self) -> str:
+        return (
+            f"DirectSection(index = {self.index}, section_name = {self.section_name!r}, sh_type = {self.sh_type}, "
+            f"sh_flags = {self.sh_flags}, sh_addr = {self.sh_addr}, sh_offset = {self.sh_offset}, sh_size = {self.sh_size})"
+        )
+
+    @property
+    def view(self) -> memoryview | None:
+        """Zero-copy view of the section contents, None for sections without content."""
+        if not self.has_content:
+            return None
+        return self._view[self.sh_offset : self.sh_offset + self.sh_size]
+
+    @property
+    def section_image(self) -> bytes | None:
+        """Section contents, None for sections without content."""
+        view = self.view
+        return None if view is None else view.tobytes()
+
+    @property
+    def is_debug(self) -> bool:
+        return self.section_name.startswith(".debug")
+
+    @property
+    def is_dwo(self) -> bool:
+        return self.section_name.startswith(".dwo")
+
+    @property
+    def has_content(self) -> bool:
+        return self.sh_type not in (defs.SectionType.SHT_NOBITS, defs.SectionType.SHT_NULL) and self.sh_size > 0
+
+    @property
+    def progbits(self) -> bool:
+        return self.sh_type == defs.SectionType.SHT_PROGBITS
+
+    def get_flags(self) -> int:
+        return self.sh_flags
+
+    def test_flags(self, mask: int) -> bool:
+        return self.sh_flags & mask == mask
+
+    @property
+    def section_type(self) -> defs.SectionType:
+        return defs.SectionType(self.sh_type)
+
+    @property
+    def section_display_name(self) -> str:
+        if self.sh_type > defs.SectionType.SHT_LOUSER:
+            return f"SHT_LOUSER + 0x{self.sh_type - defs.SectionType.SHT_LOUSER:08x}"
+        if self.sh_type > defs.SectionType.SHT_LOPROC:
+            return f"SHT_LOPROC + 0x{self.sh_type - defs.SectionType.SHT_LOPROC:08x}"
+        return defs.SectionType(self.sh_type).name
+
+    flag_writeable = _section_flag(defs.SectionFlags.SHF_WRITE)
+    flag_executable = _section_flag(defs.SectionFlags.SHF_EXECINSTR)
+    flag_alloc = _section_flag(defs.SectionFlags.SHF_ALLOC)
+    flag_merge = _section_flag(defs.SectionFlags.SHF_MERGE)
+    flag_strings = _section_flag(defs.SectionFlags.SHF_STRINGS)
+    flag_info_link = _section_flag(defs.SectionFlags.SHF_INFO_LINK)
+    flag_link_order = _section_flag(defs.SectionFlags.SHF_LINK_ORDER)
+    flag_os_nonconforming = _section_flag(defs.SectionFlags.SHF_OS_NONCONFORMING)
+    flag_group = _section_flag(defs.SectionFlags.SHF_GROUP)
+    flag_tls = _section_flag(defs.SectionFlags.SHF_TLS)
+    flag_ordered = _section_flag(defs.SectionFlags.SHF_ORDERED)
+    flag_exclude = _section_flag(defs.SectionFlags.SHF_EXCLUDE)
+
+
+class DirectSymbol:
+    """Symbol table entry (mirrors :class:`model.Elf_Symbol`)."""
+
+    __slots__ = (
+        "st_name",
+        "st_value",
+        "st_size",
+        "st_bind",
+        "st_type",
+        "st_other",
+        "st_shndx",
+        "symbol_name",
+        "section_name",
+        "access",
+    )
+
+    def __init__(
+        self,
+        st_name: int,
+        st_value: int,
+        st_size: int,
+        st_info: int,
+        st_other: int,
+        st_shndx: int,
+        symbol_name: str,
+        section_name: str,
+        access: int,
+    ) -> None:
+        self.st_name = st_name
+        self.st_value = st_value
+        self.st_size = st_size
+        self.st_bind = st_info >> 4
+        self.st_type = st_info & 0x0F
+        self.st_other = st_other
+        self.st_shndx = st_shndx
+        self.symbol_name = symbol_name
+        self.section_name = section_name
+        self.access = access
+
+    def __repr__(self) -> str:
+        return (
+            f"DirectSymbol(symbol_name = {self.symbol_name!r}, st_value = {self.st_value}, st_size = {self.st_size}, "
+            f"st_bind = {self.st_bind}, st_type = {self.st_type}, section_name = {self.section_name!r})"
+        )
+
+    @property
+    def hidden(self) -> bool:
+        return self.st_other in (defs.SymbolVisibility.STV_HIDDEN, defs.SymbolVisibility.STV_INTERNAL)
+
+    @property
+    def weak(self) -> bool:
+        return self.st_bind == defs.SymbolBinding.STB_WEAK
+
+    @property
+    def absolute(self) -> bool:
+        return self.st_shndx == defs.SectionName.SHN_ABS
+
+    @property
+    def undefined(self) -> bool:
+        return self.st_shndx == defs.SectionName.SHN_UNDEF
+
+    @property
+    def local(self) -> bool:
+        return self.st_bind == defs.SymbolBinding.STB_LOCAL
+
+    @property
+    def global_(self) -> bool:
+        return self.st_bind == defs.SymbolBinding.STB_GLOBAL
+
+    def get_access(self) -> int:
+        return self.access
+
+    def test_access(self, mask: int) -> bool:
+        return self.access & mask == mask
+
+    @property
+    def writeable(self) -> bool:
+        return self.test_access(defs.SectionFlags.SHF_WRITE)
+
+    @property
+    def executeable(self) -> bool:
+        return self.test_access(defs.SectionFlags.SHF_EXECINSTR)
+
+    @property
+    def allocate(self) -> bool:
+        return self.test_access(defs.SectionFlags.SHF_ALLOC)
+
+    @property
+    def symbol_bind(self) -> defs.SymbolBinding:
+        return defs.SymbolBinding(self.st_bind)
+
+    @property
+    def symbol_type(self) -> defs.SymbolType:
+        return defs.SymbolType(self.st_type)
+
+
+def _split(value: str) -> list[str]:
+    return [v.lower() for v in re.split(r"[ ,]", value) if v]
+
+
+class DirectSectionAPI:
+    """:class:`~objutils.elf.SectionAPI` counterpart working on :class:`DirectSection` objects."""
+
+    def __init__(self, parent: DirectElfParser) -> None:
+        self._parent = parent
+
+    def get(self, section_name: str) -> DirectSection | None:
+        """Get a single section by exact name."""
+        return self._parent._section_table()[1].get(section_name)
+
+    def fetch(
+        self,
+        sections: str | None = None,
+        name_pattern: str | None = None,
+        order_by_address: bool = True,
+    ) -> list[DirectSection]:
+        """Fetch sections with optional filtering and sorting (see :meth:`objutils.elf.SectionAPI.fetch`)."""
+        result = self._parent._section_table()[0]
+        if sections:
+            names = frozenset(v for v in re.split(r"[ ,]", sections) if v)
+            result = [s for s in result if s.section_name in names]
+        if order_by_address:
+            result = sorted(result, key=lambda s: s.sh_addr)
+        else:
+            result = sorted(result, key=lambda s: s.section_name)
+        if name_pattern:
+            result = [s for s in result if re.search(name_pattern, s.section_name)]
+        return result
+
+
+class DirectSymbolAPI:
+    """:class:`~objutils.elf.SymbolAPI` counterpart working on :class:`DirectSymbol` objects."""
+
+    BINDINGS: dict[str, int] = {
+        "g": defs.SymbolBinding.STB_GLOBAL,
+        "l": defs.SymbolBinding.STB_LOCAL,
+        "w": defs.SymbolBinding.STB_WEAK,
+    }
+    ACCESS: dict[str, int] = {
+        "a": defs.SectionFlags.SHF_ALLOC,
+        "w": defs.SectionFlags.SHF_WRITE,
+        "x": defs.SectionFlags.SHF_EXECINSTR,
+    }
+    TYPES: dict[str, int] = {
+        "notype": defs.SymbolType.STT_NOTYPE,
+        "object": defs.SymbolType.STT_OBJECT,
+        "func": defs.SymbolType.STT_FUNC,
+        "section": defs.SymbolType.STT_SECTION,
+        "file": defs.SymbolType.STT_FILE,
+        "common": defs.SymbolType.STT_COMMON,
+        "tls": defs.SymbolType.STT_TLS,
+    }
+
+    def __init__(self, parent: DirectElfParser) -> None:
+        self._parent = parent
+
+    def get(self, symbol_name: str, section_name: str | None = None) -> DirectSymbol | None:
+        """Get a single symbol by name and optionally section."""
+        for symbol in self._parent._symbol_table():
+            if symbol.symbol_name == symbol_name and (not section_name or symbol.section_name == section_name):
+                return symbol
+        return None
+
+    def fetch(
+        self,
+        sections: str | None = None,
+        name_pattern: str | None = None,
+        symbol_list: list[str] | None = None,
+        bindings: str | None = None,
+        access: str | None = None,
+        types_str: str | None = None,
+        order_by_value: bool = True,
+        group_by_section: bool = True,
+    ) -> OrderedDict[str, list[DirectSymbol]] | list[DirectSymbol]:
+        """Fetch symbols with filtering and grouping options (see :meth:`objutils.elf.SymbolAPI.fetch`)."""
+        result = self._parent._symbol_table()
+        if sections:
+            names = frozenset(v for v in re.split(r"[ ,]", sections) if v)
+            result = [s for s in result if s.section_name in names]
+        if access:
+            mask = 0
+            for item in _split(access):
+                mask |= self.ACCESS.get(item, 0)
+            result = [s for s in result if s.access & mask]
+        if bindings:
+            wanted = {self.BINDINGS[item] for item in _split(bindings) if item in self.BINDINGS}
+            result = [s for s in result if s.st_bind in wanted]
+        if types_str:
+            wanted = {self.TYPES[item] for item in _split(types_str) if item in self.TYPES}
+            result = [s for s in result if s.st_type in wanted]
+        if symbol_list:
+            names = frozenset(symbol_list)
+            result = [s for s in result if s.symbol_name in names]
+        if order_by_value:
+            result = sorted(result, key=lambda s: (s.section_name, s.st_value))
+        else:
+            result = sorted(result, key=lambda s: (s.section_name, s.symbol_name))
+        if not group_by_section:
+            return filter_symbols(result, name_pattern)
+        grouped: OrderedDict[str, list[DirectSymbol]] = OrderedDict()
+        for key, values in groupby(result, lambda s: s.section_name):
+            symbols = filter_symbols(list(values), name_pattern)
+            if symbols:
+                grouped[key] = symbols
+        return grouped
+
+    def fetch_gcc_special_symbols(self) -> list[DirectSymbol]:
+        """Fetch GCC special symbols (absolute, untyped symbols with an underscore in their name)."""
+        result = [
+            s
+            for s in self._parent._symbol_table()
+            if s.st_shndx == defs.SectionName.SHN_ABS
+            and s.symbol_name
+            and "_" in s.symbol_name
+            and s.st_type == defs.SymbolType.STT_NOTYPE
+        ]
+        return sorted(result, key=lambda s: s.st_value)
+
+
+class DirectElfParser(ElfParser):
+    """:class:`~objutils.elf.ElfParser` answering queries straight from the mapped file.
+
+    Created by ``ElfParser(filename, backend="direct")``. Header properties,
+    :attr:`sections`, :attr:`symbols`, :attr:`segments`, :attr:`comment`,
+    :attr:`notes`, :attr:`arm_attributes`, :meth:`debug_sections` and
+    :meth:`create_image` behave like their SQLite counterparts; everything is
+    parsed on first use and kept in memory. There is no database, so
+    :attr:`session`, :attr:`query` and DWARF import are not available.
+    """
+
+    def __init__(self, filename: str, *args: typing.Any, backend: str = "direct", **kws: typing.Any) -> None:
+        self.fp = create_memorymapped_fileview(filename)
+        self.filename = Path(filename)
+        self.db_name = None
+        self._images: dict[int, bytes | None] = {}
+        self._sections: tuple[list[DirectSection], dict[str, DirectSection]] | None = None
+        self._symbols: list[DirectSymbol] | None = None
+        self._program_headers: list[ProgramHeader] | None = None
+        self._notes: tuple[str | None, list[Note]] | None = None
+        self.asciiCString = CString(encoding="ascii")
+        self._load_header()
+        self.symbols: DirectSymbolAPI = DirectSymbolAPI(self)
+        self.sections: DirectSectionAPI = DirectSectionAPI(self)
+        md_class = defs.MACHINE_DATA.get(self.e_machine, defs.MachineData)
+        self._machine_data: defs.MachineData = md_class(self.e_machine, self.e_flags)
+
+    def _load_header(self) -> None:
+        fields = ElfParser.BasicHeader.parse(self.fp).header.fields
+        self.set_data_types(fields)
+        names = (
+            "e_type e_machine e_version e_entry e_phoff e_shoff e_flags e_ehsize e_phentsize e_phnum e_shentsize e_shnum e_shstrndx"
+        ).split()
+        values = struct.unpack_from(self._endianess + EHDR_FORMAT[self.b64], self.fp, self.EI_NIDENT)
+        self._header = SimpleNamespace(
+            ei_class=fields.ei_class,
+            ei_data=fields.ei_data,
+            ei_version=fields.ei_version,
+            ei_osabi=fields.ei_osabi,
+            ei_abiversion=fields.ei_abiversion,
+            **dict(zip(names, values)),
+        )
+
+    def _table(self, kind: str, offset: int, entsize: int, count: int) -> list[tuple[int, ...]]:
+        """Unpack `count` entries of an ELF header table (see :func:`tables.iter_table`)."""
+        if count == 0:
+            return []
+        return list(tables.iter_table(self.fp, kind, self.b64, self._endianess, offset, count, entsize))
+
+    def _section_table(self) -> tuple[list[DirectSection], dict[str, DirectSection]]:
+        if self._sections is None:
+            rows = self._table("shdr", self.e_shoff, self.e_shentsize, self.e_shnum)
+            sections = [DirectSection(self.fp, idx, fields) for idx, fields in enumerate(rows)]
+            shstrtab = sections[self.e_shstrndx].section_image if self.e_shstrndx < len(sections) else None
+            by_name: dict[str, DirectSection] = {}
+            for section in sections:
+                section.section_name = tables.cstring(shstrtab or b"", section.sh_name)
+                by_name.setdefault(section.section_name, section)
+            self._sections = (sections, by_name)
+        return self._sections
+
+    def _section_bytes(self, index: int) -> bytes | None:
+        if index not in self._images:
+            sections = self._section_table()[0]
+            self._images[index] = sections[index].section_image if index < len(sections) else None
+        return self._images[index]
+
+    def _symbol_table(self) -> list[DirectSymbol]:
+        if self._symbols is None:
+            sections = self._section_table()[0]
+            symbols = []
+            for symtab in sections:
+                if symtab.sh_type not in (defs.SectionType.SHT_SYMTAB, defs.SectionType.SHT_DYNSYM):
+                    continue
+                data = self._section_bytes(symtab.index) or b""
+                strtab = self._section_bytes(symtab.sh_link) or b""
+                for entry in tables.iter_table(data, "sym", self.b64, self._endianess):
+                    if self.b64:
+                        st_name, st_info, st_other, st_shndx, st_value, st_size = entry
+                    else:
+                        st_name, st_value, st_size, st_info, st_other, st_shndx = entry
+                    name = tables.cstring(strtab, st_name)
+                    if st_shndx in defs.SpecialSections:
+                        section_name, access = defs.special_section_name(st_shndx), 0
+                    elif st_shndx < len(sections):
+                        section_name, access = sections[st_shndx].section_name, sections[st_shndx].sh_flags
+                    else:
+                        section_name, access = str(st_shndx), 0
+                    symbols.append(
+                        DirectSymbol(st_name, st_value, st_size, st_info, st_other, st_shndx, name, section_name, access)
+                    )
+            self._symbols = symbols
+        return self._symbols
+
+    def load_phases(self, *phases: str) -> None:
+        """No-op: everything is parsed on first access."""
+
+    @property
+    def session(self) -> typing.Any:
+        raise AttributeError("ElfParser(backend='direct') has no database session.")
+
+    @property
+    def query(self) -> typing.Any:
+        raise AttributeError("ElfParser(backend='direct') has no database session.")
+
+    @property
+    def segments(self) -> list[ProgramHeader]:
+        """Program header entries (segments)."""
+        if self._program_headers is None:
+            rows = self._table("phdr", self.e_phoff, self.e_phentsize, self.e_phnum)
+            if self.b64:  # p_flags follows p_type.
+                rows = [(r[0], r[2], r[3], r[4], r[5], r[6], r[1], r[7]) for r in rows]
+            self._program_headers = [ProgramHeader(*row) for row in rows]
+            self.create_section_to_segment_mapping()
+        return self._program_headers
+
+    def _note_table(self) -> tuple[str | None, list[Note]]:
+        if self._notes is None:
+            comment = None
+            notes = []
+            for section in self._section_table()[0]:
+                if section.sh_type == defs.SectionType.SHT_NOTE:
+                    note = self._parse_note(section.section_image)
+                    if note:
+                        notes.append(Note(section.section_name, note.type, note.name, note.desc))
+                elif section.section_name == ".comment" and comment is None:
+                    comment = self._parse_comment(section.section_image) or None
+            self._notes = (comment, sorted(notes, key=lambda n: n.section_name))
+        return self._notes
+
+    @property
+    def comment(self) -> str | None:
+        """Comment section content."""
+        return self._note_table()[0]
+
+    @property
+    def notes(self) -> list[Note]:
+        """ELF note sections."""
+        return self._note_table()[1]
+
+    @property
+    def arm_attributes(self) -> dict:
+        """ARM architecture build attributes."""
+        section = self.sections.get(".ARM.attributes")
+        if section is None:
+            return {}
+        return attributes.parse(section.section_image, byteorder=self.endianess)
+
+    def create_image(
+        self,
+        join: bool = True,
+        include_pattern: str = "",
+        exclude_pattern: str = "",
+        callback: typing.Callable[[str, typing.Any], None] | None = None,
+    ) -> Image:
+        """Create an :class:`~objutils.Image` from allocatable sections (see :meth:`ElfParser.create_image`).
+
+        Section data is sliced from the mapped file and copied once into each :class:`~objutils.Section`.
+        """
+        include = re.compile(include_pattern) if include_pattern else None
+        exclude = re.compile(exclude_pattern) if exclude_pattern else None
+        result = []
+        if callback:
+            callback("start", None)
+        for section in self.sections.fetch(order_by_address=True):
+            if not section.has_content or not section.flag_alloc:
+                continue
+            if include and not include.search(section.section_name):
+                continue
+            if exclude and exclude.search(section.section_name):
+                continue
+            if callback:
+                callback("section", section)
+            result.append(Section(section.sh_addr, section.view))
+        img = Image(result, join=join)
+        if callback:
+            callback("stop", None)
+        return img
+
+    def close(self) -> None:
+        """Release the file mapping."""
+        self._images.clear()
+        self._sections = None
+        fp = getattr(self, "fp", None)
+        if fp is not None:
+            try:
+                fp.release()
+            except BufferError:
+                pass
@@ -22,7 +22,8 @@ The ORM creates tables for the following ELF structures:
 
 - **Elf_Section**: Section headers with content and computed properties
   - Stores sh_* fields: sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, etc.
-  - Stores section_name and section_image (content)
+  - Stores section_name and section_image (content); with ``store_images=False``
+    only offsets are stored and section_image is served from the mapped ELF file
   - Provides flag checking: is_debug, is_dwo, has_content, flag_writeable, flag_executable, etc.
   - Hybrid properties enable both Python and SQL filtering
 
@@ -123,13 +124,14 @@ __copyright__ = """
 import mmap
 import re
 import sqlite3
+from pathlib import Path
 from typing import Any, Optional
 
 from sqlalchemy import Column, ForeignKey, and_, create_engine, event, not_, orm, text, types
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
-from sqlalchemy.orm import Session, declarative_base, relationship
+from sqlalchemy.orm import Session, declarative_base, object_session, relationship
 from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.sql import func
 
@@ -142,6 +144,10 @@ SQLITE_TIMEOUT_MS = SQLITE_TIMEOUT_SECONDS * 1000
 
 DB_EXTENSION = ".prgdb"
 
+# Key in ``Session.info`` holding the ELF file view (or a callable producing it)
+# used to serve section images that are not stored in the database.
+IMAGE_SOURCE_KEY = "elf_image_source"
+
 Base = declarative_base()
 
 
@@ -309,10 +315,18 @@ class Meta(Base, RidMixIn):
 
     Attributes:
         hash_value: Hash of ELF file or metadata (VARCHAR)
+        validation_key: Cheap cache-validation key, "size:mtime_ns:inode:sample" (VARCHAR)
+        image_file: ELF file serving the section images, relative to the database
+            (VARCHAR); NULL if images are stored as BLOBs
+        phases: Comma-separated parsing phases already loaded (VARCHAR); NULL for
+            databases built before phases were tracked, which are complete
         ts_created: Timestamp when database was created (DateTime with timezone)
     """
 
     hash_value = Column(types.VARCHAR)
+    validation_key = Column(types.VARCHAR)
+    image_file = Column(types.VARCHAR)
+    phases = Column(types.VARCHAR)
     ts_created = Column(types.DateTime(timezone=True), server_default=func.now())
 
 
@@ -461,7 +475,8 @@ class Elf_Section(Base, RidMixIn):
         sh_addralign (int): Section alignment requirement
         sh_entsize (int): Size of entry in section (for tables)
         section_name (str): Resolved section name (indexed for fast lookup)
-        section_image (bytes): Raw section content
+        section_image (bytes): Raw section content, either stored as BLOB or read
+            from the ELF file at ``sh_offset`` (see :data:`IMAGE_SOURCE_KEY`)
     """
 
     index = Column(types.Integer, unique=True)
@@ -477,7 +492,41 @@ class Elf_Section(Base, RidMixIn):
     sh_entsize = StdBigInt()
 
     section_name = Column(types.VARCHAR, index=True)
-    section_image = Column(types.BLOB)
+    _section_image = Column("section_image", types.BLOB)
+
+    @hybrid_property
+    def section_image(self) -> bytes | None:
+        """Section content.
+
+        Returns:
+            bytes | None: Stored BLOB or, if the database holds offsets only, the
+            bytes at ``sh_offset`` of the ELF file; None for sections without content
+        """
+        if self._section_image is not None or not self.has_content:
+            return self._section_image
+        view = self.file_view()
+        if view is None:
+            return None
+        return bytes(view[self.sh_offset : self.sh_offset + self.sh_size])
+
+    @section_image.setter
+    def section_image(self, value: bytes | None) -> None:
+        self._section_image = value
+
+    @section_image.expression
+    def section_image(cls) -> Any:
+        """SQL expression for the stored BLOB (NULL if images are not stored)."""
+        return cls._section_image
+
+    def file_view(self) -> memoryview | None:
+        """Return the ELF file view backing this section, if images are served from it."""
+        session = object_session(self)
+        if session is None:
+            return None
+        source = session.info.get(IMAGE_SOURCE_KEY)
+        if callable(source):
+            source = session.info[IMAGE_SOURCE_KEY] = source()
+        return source
 
     @hybrid_property
     def is_debug(self) -> bool:
@@ -1247,17 +1296,20 @@ def set_sqlite3_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
         - FOREIGN_KEYS: Enable referential integrity constraints
         - PAGE_SIZE: Match system page size for efficient I/O
         - CACHE_SIZE: Tune memory usage
-        - SYNCHRONOUS: Disable disk sync for speed (assumes reliable filesystem)
+        - JOURNAL_MODE=WAL: Readers don't block (and aren't blocked by) a process
+          loading further parsing phases into a shared .prgdb
+        - SYNCHRONOUS=NORMAL: No fsync per commit, safe in WAL mode (a crash may
+          lose the last transactions, but never corrupts the database)
         - busy_timeout + LOCKING_MODE=NORMAL: Avoid stale exclusive locks and wait for contention
         - TEMP_STORE: Keep temporary data in memory
     """
     dbapi_connection.create_function("REGEXP", 2, regexer)
     cursor = dbapi_connection.cursor()
-    # cursor.execute("PRAGMA jornal_mode=WAL")
     cursor.execute("PRAGMA FOREIGN_KEYS=ON")
     cursor.execute(f"PRAGMA PAGE_SIZE={PAGE_SIZE}")
+    cursor.execute("PRAGMA JOURNAL_MODE=WAL")  # After PAGE_SIZE, which can't change in WAL mode.
     cursor.execute(f"PRAGMA CACHE_SIZE={calculateCacheSize(CACHE_SIZE * 1024 * 1024)}")
-    cursor.execute("PRAGMA SYNCHRONOUS=OFF")  # FULL
+    cursor.execute("PRAGMA SYNCHRONOUS=NORMAL")
     cursor.execute(f"PRAGMA busy_timeout={SQLITE_TIMEOUT_MS}")
     cursor.execute("PRAGMA LOCKING_MODE=NORMAL")
     cursor.execute("PRAGMA TEMP_STORE=MEMORY")  # FILE
@@ -1300,6 +1352,7 @@ class Model:
                      File extension .prgdb is optional
             debug: Enable SQLAlchemy echo for SQL debugging (default: False)
         """
+        self._image_view: memoryview | None = None
         if filename == ":memory:" or not filename:
             self.dbname = ":memory:"
         else:
@@ -1338,6 +1391,35 @@ class Model:
         self._ensure_schema()
         self.session.flush()
         self.session.commit()
+        self.session.info[IMAGE_SOURCE_KEY] = self._open_image_file
+
+    def _open_image_file(self) -> memoryview | None:
+        """Map the ELF file recorded in :class:`Meta` to serve section images.
+
+        Used when the database was built with ``store_images=False`` and is opened
+        without an :class:`~objutils.elf.ElfParser` (e.g. via ``open_program_database``).
+
+        Raises:
+            ValueError: If the ELF file no longer matches the database.
+        """
+        from objutils.elf import _same_sampled_content, calculate_validation_key
+        from objutils.utils import create_memorymapped_fileview
+
+        if self.dbname == ":memory:":
+            return None
+        meta = self.session.query(Meta).first()
+        if meta is None or not meta.image_file:
+            return None
+        path = Path(self.dbname).parent / meta.image_file
+        try:
+            view = create_memorymapped_fileview(path)
+        except OSError:
+            return None
+        if not meta.validation_key or not _same_sampled_content(meta.validation_key, calculate_validation_key(view, path)):
+            view.release()
+            raise ValueError(f"{str(path)!r} has changed since {str(self.dbname)!r} was built.")
+        self._image_view = view
+        return view
 
     def _ensure_schema(self) -> None:
         """Ensure required columns and indexes exist for older databases.
@@ -1366,8 +1448,18 @@ class Model:
                 dia_cols = {c["name"] for c in inspector.get_columns("dieattribute")}
             except SQLAlchemyError:
                 dia_cols = set()
+            try:
+                meta_cols = {c["name"] for c in inspector.get_columns("meta")}
+            except SQLAlchemyError:
+                meta_cols = set()
             with self.engine.begin() as conn:
                 # --- Columns ---
+                if meta_cols and "validation_key" not in meta_cols:
+                    conn.execute(text("ALTER TABLE meta ADD COLUMN validation_key VARCHAR"))
+                if meta_cols and "image_file" not in meta_cols:
+                    conn.execute(text("ALTER TABLE meta ADD COLUMN image_file VARCHAR"))
+                if meta_cols and "phases" not in meta_cols:
+                    conn.execute(text("ALTER TABLE meta ADD COLUMN phases VARCHAR"))
                 if "offset" not in die_cols:
                     conn.execute(text('ALTER TABLE debuginformationentry ADD COLUMN "offset" INTEGER'))
                 if "parent_id" not in die_cols:
@@ -1414,6 +1506,13 @@ class Model:
         Closes the SQLAlchemy session and disposes of the engine, releasing
         all database connections and resources.
         """
+        self.session.info.pop(IMAGE_SOURCE_KEY, None)
+        if self._image_view is not None:  # Only the mapping opened by _open_image_file(), not a parser's.
+            try:
+                self._image_view.release()
+            except BufferError:
+                pass
+            self._image_view = None
         self.session.close()
         self._engine.dispose()
 
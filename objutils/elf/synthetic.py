@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+"""Synthetic ELF files for tests and benchmarks.
+
+:func:`make_elf` writes a small, valid ELF64 little-endian relocatable with
+any number of ``.text.N`` sections and ``STT_FUNC`` symbols. It is used by the
+symbol-import tests and ``examples/symbol_import.py``, where real objects of
+that size would be impractical to ship.
+
+Example::
+
+    from pathlib import Path
+    from objutils.elf import ElfParser
+    from objutils.elf.synthetic import make_elf
+
+    make_elf(Path("big.elf"), num_sections=5000, num_symbols=500_000)
+    parser = ElfParser("big.elf")
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+   objutils - Object file library for Python.
+
+  (C) 2010-2025 by Christoph Schueler <cpu12.gems@googlemail.com>
+
+  All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import random
+import struct
+from pathlib import Path
+
+from objutils.elf import defs
+
+
+def make_elf(path: Path, num_sections: int, num_symbols: int, seed: int = 0, dynsym: bool = False) -> list[tuple[str, int, int]]:
+    """Write a minimal ELF64 LE relocatable with `num_sections` ``.text.N`` sections and a symbol table.
+
+    With `dynsym`, the same symbols are also written to a ``.dynsym`` table.
+
+    Returns:
+        list of ``(symbol_name, st_value, st_shndx)`` in symbol-table order (without the null symbol).
+    """
+    rng = random.Random(seed)
+    shstrtab = bytearray(b"\x00")
+
+    def section_name(name):
+        shstrtab.extend(name.encode() + b"\x00")
+        return len(shstrtab) - len(name) - 1
+
+    # (sh_name, sh_type, sh_flags, data, sh_link, sh_info, sh_addralign, sh_entsize)
+    sections = [(0, 0, 0, b"", 0, 0, 0, 0)]
+    for idx in range(num_sections):
+        sections.append((section_name(f".text.f{idx}"), defs.SectionType.SHT_PROGBITS, 6, b"\x90" * 16, 0, 0, 16, 0))
+    strtab = bytearray(b"\x00")
+    entries = [bytes(24)]
+    symbols = []
+    for idx in range(num_symbols):
+        name = f"function_{idx}_{rng.randrange(1 << 20):x}"
+        shndx = 1 + rng.randrange(num_sections) if idx % 10 else defs.SectionName.SHN_ABS
+        value = rng.randrange(16)
+        entries.append(struct.pack("<IBBHQQ", len(strtab), 0x12, 0, shndx, value, 16))
+        strtab.extend(name.encode() + b"\x00")
+        symbols.append((name, value, shndx))
+    strtab_index = len(sections) + (2 if dynsym else 1)
+    sections.append((section_name(".symtab"), defs.SectionType.SHT_SYMTAB, 0, b"".join(entries), strtab_index, 1, 8, 24))
+    if dynsym:
+        sections.append((section_name(".dynsym"), defs.SectionType.SHT_DYNSYM, 2, b"".join(entries), strtab_index, 1, 8, 24))
+    sections.append((section_name(".strtab"), defs.SectionType.SHT_STRTAB, 0, bytes(strtab), 0, 0, 1, 0))
+    shstrndx = len(sections)
+    sections.append((section_name(".shstrtab"), defs.SectionType.SHT_STRTAB, 0, None, 0, 0, 1, 0))
+
+    body = bytearray(64)
+    headers = []
+    for sh_name, sh_type, sh_flags, data, sh_link, sh_info, sh_addralign, sh_entsize in sections:
+        data = bytes(shstrtab) if data is None else data
+        offset = len(body) if data else 0
+        body.extend(data)
+        headers.append(
+            struct.pack("<IIQQQQIIQQ", sh_name, sh_type, sh_flags, 0, offset, len(data), sh_link, sh_info, sh_addralign, sh_entsize)
+        )
+    body.extend(bytes(-len(body) % 8))
+    e_shoff = len(body)
+    body.extend(b"".join(headers))
+    ident = b"\x7fELF" + bytes([2, 1, 1, 0]) + bytes(8)
+    body[:64] = ident + struct.pack("<HHIQQQIHHHHHH", 1, 62, 1, 0, 0, e_shoff, 0, 64, 0, 0, 64, len(sections), shstrndx)
+    path.write_bytes(bytes(body))
+    return symbols
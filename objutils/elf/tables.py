@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+"""Fast unpacking of fixed-size ELF tables (section headers, program headers, symbols).
+
+``construct`` builds a ``Container`` per entry, which gets slow for objects
+with tens of thousands of sections (``-ffunction-sections`` builds) or
+symbols. This module describes the Elf32/Elf64 ``Shdr``, ``Phdr`` and ``Sym``
+layouts once and unpacks whole tables in one go:
+
+- :func:`iter_table` / :func:`read_columns` use :func:`struct.iter_unpack`
+  and return plain Python ints, row- or column-wise.
+- :func:`table_dtype` / :func:`read_array` give the same layouts as NumPy
+  structured dtypes for callers that want columnar ``ndarray``\\ s (NumPy is
+  imported on first use only).
+- :func:`symbol_columns` returns a whole symbol table as NumPy columns plus
+  one names blob (via the C++ extension when it is built).
+- :class:`StringTable` resolves string-table offsets (symbol names) without
+  scanning for the terminating NUL on every lookup.
+
+The ``construct`` definitions in :class:`~objutils.elf.ElfParser` remain the
+reference implementation; the test-suite checks both against each other.
+
+Example::
+
+    from objutils.elf import tables
+
+    columns = tables.read_columns(data, "shdr", b64=True, endianess="<", offset=e_shoff, count=e_shnum)
+    columns["sh_type"]  # -> (0, 1, 1, 8, ...)
+"""
+
+from __future__ import annotations
+
+__copyright__ = """
+   objutils - Object file library for Python.
+
+  (C) 2010-2025 by Christoph Schueler <cpu12.gems@googlemail.com>
+
+  All Rights Reserved
+
+  This program is free software; you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation; either version 2 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License along
+  with this program; if not, write to the Free Software Foundation, Inc.,
+  51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
+"""
+
+import struct
+import typing
+from functools import lru_cache
+
+SHDR_FIELDS = (
+    "sh_name",
+    "sh_type",
+    "sh_flags",
+    "sh_addr",
+    "sh_offset",
+    "sh_size",
+    "sh_link",
+    "sh_info",
+    "sh_addralign",
+    "sh_entsize",
+)
+
+# (table kind, ELFCLASS64) -> (field names in file order, struct format without byte order).
+LAYOUTS: dict[tuple[str, bool], tuple[tuple[str, ...], str]] = {
+    ("shdr", False): (SHDR_FIELDS, "IIIIIIIIII"),
+    ("shdr", True): (SHDR_FIELDS, "IIQQQQIIQQ"),
+    ("phdr", False): (("p_type", "p_offset", "p_vaddr", "p_paddr", "p_filesz", "p_memsz", "p_flags", "p_align"), "IIIIIIII"),
+    ("phdr", True): (("p_type", "p_flags", "p_offset", "p_vaddr", "p_paddr", "p_filesz", "p_memsz", "p_align"), "IIQQQQQQ"),
+    ("sym", False): (("st_name", "st_value", "st_size", "st_info", "st_other", "st_shndx"), "IIIBBH"),
+    ("sym", True): (("st_name", "st_info", "st_other", "st_shndx", "st_value", "st_size"), "IBBHQQ"),
+}
+
+_NUMPY_CODES = {"B": "u1", "H": "u2", "I": "u4", "Q": "u8"}
+
+
+def field_names(kind: str, b64: bool) -> tuple[str, ...]:
+    """Field names of a table entry, in file order (the order of the unpacked tuples)."""
+    return LAYOUTS[(kind, b64)][0]
+
+
+@lru_cache(maxsize=None)
+def table_struct(kind: str, b64: bool, endianess: str, entsize: int = 0) -> struct.Struct:
+    """:class:`struct.Struct` for one table entry.
+
+    Args:
+        kind: ``"shdr"``, ``"phdr"`` or ``"sym"``.
+        b64: ``True`` for ELFCLASS64.
+        endianess: ``"<"`` or ``">"``.
+        entsize: Entry size from the ELF header / section header. Larger than
+            the natural size means trailing padding, which is skipped. 0 uses
+            the natural size.
+
+    Raises:
+        ValueError: If ``entsize`` is smaller than the natural entry size.
+    """
+    fmt = endianess + LAYOUTS[(kind, b64)][1]
+    natural = struct.calcsize(fmt)
+    if entsize and entsize < natural:
+        raise ValueError(f"Invalid {kind} entry size {entsize}, expected at least {natural}.")
+    if entsize > natural:
+        fmt += f"{entsize - natural}x"
+    return struct.Struct(fmt)
+
+
+def _table_bytes(buffer: typing.Any, layout_size: int, offset: int, count: int | None) -> memoryview:
+    view = memoryview(buffer).cast("B")[offset:]
+    if count is None:
+        count = len(view) // layout_size
+    size = count * layout_size
+    if size > len(view):
+        raise ValueError(f"Table of {count} entries at offset {offset} exceeds the buffer.")
+    return view[:size]
+
+
+def iter_table(
+    buffer: typing.Any,
+    kind: str,
+    b64: bool,
+    endianess: str,
+    offset: int = 0,
+    count: int | None = None,
+    entsize: int = 0,
+) -> typing.Iterator[tuple[int, ...]]:
+    """Unpack table entries as tuples in the order of :func:`field_names`.
+
+    Args:
+        buffer: Object supporting the buffer protocol (``bytes``, mmap view...).
+        kind: ``"shdr"``, ``"phdr"`` or ``"sym"``.
+        b64: ``True`` for ELFCLASS64.
+        endianess: ``"<"`` or ``">"``.
+        offset: File offset of the first entry.
+        count: Number of entries; ``None`` unpacks as many complete entries as fit.
+        entsize: Entry size, see :func:`table_struct`.
+
+    Raises:
+        ValueError: If the table does not fit into ``buffer``.
+    """
+    layout = table_struct(kind, b64, endianess, entsize)
+    return layout.iter_unpack(_table_bytes(buffer, layout.size, offset, count))
+
+
+def read_columns(
+    buffer: typing.Any,
+    kind: str,
+    b64: bool,
+    endianess: str,
+    offset: int = 0,
+    count: int | None = None,
+    entsize: int = 0,
+) -> dict[str, tuple[int, ...]]:
+    """Unpack a table column-wise: ``{field name: tuple of values}``.
+
+    Arguments are the same as for :func:`iter_table`.
+    """
+    names = field_names(kind, b64)
+    rows = list(iter_table(buffer, kind, b64, endianess, offset, count, entsize))
+    if not rows:
+        return {name: () for name in names}
+    return dict(zip(names, zip(*rows)))
+
+
+def table_dtype(kind: str, b64: bool, endianess: str, entsize: int = 0) -> typing.Any:
+    """NumPy structured dtype equivalent to :func:`table_struct`."""
+    import numpy as np
+
+    names, fmt = LAYOUTS[(kind, b64)]
+    formats = [endianess + _NUMPY_CODES[code] for code in fmt]
+    natural = np.dtype({"names": names, "formats": formats})
+    if entsize and entsize < natural.itemsize:
+        raise ValueError(f"Invalid {kind} entry size {entsize}, expected at least {natural.itemsize}.")
+    if entsize > natural.itemsize:
+        offsets = [natural.fields[name][1] for name in names]
+        return np.dtype({"names": names, "formats": formats, "offsets": offsets, "itemsize": entsize})
+    return natural
+
+
+def read_array(
+    buffer: typing.Any,
+    kind: str,
+    b64: bool,
+    endianess: str,
+    offset: int = 0,
+    count: int | None = None,
+    entsize: int = 0,
+) -> typing.Any:
+    """Unpack a table into a NumPy structured array (``array["sh_type"]`` is a column).
+
+    The array owns a copy of the table bytes, so it does not pin a memory-mapped
+    file. Arguments are the same as for :func:`iter_table`.
+    """
+    import numpy as np
+
+    dtype = table_dtype(kind, b64, endianess, entsize)
+    return np.frombuffer(bytes(_table_bytes(buffer, dtype.itemsize, offset, count)), dtype=dtype)
+
+
+# Column dtypes of symbol_columns(), the same for ELF32 and ELF64.
+SYMBOL_COLUMNS = {"st_name": "u4", "st_value": "u8", "st_size": "u8", "st_info": "u1", "st_other": "u1", "st_shndx": "u2"}
+
+
+def symbol_columns(symtab: typing.Any, strtab: bytes, b64: bool, endianess: str) -> dict[str, typing.Any]:
+    """Symbol table as NumPy columns plus a single names blob.
+
+    No Python object is created per symbol (with the C++ extension; the
+    NumPy fallback still decodes the names one by one).
+
+    Returns:
+        ``{"st_name", "st_value", "st_size", "st_info", "st_other", "st_shndx"}``
+        as native-endian ``uint32/uint64/uint64/uint8/uint8/uint16`` arrays, plus
+        ``"names"`` (all names back to back, without NULs) and ``"name_offsets"``
+        (``uint64``, one more than there are symbols): the name of symbol ``i``
+        is ``names[name_offsets[i] : name_offsets[i + 1]]``.
+
+    Example::
+
+        columns = tables.symbol_columns(symtab, strtab, b64=True, endianess="<")
+        functions = columns["st_info"] & 0x0F == defs.SymbolType.STT_FUNC
+    """
+    try:
+        from objutils.hexfiles_ext import parse_symbol_columns
+    except ImportError:
+        parse_symbol_columns = None
+    if parse_symbol_columns is not None:
+        return parse_symbol_columns(bytes(symtab), bytes(strtab), b64, endianess == "<")
+    import numpy as np
+
+    array = read_array(symtab, "sym", b64, endianess)
+    columns = {name: array[name].astype(f"={code}") for name, code in SYMBOL_COLUMNS.items()}
+    names = StringTable(strtab)
+    encoded = [names[offset].encode("utf-8") for offset in columns["st_name"].tolist()]
+    name_offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum([len(name) for name in encoded], out=name_offsets[1:])
+    columns["name_offsets"] = name_offsets
+    columns["names"] = b"".join(encoded)
+    return columns
+
+
+def column_names(columns: dict[str, typing.Any]) -> list[str]:
+    """Decode the ``names`` blob of :func:`symbol_columns` into a list of symbol names."""
+    names = columns["names"]
+    offsets = columns["name_offsets"].tolist()
+    return [names[start:end].decode("utf-8", errors="replace") for start, end in zip(offsets, offsets[1:])]
+
+
+class StringTable:
+    """ELF string table decoded once, looked up by offset.
+
+    The table is split on NUL a single time; lookups at the start of a string
+    are dict hits. Offsets into the middle of a string (suffix sharing, e.g.
+    ``bar`` inside ``foo_bar``) are decoded on demand and cached.
+
+    Example::
+
+        names = StringTable(strtab)
+        names[sym.st_name]  # -> "main"
+    """
+
+    __slots__ = ("_data", "_names")
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+        names: dict[int, str] = {}
+        offset = 0
+        for chunk in data.split(b"\x00"):
+            names[offset] = chunk.decode("utf-8", errors="replace")
+            offset += len(chunk) + 1
+        self._names = names
+
+    def __getitem__(self, offset: int) -> str:
+        name = self._names.get(offset)
+        if name is None:
+            name = self._names[offset] = cstring(self._data, offset)
+        return name
+
+
+def cstring(table: bytes, offset: int) -> str:
+    """NUL-terminated string at `offset` of a string table ("" if out of range)."""
+    if offset >= len(table):
+        return ""
+    end = table.find(b"\x00", offset)
+    return table[offset : end if end != -1 else len(table)].decode("utf-8", errors="replace")
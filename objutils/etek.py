@@ -71,6 +71,7 @@ class Reader(hexfile.Reader):
         (SYMBOL, "%LL3CCU"),
         (EOF, "%LL8CCAAAAAADD"),
     )
+    SIGNATURES = (b"%",)
 
     def check_line(self, line: Any, format_type: int) -> None:
         """Validate Extended Tektronix record checksums.
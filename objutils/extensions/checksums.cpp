@@ -0,0 +1,244 @@
+/**
+ * @file checksums.cpp
+ * @brief Native checksum kernels.
+ *
+ * Design notes
+ * ------------
+ * Reflected CRCs keep the register right-aligned in a 64-bit word, non-reflected
+ * CRCs keep it left-aligned (MSB of the CRC at bit 63).  That way a single
+ * slicing-by-8 loop per bit order handles every width from 1 to 64 bits:
+ *
+ *   reflected : x = load_le64(p) ^ crc;  crc = T7[x & 0xff] ^ ... ^ T0[x >> 56]
+ *   normal    : x = load_be64(p) ^ crc;  crc = T7[x >> 56] ^ ... ^ T0[x & 0xff]
+ *
+ * Remaining bytes are processed with the classic byte-wise table lookup.
+ */
+
+#include "checksums.hpp"
+
+#include <bit>
+#include <cstring>
+#include <stdexcept>
+
+namespace {
+
+// RAII wrapper around a PyBUF_SIMPLE buffer request (C-contiguous bytes, no copy).
+class ByteView {
+   public:
+
+    explicit ByteView(const py::buffer& obj) {
+        if (PyObject_GetBuffer(obj.ptr(), &m_view, PyBUF_SIMPLE) != 0) {
+            throw py::error_already_set();
+        }
+    }
+
+    ~ByteView() {
+        PyBuffer_Release(&m_view);
+    }
+
+    ByteView(const ByteView&)            = delete;
+    ByteView& operator=(const ByteView&) = delete;
+
+    const uint8_t* data() const noexcept {
+        return static_cast<const uint8_t*>(m_view.buf);
+    }
+
+    std::size_t size() const noexcept {
+        return static_cast<std::size_t>(m_view.len);
+    }
+
+   private:
+
+    Py_buffer m_view{};
+};
+
+constexpr bool HOST_LE = (std::endian::native == std::endian::little);
+
+inline uint64_t bswap64(uint64_t v) noexcept {
+#if defined(_MSC_VER)
+    return _byteswap_uint64(v);
+#else
+    return __builtin_bswap64(v);
+#endif
+}
+
+inline uint64_t load_le64(const uint8_t* p) noexcept {
+    uint64_t v;
+    std::memcpy(&v, p, sizeof(v));
+    return HOST_LE ? v : bswap64(v);
+}
+
+inline uint64_t load_be64(const uint8_t* p) noexcept {
+    uint64_t v;
+    std::memcpy(&v, p, sizeof(v));
+    return HOST_LE ? bswap64(v) : v;
+}
+
+inline uint64_t load_word(const uint8_t* p, unsigned step, bool little_endian) noexcept {
+    uint64_t v = 0;
+    if (little_endian) {
+        for (unsigned idx = step; idx-- > 0;) {
+            v = (v << 8) | p[idx];
+        }
+    } else {
+        for (unsigned idx = 0; idx < step; ++idx) {
+            v = (v << 8) | p[idx];
+        }
+    }
+    return v;
+}
+
+uint64_t reflect(uint64_t value, unsigned width) noexcept {
+    uint64_t result = 0;
+    for (unsigned bit = 0; bit < width; ++bit) {
+        if (value & (uint64_t{1} << bit)) {
+            result |= uint64_t{1} << (width - 1 - bit);
+        }
+    }
+    return result;
+}
+
+inline uint64_t width_mask(unsigned width) noexcept {
+    return width == 64 ? ~uint64_t{0} : (uint64_t{1} << width) - 1;
+}
+
+// Validates `width` before any member initializer shifts by it.
+unsigned checked_crc_width(unsigned width) {
+    if (width == 0 || width > 64) {
+        throw py::value_error("CRC width must be between 1 and 64.");
+    }
+    return width;
+}
+
+}  // namespace
+
+// ── Additive checksums ───────────────────────────────────────────────────────
+
+uint64_t word_sum(py::buffer data, unsigned step, unsigned modulus_bits, bool little_endian) {
+    if (step != 1 && step != 2 && step != 4 && step != 8) {
+        throw py::value_error("step must be 1, 2, 4 or 8.");
+    }
+    if (modulus_bits == 0 || modulus_bits > 64) {
+        throw py::value_error("modulus_bits must be between 1 and 64.");
+    }
+    const ByteView    view(data);
+    const std::size_t size = view.size();
+    const std::size_t bulk = size - size % step;
+    const uint8_t*    ptr  = view.data();
+    uint64_t          sum  = 0;
+    {
+        py::gil_scoped_release release;
+        if (step == 1) {
+            for (std::size_t idx = 0; idx < size; ++idx) {
+                sum += ptr[idx];
+            }
+        } else {
+            for (std::size_t idx = 0; idx < bulk; idx += step) {
+                sum += load_word(ptr + idx, step, little_endian);  // Wraps modulo 2**64.
+            }
+            if (bulk != size) {  // Zero-pad a trailing partial word.
+                uint8_t tail[8] = {};
+                std::memcpy(tail, ptr + bulk, size - bulk);
+                sum += load_word(tail, step, little_endian);
+            }
+        }
+    }
+    return sum & width_mask(modulus_bits);
+}
+
+// ── CRC engine ───────────────────────────────────────────────────────────────
+
+CrcEngine::CrcEngine(unsigned width, uint64_t poly, uint64_t init, bool refin, bool refout, uint64_t xorout) :
+    m_width(checked_crc_width(width)), m_mask(width_mask(m_width)), m_refin(refin), m_refout(refout), m_xorout(xorout & m_mask) {
+    poly &= m_mask;
+    init &= m_mask;
+    auto& t0 = m_tables[0];
+    if (refin) {
+        const uint64_t rpoly = reflect(poly, width);
+        for (unsigned value = 0; value < 256; ++value) {
+            uint64_t crc = value;
+            for (int bit = 0; bit < 8; ++bit) {
+                crc = (crc & 1) ? (crc >> 1) ^ rpoly : crc >> 1;
+            }
+            t0[value] = crc;
+        }
+        for (std::size_t k = 1; k < 8; ++k) {
+            for (unsigned value = 0; value < 256; ++value) {
+                const uint64_t prev = m_tables[k - 1][value];
+                m_tables[k][value]  = (prev >> 8) ^ t0[prev & 0xFF];
+            }
+        }
+        m_register = reflect(init, width);
+    } else {
+        const unsigned shift  = 64 - width;
+        const uint64_t lpoly  = poly << shift;
+        constexpr uint64_t TOP = uint64_t{1} << 63;
+        for (unsigned value = 0; value < 256; ++value) {
+            uint64_t crc = static_cast<uint64_t>(value) << 56;
+            for (int bit = 0; bit < 8; ++bit) {
+                crc = (crc & TOP) ? (crc << 1) ^ lpoly : crc << 1;
+            }
+            t0[value] = crc;
+        }
+        for (std::size_t k = 1; k < 8; ++k) {
+            for (unsigned value = 0; value < 256; ++value) {
+                const uint64_t prev = m_tables[k - 1][value];
+                m_tables[k][value]  = (prev << 8) ^ t0[prev >> 56];
+            }
+        }
+        m_register = init << shift;
+    }
+}
+
+uint64_t CrcEngine::process(uint64_t crc, const uint8_t* ptr, std::size_t size) const noexcept {
+    const auto& t  = m_tables;
+    std::size_t idx = 0;
+
+    if (m_refin) {
+        for (; idx + 8 <= size; idx += 8) {
+            const uint64_t x = load_le64(ptr + idx) ^ crc;
+            crc = t[7][x & 0xFF] ^ t[6][(x >> 8) & 0xFF] ^ t[5][(x >> 16) & 0xFF] ^ t[4][(x >> 24) & 0xFF] ^
+                  t[3][(x >> 32) & 0xFF] ^ t[2][(x >> 40) & 0xFF] ^ t[1][(x >> 48) & 0xFF] ^ t[0][x >> 56];
+        }
+        for (; idx < size; ++idx) {
+            crc = t[0][(crc ^ ptr[idx]) & 0xFF] ^ (crc >> 8);
+        }
+    } else {
+        for (; idx + 8 <= size; idx += 8) {
+            const uint64_t x = load_be64(ptr + idx) ^ crc;
+            crc = t[7][x >> 56] ^ t[6][(x >> 48) & 0xFF] ^ t[5][(x >> 40) & 0xFF] ^ t[4][(x >> 32) & 0xFF] ^
+                  t[3][(x >> 24) & 0xFF] ^ t[2][(x >> 16) & 0xFF] ^ t[1][(x >> 8) & 0xFF] ^ t[0][x & 0xFF];
+        }
+        for (; idx < size; ++idx) {
+            crc = t[0][(crc >> 56) ^ ptr[idx]] ^ (crc << 8);
+        }
+    }
+    return crc;
+}
+
+uint64_t CrcEngine::finish(uint64_t crc) const noexcept {
+    if (!m_refin) {
+        crc >>= 64 - m_width;
+    }
+    if (m_refin != m_refout) {
+        crc = reflect(crc, m_width);
+    }
+    return (crc ^ m_xorout) & m_mask;
+}
+
+uint64_t CrcEngine::compute(const uint8_t* ptr, std::size_t size) const noexcept {
+    return finish(process(m_register, ptr, size));
+}
+
+uint64_t CrcEngine::operator()(py::buffer data) const {
+    const ByteView view(data);
+    py::gil_scoped_release release;
+    return compute(view.data(), view.size());
+}
+
+uint64_t CrcEngine::update(uint64_t reg, py::buffer data) const {
+    const ByteView view(data);
+    const unsigned shift = m_refin ? 0 : 64 - m_width;
+    py::gil_scoped_release release;
+    return process((reg & m_mask) << shift, view.data(), view.size()) >> shift;
+}
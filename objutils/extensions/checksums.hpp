@@ -0,0 +1,68 @@
+#pragma once
+
+/**
+ * @file checksums.hpp
+ * @brief Native checksum kernels for objutils.checksums.
+ *
+ * Compiled counterparts of the `checksums.ALGO` family:
+ *   - word_sum()   : CHK_ADD_11 .. CHK_ADD_44 (byte / word / double-word sums)
+ *   - CrcEngine    : table-driven CRC following the Rocksoft(tm) model
+ *                    (CRC-8 .. CRC-64, reflected and non-reflected),
+ *                    processing eight bytes per step (slicing-by-8).
+ *
+ * All entry points accept any object supporting the (contiguous) buffer
+ * protocol - bytes, bytearray, memoryview, mmap, numpy arrays - without
+ * copying, and release the GIL while crunching.
+ */
+
+#include <pybind11/pybind11.h>
+
+#include <array>
+#include <cstddef>
+#include <cstdint>
+
+namespace py = pybind11;
+
+/**
+ * @brief Sum of little- or big-endian words, modulo 2**modulus_bits.
+ *
+ * @param data          Buffer-protocol object; a trailing partial word is zero-padded.
+ * @param step          Word size in bytes (1, 2, 4 or 8).
+ * @param modulus_bits  Width of the result in bits (1 .. 64).
+ * @param little_endian Byte order of the words.
+ */
+uint64_t word_sum(py::buffer data, unsigned step, unsigned modulus_bits, bool little_endian);
+
+class CrcEngine {
+   public:
+
+    CrcEngine(unsigned width, uint64_t poly, uint64_t init, bool refin, bool refout, uint64_t xorout);
+
+    /// CRC of a complete buffer.
+    uint64_t operator()(py::buffer data) const;
+
+    /// Feed a buffer into a raw (not finalised) register, for incremental use.
+    /// Registers are right-aligned and bit-reversed if `refin` is set.
+    uint64_t update(uint64_t reg, py::buffer data) const;
+
+    /// CRC of raw memory (GIL-free).
+    uint64_t compute(const uint8_t* ptr, std::size_t size) const noexcept;
+
+    unsigned width() const noexcept {
+        return m_width;
+    }
+
+   private:
+
+    // Registers are kept left-aligned in 64 bits for non-reflected CRCs.
+    uint64_t process(uint64_t crc, const uint8_t* ptr, std::size_t size) const noexcept;
+    uint64_t finish(uint64_t crc) const noexcept;
+
+    unsigned                                   m_width;
+    uint64_t                                   m_mask;
+    uint64_t                                   m_register;  // Initial register value (reflected / left-aligned).
+    bool                                       m_refin;
+    bool                                       m_refout;
+    uint64_t                                   m_xorout;
+    std::array<std::array<uint64_t, 256>, 8>   m_tables;
+};
@@ -41,6 +41,8 @@
 #include <cstdint>
 #include <cstring>    // std::memcpy, strnlen
 #include <string>
+#include <unordered_map>
+#include <utility>
 #include <vector>
 
 // ── Platform byte-swap helpers ────────────────────────────────────────────────
@@ -205,10 +207,11 @@ std::vector<SymEntry> parse_sym64(
 // ── Public API (pybind11) ─────────────────────────────────────────────────────
 
 py::list parse_symbol_table(
-    py::bytes symtab_data,
-    py::bytes strtab_data,
-    bool      is_64bit,
-    bool      little_endian)
+    py::bytes  symtab_data,
+    py::bytes  strtab_data,
+    bool       is_64bit,
+    bool       little_endian,
+    py::object sections)
 {
     // Obtain raw pointers without copying – PyBytes_AsStringAndSize is O(1).
     const char* sym_raw  = nullptr;
@@ -235,6 +238,17 @@ py::list parse_symbol_table(
         ? parse_sym64(sym_ptr, sym_size, str_ptr, str_size, little_endian)
         : parse_sym32(sym_ptr, sym_size, str_ptr, str_size, little_endian);
 
+    // Optional st_shndx -> (section_name, access) map, converted once so the
+    // per-symbol lookup happens in C++ instead of the Python import loop.
+    const bool resolve_sections = !sections.is_none();
+    std::unordered_map<uint32_t, std::pair<py::str, py::int_>> section_map;
+    if (resolve_sections) {
+        for (auto item : sections.cast<py::dict>()) {
+            const auto entry = item.second.cast<py::tuple>();
+            section_map.emplace(item.first.cast<uint32_t>(), std::make_pair(py::str(entry[0]), py::int_(entry[1])));
+        }
+    }
+
     // Build Python list of dicts.  The bulk of the per-symbol overhead is now
     // in Python-object construction, which is unavoidable, but still much
     // cheaper than running the construct DSL for each entry.
@@ -251,7 +265,94 @@ py::list parse_symbol_table(
         d["st_other"]    = static_cast<uint8_t>(e.st_other);
         d["st_shndx"]    = static_cast<uint16_t>(e.st_shndx);
         d["symbol_name"] = e.symbol_name;
+        if (resolve_sections) {
+            const auto found = section_map.find(e.st_shndx);
+            if (found != section_map.end()) {
+                d["section_name"] = found->second.first;
+                d["access"]       = found->second.second;
+            } else {
+                d["section_name"] = std::to_string(e.st_shndx);
+                d["access"]       = 0;
+            }
+        }
         result.append(std::move(d));
     }
     return result;
 }
+
+py::dict parse_symbol_columns(
+    py::bytes symtab_data,
+    py::bytes strtab_data,
+    bool      is_64bit,
+    bool      little_endian)
+{
+    char*       sym_raw      = nullptr;
+    Py_ssize_t  sym_raw_size = 0;
+    if (PyBytes_AsStringAndSize(symtab_data.ptr(), &sym_raw, &sym_raw_size) < 0) {
+        throw py::error_already_set();
+    }
+    char*       str_raw      = nullptr;
+    Py_ssize_t  str_raw_size = 0;
+    if (PyBytes_AsStringAndSize(strtab_data.ptr(), &str_raw, &str_raw_size) < 0) {
+        throw py::error_already_set();
+    }
+
+    const auto*       sym_ptr  = reinterpret_cast<const uint8_t*>(sym_raw);
+    const auto*       str_ptr  = reinterpret_cast<const uint8_t*>(str_raw);
+    const std::size_t str_size = static_cast<std::size_t>(str_raw_size);
+    const std::size_t entsize  = is_64bit ? SYM64_SIZE : SYM32_SIZE;
+    const std::size_t count    = static_cast<std::size_t>(sym_raw_size) / entsize;
+    const auto        n        = static_cast<py::ssize_t>(count);
+
+    py::array_t<uint32_t> st_name(n);
+    py::array_t<uint64_t> st_value(n);
+    py::array_t<uint64_t> st_size(n);
+    py::array_t<uint8_t>  st_info(n);
+    py::array_t<uint8_t>  st_other(n);
+    py::array_t<uint16_t> st_shndx(n);
+    py::array_t<uint64_t> name_offsets(n + 1);
+
+    auto* name_p   = st_name.mutable_data();
+    auto* value_p  = st_value.mutable_data();
+    auto* size_p   = st_size.mutable_data();
+    auto* info_p   = st_info.mutable_data();
+    auto* other_p  = st_other.mutable_data();
+    auto* shndx_p  = st_shndx.mutable_data();
+    auto* offset_p = name_offsets.mutable_data();
+
+    std::string names;
+    offset_p[0] = 0;
+    for (std::size_t i = 0; i < count; ++i) {
+        const uint8_t* p = sym_ptr + i * entsize;
+        name_p[i] = read_val<uint32_t>(p, little_endian);
+        if (is_64bit) {
+            info_p[i]  = p[4];
+            other_p[i] = p[5];
+            shndx_p[i] = read_val<uint16_t>(p +  6, little_endian);
+            value_p[i] = read_val<uint64_t>(p +  8, little_endian);
+            size_p[i]  = read_val<uint64_t>(p + 16, little_endian);
+        } else {
+            value_p[i] = read_val<uint32_t>(p +  4, little_endian);
+            size_p[i]  = read_val<uint32_t>(p +  8, little_endian);
+            info_p[i]  = p[12];
+            other_p[i] = p[13];
+            shndx_p[i] = read_val<uint16_t>(p + 14, little_endian);
+        }
+        if (static_cast<std::size_t>(name_p[i]) < str_size) {
+            const char* s = reinterpret_cast<const char*>(str_ptr + name_p[i]);
+            names.append(s, strnlen(s, str_size - name_p[i]));
+        }
+        offset_p[i + 1] = names.size();
+    }
+
+    py::dict result;
+    result["st_name"]      = st_name;
+    result["st_value"]     = st_value;
+    result["st_size"]      = st_size;
+    result["st_info"]      = st_info;
+    result["st_other"]     = st_other;
+    result["st_shndx"]     = st_shndx;
+    result["name_offsets"] = name_offsets;
+    result["names"]        = py::bytes(names);
+    return result;
+}
@@ -19,8 +19,10 @@
  *     st_name (int), st_value (int), st_size (int),
  *     st_bind (int), st_type (int), st_other (int),
  *     st_shndx (int), symbol_name (str)
+ *   plus section_name (str) and access (int) when a section map is passed.
  */
 
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
@@ -33,9 +35,31 @@ namespace py = pybind11;
  * @param strtab_data  Raw bytes of the associated string-table section (.strtab / .dynstr).
  * @param is_64bit     True for ELF64, false for ELF32.
  * @param little_endian True when the ELF file uses little-endian encoding (EI_DATA == 1).
+ * @param sections     Optional dict st_shndx -> (section_name, sh_flags). When given, every
+ *                     dict also gets section_name / access (str(st_shndx) / 0 for unknown indices).
  * @return             Python list of dicts – one per symbol.
  */
 py::list parse_symbol_table(
+    py::bytes  symtab_data,
+    py::bytes  strtab_data,
+    bool       is_64bit,
+    bool       little_endian,
+    py::object sections = py::none()
+);
+
+/**
+ * @brief Parse a raw ELF symbol-table section into columns.
+ *
+ * Same input as parse_symbol_table(), but instead of one dict per symbol the
+ * result is a dict of NumPy arrays (native byte order), one element per symbol:
+ *   st_name (uint32), st_value (uint64), st_size (uint64), st_info (uint8),
+ *   st_other (uint8), st_shndx (uint16),
+ * plus the symbol names as a single blob:
+ *   names (bytes)           – all names back to back, not NUL-terminated,
+ *   name_offsets (uint64)   – count + 1 offsets; name i is names[off[i]:off[i + 1]].
+ * No Python object is created per symbol.
+ */
+py::dict parse_symbol_columns(
     py::bytes symtab_data,
     py::bytes strtab_data,
     bool      is_64bit,
@@ -3,6 +3,7 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include "checksums.hpp"
 #include "difflib.h"
 #include "elf_parser.hpp"
 
@@ -28,6 +29,7 @@ PYBIND11_MODULE(hexfiles_ext, m) {
 		py::arg("strtab_data"),
 		py::arg("is_64bit"),
 		py::arg("little_endian"),
+		py::arg("sections") = py::none(),
 		R"doc(
 Parse a raw ELF symbol-table section in C++ and return a list of dicts.
 
@@ -45,6 +47,9 @@ is_64bit : bool
     True for ELF64 (24-byte Elf64_Sym entries), False for ELF32 (16-byte).
 little_endian : bool
     True when EI_DATA == ELFDATA2LSB (little-endian).
+sections : dict[int, tuple[str, int]], optional
+    st_shndx -> (section_name, sh_flags). When given, the section of every
+    symbol is resolved here instead of in Python.
 
 Returns
 -------
@@ -52,7 +57,68 @@ list[dict]
     One dict per symbol with keys:
       st_name (int), st_value (int), st_size (int),
       st_bind (int), st_type (int), st_other (int),
-      st_shndx (int), symbol_name (str).
+      st_shndx (int), symbol_name (str),
+    plus section_name (str) and access (int) if `sections` was passed
+    (str(st_shndx) and 0 for indices missing from the map).
 )doc"
 	);
+
+	m.def(
+		"parse_symbol_columns",
+		&parse_symbol_columns,
+		py::arg("symtab_data"),
+		py::arg("strtab_data"),
+		py::arg("is_64bit"),
+		py::arg("little_endian"),
+		R"doc(
+Parse a raw ELF symbol-table section into columnar NumPy arrays.
+
+Same parameters as parse_symbol_table(), but no Python object is created
+per symbol.
+
+Returns
+-------
+dict
+    st_name (uint32), st_value (uint64), st_size (uint64), st_info (uint8),
+    st_other (uint8), st_shndx (uint16): arrays with one element per symbol;
+    names (bytes): all symbol names back to back (not NUL-terminated);
+    name_offsets (uint64): count + 1 offsets, name i is
+    names[name_offsets[i]:name_offsets[i + 1]].
+)doc"
+	);
+
+	// ── Checksum kernels ───────────────────────────────────────────────────
+	m.def(
+		"word_sum",
+		&word_sum,
+		py::arg("data"),
+		py::arg("step"),
+		py::arg("modulus_bits"),
+		py::arg("little_endian") = true,
+		R"doc(
+Sum of bytes / words of a buffer modulo 2**modulus_bits (CHK_ADD_11 .. CHK_ADD_44).
+
+Parameters
+----------
+data : buffer
+    Any contiguous buffer-protocol object; not copied.
+step : int
+    Word size in bytes (1, 2, 4 or 8); a trailing partial word is zero-padded.
+modulus_bits : int
+    Width of the result in bits.
+little_endian : bool
+    Byte order of the words.
+)doc"
+	);
+
+	py::class_<CrcEngine>(m, "CrcEngine")
+		.def(py::init<unsigned, uint64_t, uint64_t, bool, bool, uint64_t>(),
+		     py::arg("width"), py::arg("poly"), py::arg("init") = 0,
+		     py::arg("refin") = false, py::arg("refout") = false, py::arg("xorout") = 0)
+		.def("__call__", &CrcEngine::operator(), py::arg("data"),
+		     "CRC of a contiguous buffer-protocol object (not copied).")
+		.def("update", &CrcEngine::update, py::arg("register"), py::arg("data"),
+		     "Feed data into a raw register (right-aligned, reflected if refin) and return the new register.")
+		.def_property_readonly("width", &CrcEngine::width)
+	;
 }
@@ -74,6 +74,7 @@ class Reader(hexfile.Reader):
         (DATA_REL, "CCLL0002AAAAAAAADD"),
         (EOF, "00000000"),
     )
+    SIGNATURES = (b"$", b"fpc:")
 
     def decode(self, fp: BinaryIO) -> str:
         """Decode FPC base-85 encoding to hex format.
@@ -647,6 +647,9 @@ class Reader(BaseType):
         Regex pattern for valid characters. Default: hex digits and common punctuation
     FORMAT_SPEC : str | list[tuple[int, str]]
         Format specification (required, must be defined in subclass)
+    SIGNATURES : tuple[bytes, ...]
+        Leading bytes of files in this format (after whitespace), used by
+        :func:`objutils.probe` to pick candidate codecs. Default: () (unknown)
 
     Instance Attributes
     -------------------
@@ -772,22 +775,32 @@ class Reader(BaseType):
     DATA_SEPARATOR: str | None = None
     VALID_CHARS: re.Pattern[str] = re.compile(r"^[a-fA-F0-9 :/;,%\n\r!?S]*$")
     FORMAT_SPEC: str | list[tuple[int, str]] | None = None
+    SIGNATURES: tuple[bytes, ...] = ()
 
     def __init__(self) -> None:
         """Initialize reader with format specification."""
         self.logger = Logger("Reader")
         self.stats = Statistics()
         self.valid = True
-        self.formats: list[tuple[int, re.Pattern[str]]] = []
         self.base_address = 0  # Base address for relative addressing (if applicable - mainly Intel HEX)
-
-        # Parse FORMAT_SPEC into compiled patterns
-        if isinstance(self.FORMAT_SPEC, str):
-            self.formats = [(0, FormatParser(self.FORMAT_SPEC, self.DATA_SEPARATOR).parse())]
-        elif isinstance(self.FORMAT_SPEC, (list, tuple)):
-            for format_type, format_str in self.FORMAT_SPEC:
-                pattern = FormatParser(format_str, self.DATA_SEPARATOR).parse()
-                self.formats.append((format_type, pattern))
+        self.formats: list[tuple[int, re.Pattern[str]]] = list(self._compiled_formats())
+
+    @classmethod
+    def _compiled_formats(cls) -> tuple[tuple[int, re.Pattern[str]], ...]:
+        """Compiled FORMAT_SPEC patterns, parsed once per class on first use."""
+        formats = cls.__dict__.get("_FORMATS")
+        if formats is None:
+            if isinstance(cls.FORMAT_SPEC, str):
+                formats = ((0, FormatParser(cls.FORMAT_SPEC, cls.DATA_SEPARATOR).parse()),)
+            elif isinstance(cls.FORMAT_SPEC, (list, tuple)):
+                formats = tuple(
+                    (format_type, FormatParser(format_str, cls.DATA_SEPARATOR).parse())
+                    for format_type, format_str in cls.FORMAT_SPEC
+                )
+            else:
+                formats = ()
+            cls._FORMATS = formats
+        return formats
 
     def load(self, fp: str | Path | BinaryIO, join: bool = False, **kws: Any) -> Image:
         """Load image from file path or file-like object.
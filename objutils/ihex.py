@@ -51,6 +51,7 @@ class Reader(hexfile.Reader):
     """
 
     FORMAT_SPEC = ((hexfile.TYPE_FROM_RECORD, ":LLAAAATTDDCC"),)
+    SIGNATURES = (b":",)
 
     def __init__(self) -> None:
         """Initialize reader with address calculation state."""
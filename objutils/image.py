@@ -273,19 +273,17 @@ __copyright__ = """
 """
 
 import enum
+import hashlib
+import struct
 import sys
 from bisect import bisect_right
 from collections.abc import Iterable
 from operator import attrgetter, eq
 from typing import Any, Protocol
 
+from objutils import checksums
 from objutils.exceptions import InvalidAddressError
-from objutils.section import Section, join_sections
-
-# NOTE: Crypto hashes could be used for optimized comparison and storage.
-# This would require adding a dependency on hashlib and implementing hash
-# caching for sections. Consider implementing if performance becomes an issue
-# with large images or frequent comparisons.
+from objutils.section import Section, _coalesce_ranges, _mismatch_ranges, join_sections
 
 
 class AddressSpace(enum.IntEnum):
@@ -419,6 +417,8 @@ class Image:
     ) -> None:
         if meta is None:
             meta = {}
+        self._digests = None
+        self._checksums = {}
         if not sections:
             sections = []
         elif isinstance(sections, Section) or hasattr(sections, "__iter__"):
@@ -459,13 +459,33 @@ class Image:
         return self.sections[idx]
 
     def __eq__(self, other: object) -> bool:
-        """Check equality with another Image."""
+        """Check equality with another Image.
+
+        Images are equal if their sections cover the same address ranges
+        with the same contents; section names are not compared.
+
+        Cached digests are only used to prove inequality: if both images
+        hold a :meth:`digest` for the same algorithm and the values differ,
+        the data isn't touched. Otherwise the contents are compared byte by
+        byte, because ``section.data`` may have been modified in-place since
+        the digest was taken. For constant-time comparisons (e.g. deduplicating
+        many builds), compare ``img.digest()`` values instead of using ``==``.
+        """
         if not isinstance(other, Image):
             return NotImplemented
-        if len(self.sections) == len(other.sections):
-            return all(eq(left, right) for left, right in zip(self.sections, other.sections, strict=True))
-        else:
+        if self is other:
+            return True
+        if self._digests and other._digests:
+            for algo, value in self._digests.items():
+                other_value = other._digests.get(algo)
+                if other_value is not None and value != other_value:
+                    return False
+        if len(self.sections) != len(other.sections):
             return False
+        for left, right in zip(self.sections, other.sections, strict=True):
+            if left.start_address != right.start_address or left.length != right.length:
+                return False
+        return all(eq(left.data, right.data) for left, right in zip(self.sections, other.sections, strict=True))
 
     def __ne__(self, other: object) -> bool:
         """Check inequality with another Image."""
@@ -580,6 +600,52 @@ class Image:
         """
         return self._call_address_function("read", addr, length, **kws)
 
+    def read_range(self, addr: int, length: int, fill: int | None = None) -> bytearray:
+        """Read bytes from image, spanning section boundaries.
+
+        Unlike :meth:`read`, the range may cross any number of sections; the
+        data is copied into a single preallocated buffer.
+
+        Args:
+            addr: Start address to read from.
+            length: Number of bytes to read.
+            fill: Byte value (0..255) used for gaps between sections. If None,
+                gaps are not permitted.
+
+        Returns:
+            Bytes read from the image.
+
+        Raises:
+            InvalidAddressError: If ``fill`` is None and the range is not
+                fully covered by sections.
+
+        Example::
+
+            img = Image([Section(0x1000, b"AB"), Section(0x1004, b"CD")])
+            img.read_range(0x1000, 6, fill=0xFF)  # b"AB\xff\xffCD"
+        """
+        if length < 0:
+            raise ValueError("length must be >= 0")
+        if fill is None:
+            if not self.contains_range(addr, length):
+                raise InvalidAddressError(f"read_range(0x{addr:08x}) access out of bounds.")
+            result = bytearray(length)
+        else:
+            if not (0 <= fill < 256):
+                raise ValueError("fill must be between 0 and 255")
+            result = bytearray((fill,)) * length
+        end = addr + length
+        idx = max(bisect_right(self._sections, addr, key=attrgetter("start_address")) - 1, 0)
+        for section in self._sections[idx:]:
+            start = section.start_address
+            if start >= end:
+                break
+            lower = max(addr, start)
+            upper = min(end, start + section.length)
+            if lower < upper:
+                result[lower - addr : upper - addr] = memoryview(section.data)[lower - start : upper - start]
+        return result
+
     def write(self, addr: int, data: bytes | bytearray, **kws: Any) -> None:
         """Write bytes to image.
 
@@ -938,6 +1004,222 @@ class Image:
         """
         self._call_address_function("write_string", addr, value, encoding, **kws)
 
+    def fill(self, value: int = 0, start: int | None = None, length: int | None = None) -> None:
+        """Fill an address range with a constant byte value.
+
+        Args:
+            value: Fill byte (0 <= value <= 255).
+            start: Start address. If None, every section is filled completely.
+            length: Number of bytes to fill. If None, fills up to the end of
+                the section containing ``start``.
+
+        Raises:
+            InvalidAddressError: If the range is not fully covered by sections.
+        """
+        if start is None:
+            for section in self.sections:
+                section.fill(value)
+            return
+        if length is None:
+            section = self.get_section(start)
+            length = section.start_address + section.length - start
+        if not self.contains_range(start, length):
+            raise InvalidAddressError(f"fill(0x{start:08x}) access out of bounds.")
+        end = start + length
+        idx = max(bisect_right(self._sections, start, key=attrgetter("start_address")) - 1, 0)
+        for section in self._sections[idx:]:
+            if section.start_address >= end:
+                break
+            lower = max(start, section.start_address)
+            upper = min(end, section.start_address + section.length)
+            if lower < upper:
+                section.fill(value, lower, upper - lower)
+
+    def find(self, pattern: bytes | str | int, addr: int | None = None) -> int:
+        """Find the first occurrence of a byte pattern.
+
+        Args:
+            pattern: Bytes to search for; strings are ``latin1`` encoded,
+                an integer denotes a single byte.
+            addr: Address to start searching at. If None, searches the whole image.
+
+        Returns:
+            Address of the first match, or -1 if not found.
+
+        Note:
+            Sections are searched individually, matches spanning two
+            (non-joined) sections are not reported.
+        """
+        for section in self.sections:
+            if addr is not None and section.start_address + section.length <= addr:
+                continue
+            result = section.find(pattern, addr)
+            if result != -1:
+                return result
+        return -1
+
+    def find_all(self, pattern: bytes | str | int) -> list[int]:
+        """Find all occurrences of a byte pattern.
+
+        Args:
+            pattern: Bytes to search for (see :meth:`find`).
+
+        Returns:
+            Sorted list of addresses of all matches.
+        """
+        result = []
+        for section in self.sections:
+            result.extend(section.find_all(pattern))
+        return result
+
+    def compare(self, other: "Image") -> list[tuple[int, int]]:
+        """Compare contents with another image.
+
+        Args:
+            other: Image to compare with.
+
+        Returns:
+            List of ``(address, length)`` tuples of ranges of this image whose
+            contents differ from ``other``, including ranges not present in
+            ``other`` at all; empty if all bytes of this image are equal.
+        """
+        others = other.sections
+        ranges = []
+        for section in self.sections:
+            start = section.start_address
+            end = start + section.length
+            cursor = start
+            idx = max(bisect_right(others, start, key=attrgetter("start_address")) - 1, 0)
+            for candidate in others[idx:]:
+                if candidate.start_address >= end:
+                    break
+                lower = max(cursor, candidate.start_address)
+                upper = min(end, candidate.start_address + candidate.length)
+                if lower >= upper:
+                    continue
+                ranges.append((cursor, lower - cursor))
+                left = memoryview(section.data)[lower - start : upper - start]
+                right = memoryview(candidate.data)[lower - candidate.start_address : upper - candidate.start_address]
+                ranges.extend(_mismatch_ranges(left, right, lower))
+                cursor = upper
+            ranges.append((cursor, end - cursor))
+        return _coalesce_ranges(ranges)
+
+    def checksum(
+        self, algo: str = "CHK_CRC_32", start: int | None = None, end: int | None = None, fill: int | None = 0xFF, **params: Any
+    ) -> int:
+        """Calculate a checksum over an address range.
+
+        Sections are walked in address order and fed to the checksum
+        without building a flat copy of the image. Gaps between sections
+        count as ``fill`` bytes (erased flash by default); they are never
+        allocated, filler runs are folded in arithmetically
+        (:func:`objutils.checksums.crc32_fill`,
+        :meth:`objutils.checksums.Checksum.update_fill`). CRC-32 is
+        computed per section (in parallel for large sections, see
+        :func:`objutils.checksums.crc32_parallel`) and the results are
+        combined.
+
+        Results are cached per ``(algo, start, end, fill, params)`` until the image
+        is modified through its (or its sections') methods; in-place changes
+        to ``section.data`` are not seen (see :attr:`Section.data`).
+
+        Args:
+            algo: Algorithm name, see :data:`objutils.checksums.ALGO`.
+            start: First address (default: start of first section).
+            end: Address after the last byte (default: end of last section).
+            fill: Value of bytes not covered by any section, or None to skip gaps.
+            **params: CRC parameters for ``CHK_USER_DEFINED``, see :class:`objutils.checksums.Crc`.
+
+        Returns:
+            Checksum value.
+
+        Raises:
+            ValueError: If ``start`` is greater than ``end``.
+
+        Example::
+
+            crc = img.checksum("CHK_CRC_32", 0x08000000, 0x08040000, fill=0xFF)
+        """
+        sections = self._sections
+        if start is None:
+            start = sections[0].start_address if sections else 0
+        if end is None:
+            end = sections[-1].start_address + sections[-1].length if sections else start
+        if start > end:
+            raise ValueError(f"checksum(): start (0x{start:08x}) is greater than end (0x{end:08x}).")
+        key = (algo, start, end, fill, tuple(sorted(params.items())))
+        result = self._checksums.get(key)
+        if result is not None:
+            return result
+        crc32 = algo == "CHK_CRC_32"
+        crc = 0
+        state = None if crc32 else checksums.new(algo, **params)
+        position = start  # End of data fed so far.
+        idx = max(bisect_right(sections, start, key=attrgetter("start_address")) - 1, 0)
+        for section in sections[idx:]:
+            section_start = section.start_address
+            if section_start >= end:
+                break
+            lower = max(start, section_start)
+            upper = min(end, section_start + section.length)
+            if lower >= upper:
+                continue
+            if fill is not None and lower > position:
+                if crc32:
+                    crc = checksums.crc32_combine(crc, checksums.crc32_fill(fill, lower - position), lower - position)
+                else:
+                    state.update_fill(fill, lower - position)
+            if crc32:
+                crc = checksums.crc32_combine(crc, section.checksum(algo, lower, upper - lower), upper - lower)
+            else:
+                state.update(memoryview(section.data)[lower - section_start : upper - section_start])
+            position = upper
+        if fill is not None and end > position:
+            if crc32:
+                crc = checksums.crc32_combine(crc, checksums.crc32_fill(fill, end - position), end - position)
+            else:
+                state.update_fill(fill, end - position)
+        result = crc if crc32 else state.digest()
+        self._checksums[key] = result
+        return result
+
+    def digest(self, algo: str = "blake2b") -> bytes:
+        """Compute a cryptographic fingerprint of the image.
+
+        Combines start address, length and :meth:`Section.digest` of every
+        section. Section digests are cached individually, so after a write
+        only the modified sections are rehashed; the image digest itself is
+        cached until any section changes.
+
+        Args:
+            algo: Any algorithm name accepted by :func:`hashlib.new`.
+
+        Returns:
+            Digest bytes; equal images yield equal digests.
+
+        Example::
+
+            builds = {}
+            for name, img in images:
+                builds.setdefault(img.digest(), []).append(name)
+        """
+        if self._digests is None:
+            self._digests = {}
+        result = self._digests.get(algo)
+        if result is None:
+            hasher = hashlib.new(algo)
+            for section in self.sections:
+                hasher.update(struct.pack("<QQ", section.start_address, section.length))
+                hasher.update(section.digest(algo))
+            result = self._digests[algo] = hasher.digest()
+        return result
+
+    def _touch(self) -> None:
+        """Invalidate cached digests and checksums; called on any section change."""
+        self._digests = None
+        self._checksums = {}
+
     def _address_contained(self, address: int, length: int) -> bool:
         """Check if address range has ANY overlap with the image.
 
@@ -981,7 +1263,10 @@ class Image:
             raise InvalidAddressError("Overlapping address-space")
         if isinstance(data, str):
             data = [ord(x) for x in data]  # array.array('B',data)
-        self._sections.append(Section(start_address, data))
+        section = Section(start_address, data)
+        section._parent_image = self
+        self._sections.append(section)
+        self._touch()
         if join:
             self.join_sections()
         self.address = start_address + len(data)
@@ -1058,6 +1343,7 @@ class Image:
         self._sections = join_sections(self._sections)
         for section in self._sections:
             section._parent_image = self
+        self._touch()
 
     def _validate_address_change(self, section: Section, new_address: int) -> None:
         """Validate that changing a section's address doesn't cause overlaps."""
@@ -56,6 +56,7 @@ class Reader(hexfile.Reader):
     """
 
     FORMAT_SPEC = ((DATA, ";LLAAAADDCCCC"), (EOF, ";00"))
+    SIGNATURES = (b";",)
 
     def check_line(self, line: Any, format_type: int) -> None:
         """Validate MOS Technology record checksum.
@@ -80,6 +80,7 @@ class Reader(hexfile.Reader):
     # FORMAT_SPEC is required by the base __init__; we override read() completely
     # (same approach as ASCIIHexReader).
     FORMAT_SPEC = [(0, "0xAAAAAAAA: D")]
+    SIGNATURES = (b"0x",)
     DATA_SEPARATOR = " "
 
     def read(self, fp: BinaryIO, join: bool = False) -> Image:
@@ -59,6 +59,7 @@ class Reader(hexfile.Reader):
     """
 
     FORMAT_SPEC = ((DATA, "AAAA DD;"), (EOF, ":0000"))
+    SIGNATURES = (b"\x00",)  # Null header.
 
     def check_line(self, line: Any, format_type: int) -> None:
         """Validate RCA record.
@@ -14,9 +14,10 @@ The registry system consists of:
 3. **Automatic registration** - Formats self-register at import time
 4. **Format detection** - Unified API for loading any supported format
 
-When you import objutils, all format modules are imported in ``__init__.py``, and
-each format registers itself via ``registry.register()``. This allows the high-level
-API (``load()``, ``dump()``, etc.) to work with any format without hardcoded knowledge.
+When you import objutils, the built-in formats are registered by module path via
+``registry.register_lazy()`` in ``__init__.py``; a format module is only imported when
+its codec is first requested. This allows the high-level API (``load()``, ``dump()``,
+etc.) to work with any format without hardcoded knowledge.
 
 Format Registration
 -------------------
@@ -165,6 +166,8 @@ The registry preserves insertion order (uses OrderedDict), so formats are listed
 in the order they were registered during ``objutils.__init__`` import.
 """
 
+from __future__ import annotations
+
 __copyright__ = """
     objutils - Object file library for Python.
 
@@ -187,13 +190,16 @@ __copyright__ = """
   51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+import importlib
 from collections import OrderedDict
 from collections.abc import Iterator
-from typing import Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple
 
-from objutils.hexfile import ReaderProtocol, WriterProtocol
 from objutils.utils import SingletonBase
 
+if TYPE_CHECKING:
+    from objutils.hexfile import ReaderProtocol, WriterProtocol
+
 
 class CodecDoesNotExistError(Exception):
     """Raised when requesting a format codec that is not registered.
@@ -263,6 +269,18 @@ class Codec(NamedTuple):
     description: str
 
 
+class LazyCodec(NamedTuple):
+    """Placeholder for a codec whose module is imported on first use.
+
+    See :meth:`Registry.register_lazy`.
+    """
+
+    module: str
+    reader: str
+    writer: str
+    description: str
+
+
 class Registry(SingletonBase):
     """Singleton registry for hex file format codecs.
 
@@ -284,6 +302,8 @@ class Registry(SingletonBase):
     -------
     register(name, readerClass, writerClass, description="")
         Register a new format codec
+    register_lazy(name, module, description="", reader="Reader", writer="Writer")
+        Register a codec by module path, imported on first use
     get(name)
         Retrieve codec for a format name
 
@@ -347,7 +367,7 @@ class Registry(SingletonBase):
 
         This is called only once due to singleton pattern.
         """
-        self._codecs: OrderedDict[str, Codec] = OrderedDict()
+        self._codecs: OrderedDict[str, Codec | LazyCodec] = OrderedDict()
 
     def __iter__(self) -> Iterator[tuple[str, Codec]]:
         """Iterate over (format_name, codec) pairs.
@@ -364,15 +384,29 @@ class Registry(SingletonBase):
             for name, codec in registry:
                 print(f"{name}: {codec.Reader.__name__}")
         """
-        return iter(self._codecs.items())
+        return ((name, self._resolve(name)) for name in list(self._codecs))
+
+    def _resolve(self, name: str) -> Codec:
+        """Import the module of a lazily registered codec (internal)."""
+        codec = self._codecs[name]
+        if isinstance(codec, LazyCodec):
+            module = importlib.import_module(codec.module)
+            reader_class = getattr(module, codec.reader)
+            writer_class = getattr(module, codec.writer)
+            reader_class.codecName = name
+            writer_class.codecName = name
+            codec = self._codecs[name] = Codec(reader_class, writer_class, codec.description)
+        return codec
 
-    def _get_codecs(self) -> "OrderedDict[str, Codec]":
+    def _get_codecs(self) -> OrderedDict[str, Codec]:
         """Get codec mapping (internal property getter)."""
+        for name in list(self._codecs):
+            self._resolve(name)
         return self._codecs
 
     def _get_formats(self) -> list[str]:
         """Get sorted format names (internal property getter)."""
-        return sorted(self.codecs.keys())
+        return sorted(self._codecs.keys())
 
     def get(self, name: str) -> Codec:
         """Retrieve codec for a format name.
@@ -414,10 +448,10 @@ class Registry(SingletonBase):
             except CodecDoesNotExistError:
                 print(f"Available formats: {registry.formats}")
         """
-        codec = self.codecs.get(name.lower())
-        if not codec:
+        key = name.lower()
+        if key not in self._codecs:
             raise CodecDoesNotExistError(name)
-        return codec
+        return self._resolve(key)
 
     def register(self, name: str, readerClass: type[Any], writerClass: type[Any], description: str = "") -> None:
         """Register a new format codec.
@@ -475,12 +509,47 @@ class Registry(SingletonBase):
             reader = codec.Reader()
             print(reader.codecName)  # "myformat"
         """
-        if name in self.codecs:
+        if name in self._codecs:
             raise CodecAlreadyExistError(name)
         self._codecs[name] = Codec(readerClass, writerClass, description)
         readerClass.codecName = name
         writerClass.codecName = name
 
+    def register_lazy(self, name: str, module: str, description: str = "", reader: str = "Reader", writer: str = "Writer") -> None:
+        """Register a format codec by module path.
+
+        The module is imported on the first :meth:`get` (or iteration) that
+        needs the codec, so registering costs nothing at import time. This is
+        how the built-in formats are registered in ``objutils/__init__.py``.
+
+        Parameters
+        ----------
+        name : str
+            Format identifier (lowercase recommended), e.g., "ihex"
+        module : str
+            Absolute module name, e.g., "objutils.ihex"
+        description : str, optional
+            Human-readable format description (default: "")
+        reader : str, optional
+            Name of the Reader class in `module` (default: "Reader")
+        writer : str, optional
+            Name of the Writer class in `module` (default: "Writer")
+
+        Raises
+        ------
+        CodecAlreadyExistError
+            If format name is already registered
+
+        Examples
+        --------
+        ::
+
+            registry.register_lazy("myformat", "mypackage.myformat", "My Custom Hex Format")
+        """
+        if name in self._codecs:
+            raise CodecAlreadyExistError(name)
+        self._codecs[name] = LazyCodec(module, reader, writer, description)
+
     codecs = property(_get_codecs)
     formats = property(_get_formats)
 
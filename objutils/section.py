@@ -36,7 +36,8 @@ Architecture
     ├── read_asam_numeric_array/write_asam_numeric_array()  # ASAM arrays
     ├── read_asam_ndarray/write_asam_ndarray()    # ASAM NumPy arrays
     ├── read_string/write_string()                # Null-terminated strings
-    └── read_ndarray/write_ndarray()              # NumPy arrays
+    ├── read_ndarray/write_ndarray()              # NumPy arrays
+    └── fill/find/find_all/compare()              # Bulk operations
 
 Usage Examples
 --------------
@@ -165,6 +166,8 @@ See Also
 - :mod:`objutils.hexdump` - Hexadecimal dump formatting
 """
 
+from __future__ import annotations
+
 __copyright__ = """
     objutils - Object file library for Python.
 
@@ -188,6 +191,7 @@ __copyright__ = """
   51 Franklin Street, Fifth Floor, Boston, MA 02110-1301 USA.
 """
 
+import hashlib
 import re
 import reprlib
 import struct
@@ -198,11 +202,9 @@ from copy import copy
 from dataclasses import dataclass
 from functools import reduce
 from operator import attrgetter, mul
-from typing import Any, TextIO
-
-import numpy as np
+from typing import TYPE_CHECKING, Any, TextIO
 
-from objutils import hexdump
+from objutils import checksums, hexdump
 from objutils.exceptions import InvalidAddressError
 
 try:
@@ -211,6 +213,9 @@ except ImportError:
     print("Error: cannot import `SequenceMatcher` from C++-extension, falling back to `difflib`")
     from difflib import SequenceMatcher  # noqa: F401
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 ##
 ## todo: find/search methode(n) mit slice funktion!
@@ -364,7 +369,93 @@ def filler(ch: int, n: int) -> bytearray:
         raise TypeError("n must be of type int")
     if n < 1:
         raise ValueError("n must be >= 1")
-    return bytearray([ch] * n)
+    return bytearray((ch,)) * n
+
+
+def _pattern_to_bytes(pattern: bytes | bytearray | str | int) -> bytes:
+    """Normalize a search pattern to :class:`bytes`.
+
+    Strings are encoded as ``latin1``, integers denote a single byte.
+    """
+    if isinstance(pattern, int):
+        if not (0 <= pattern < 256):
+            raise ValueError("pattern must be between 0 and 255")
+        return bytes((pattern,))
+    if isinstance(pattern, str):
+        pattern = pattern.encode("latin1")
+    pattern = bytes(pattern)
+    if not pattern:
+        raise ValueError("pattern must not be empty")
+    return pattern
+
+
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+_COMPARE_CHUNK = 1 << 20
+
+
+def _numpy() -> Any:
+    """Import NumPy on first use; only the ndarray / ASAM array methods need it."""
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("NumPy is required for ndarray support, install it with 'pip install numpy'.") from exc
+    return numpy
+
+
+def _mismatch_ranges(left: Any, right: Any, address: int = 0) -> list[tuple[int, int]]:
+    """Find runs of differing bytes in two equally sized buffers.
+
+    Args:
+        left: Buffer supporting the buffer protocol.
+        right: Buffer of the same length as ``left``.
+        address: Address of the first byte, added to all reported ranges.
+
+    Returns:
+        List of ``(address, length)`` tuples, one per run of mismatching bytes.
+    """
+    left = memoryview(left).cast("B")
+    right = memoryview(right).cast("B")
+    result: list[tuple[int, int]] = []
+    for offset in range(0, len(left), _COMPARE_CHUNK):
+        lhs = left[offset : offset + _COMPARE_CHUNK].tobytes()
+        rhs = right[offset : offset + _COMPARE_CHUNK].tobytes()
+        if lhs == rhs:
+            continue
+        # XOR the chunks as big integers; differing bytes become non-zero bytes.
+        diff = (int.from_bytes(lhs, "little") ^ int.from_bytes(rhs, "little")).to_bytes(len(lhs), "little")
+        for match in _NONZERO_RUN.finditer(diff):
+            start = address + offset + match.start()
+            if result and result[-1][0] + result[-1][1] == start:  # Run crosses a chunk boundary.
+                result[-1] = (result[-1][0], result[-1][1] + match.end() - match.start())
+            else:
+                result.append((start, match.end() - match.start()))
+    return result
+
+
+def _coalesce_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Merge adjacent ``(address, length)`` ranges; input must be sorted."""
+    result: list[tuple[int, int]] = []
+    for address, length in ranges:
+        if length <= 0:
+            continue
+        if result and result[-1][0] + result[-1][1] == address:
+            result[-1] = (result[-1][0], result[-1][1] + length)
+        else:
+            result.append((address, length))
+    return result
+
+
+_REPR: reprlib.Repr | None = None
+
+
+def _get_repr() -> reprlib.Repr:
+    """Return the shared, lazily created formatter used by ``Section.__repr__``."""
+    global _REPR
+    if _REPR is None:
+        _REPR = reprlib.Repr()
+        _REPR.maxstring = 64
+        _REPR.maxother = 64
+    return _REPR
 
 
 def _data_converter(data: str | bytearray | array | Any) -> bytearray:
@@ -388,6 +479,7 @@ def _data_converter(data: str | bytearray | array | Any) -> bytearray:
 
 def fortran_array_from_buffer(arr: bytearray, shape: tuple, dtype: Any) -> np.ndarray:
     """Reconstruct a Fortran-ordered numpy array from a byte buffer."""
+    np = _numpy()
     dt = np.dtype(dtype)
     if len(shape) <= 2:
         # Historic tests pass shape in column-major order for 2D arrays.
@@ -448,6 +540,7 @@ def _asam_alternate_x_to_buffer(arr: np.ndarray, x_axis: np.ndarray | None, axis
     Raises:
         ValueError: If *arr* is not 2-D or *x_axis* length mismatches number of columns.
     """
+    np = _numpy()
     if arr.ndim != 2:
         raise ValueError("ALTERNATE_WITH_X only supports 2-D arrays (maps)")
     num_y, num_x = arr.shape
@@ -482,6 +575,7 @@ def _asam_alternate_x_from_buffer(
     Raises:
         ValueError: If *numpy_shape* is not 2-D.
     """
+    np = _numpy()
     if len(numpy_shape) != 2:
         raise ValueError("ALTERNATE_WITH_X only supports 2-D shapes")
     num_y, num_x = numpy_shape
@@ -517,6 +611,7 @@ def _asam_alternate_y_to_buffer(arr: np.ndarray, y_axis: np.ndarray | None, axis
     Raises:
         ValueError: If *arr* is not 2-D or *y_axis* length mismatches number of rows.
     """
+    np = _numpy()
     if arr.ndim != 2:
         raise ValueError("ALTERNATE_WITH_Y only supports 2-D arrays (maps)")
     num_y, num_x = arr.shape
@@ -551,6 +646,7 @@ def _asam_alternate_y_from_buffer(
     Raises:
         ValueError: If *numpy_shape* is not 2-D.
     """
+    np = _numpy()
     if len(numpy_shape) != 2:
         raise ValueError("ALTERNATE_WITH_Y only supports 2-D shapes")
     num_y, num_x = numpy_shape
@@ -585,6 +681,7 @@ def _asam_column_dir_from_buffer(data: bytes, numpy_shape: tuple, dtype: Any) ->
     Returns:
         NumPy array with the specified shape.
     """
+    np = _numpy()
     dt = np.dtype(dtype)
     flat = np.frombuffer(data, dtype=dt)
 
@@ -693,14 +790,15 @@ class Section:
         are equal if they have the same start address, data, and name.
     """
 
+    __slots__ = ("_start_address", "_data", "name", "_parent_image", "_digests", "_checksum_trackers")
+
     def __init__(self, start_address: int = 0, data: Any = None, name: str = ""):
         self._start_address = start_address
+        self._parent_image = None
+        self._digests = None
+        self._checksum_trackers = None
         self.data = _data_converter(data if data is not None else bytearray())
         self.name = name
-        self._parent_image = None
-        self.repr = reprlib.Repr()
-        self.repr.maxstring = 64
-        self.repr.maxother = 64
 
     @property
     def start_address(self) -> int:
@@ -715,6 +813,121 @@ class Section:
         if hasattr(self, "_parent_image") and self._parent_image:
             self._parent_image._validate_address_change(self, value)
         self._start_address = value
+        if self._parent_image is not None:
+            self._parent_image._touch()
+
+    @property
+    def data(self) -> bytearray:
+        """Section contents.
+
+        Modifying the buffer in-place (``section.data[i] = x``) bypasses the
+        caches of :meth:`digest` and :meth:`checksum`; use the ``write*``
+        methods, or assign a new buffer, to keep them valid.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: bytearray) -> None:
+        self._data = value
+        self._touch()
+
+    def _touch(self, offset: int = 0, length: int | None = None) -> None:
+        """Invalidate cached digests and checksums after the contents have been modified.
+
+        Called by all write methods; code mutating :attr:`data` in-place
+        must call it itself.
+
+        Args:
+            offset: Offset of the modified range
+            length: Length of the modified range (``None``: everything)
+        """
+        self._digests = None
+        if self._checksum_trackers:
+            for tracker in self._checksum_trackers.values():
+                tracker.invalidate(offset, length)
+        if self._parent_image is not None:
+            self._parent_image._touch()
+
+    def track_checksum(self, algo: str = "CHK_CRC_32", block_size: int = 4096) -> None:
+        """Enable incremental checksum tracking for :meth:`checksum`.
+
+        The section data is split into blocks of ``block_size`` bytes whose
+        checksums are cached; writes only invalidate the blocks they touch.
+        Recomputing a checksum after a small edit then costs O(dirty blocks)
+        instead of a pass over the whole region.
+
+        Args:
+            algo: ``CHK_CRC_32`` or one of the additive ``CHK_ADD_*`` algorithms
+            block_size: Block size in bytes (multiple of 4)
+
+        Raises:
+            NotImplementedError: If ``algo`` can't be combined block-wise
+
+        Example::
+
+            section = Section(0x1000, bytearray(4 * 1024 * 1024))
+            section.track_checksum("CHK_CRC_32")
+            section.checksum("CHK_CRC_32")        # full pass, fills block cache
+            section.write(0x1010, b"\x42")
+            section.checksum("CHK_CRC_32")        # rehashes a single block
+        """
+        if self._checksum_trackers is None:
+            self._checksum_trackers = {}
+        self._checksum_trackers[algo] = checksums.BlockChecksums(algo, block_size)
+
+    def checksum(self, algo: str = "CHK_CRC_32", addr: int | None = None, length: int | None = None) -> int:
+        """Calculate a checksum over (a range of) the section.
+
+        Uses the block cache set up by :meth:`track_checksum` if available.
+
+        Args:
+            algo: Algorithm name, see :data:`objutils.checksums.ALGO`
+            addr: Absolute start address (default: start of section)
+            length: Number of bytes (default: up to the end of section)
+
+        Returns:
+            Checksum value
+
+        Raises:
+            InvalidAddressError: If the range exceeds the section
+        """
+        if addr is None:
+            addr = self.start_address
+        offset = addr - self.start_address
+        if length is None:
+            length = self.length - offset
+        if offset < 0 or length < 0 or offset + length > self.length:
+            raise InvalidAddressError(f"checksum(0x{addr:08x}) access out of bounds.")
+        tracker = self._checksum_trackers.get(algo) if self._checksum_trackers else None
+        if tracker is not None:
+            return tracker.checksum(self.data, offset, length)
+        view = memoryview(self.data)[offset : offset + length]
+        if algo == "CHK_CRC_32":
+            return checksums.crc32_parallel(view)
+        return checksums.check(view, algo)
+
+    def digest(self, algo: str = "blake2b") -> bytes:
+        """Compute a cryptographic digest of the section data.
+
+        The result is cached until the section is written to.
+
+        Args:
+            algo: Any algorithm name accepted by :func:`hashlib.new`
+
+        Returns:
+            Digest of :attr:`data` (the start address is not included)
+
+        Example::
+
+            section = Section(0x1000, b"Hello")
+            section.digest().hex()
+        """
+        if self._digests is None:
+            self._digests = {}
+        result = self._digests.get(algo)
+        if result is None:
+            result = self._digests[algo] = hashlib.new(algo, self.data).digest()
+        return result
 
     def __post_init__(self):
         # We handle initialization in __init__ now.
@@ -813,6 +1026,7 @@ class Section:
         return f"{internal_dtype}_{ASAM_ENDIAN_FOR_BYTEORDER[asam_byte_order]}"
 
     def _numpy_dtype_from_internal(self, dtype: str) -> np.dtype:
+        np = _numpy()
         type_, byte_order = self._verify_dtype(dtype)
         return np.dtype(type_).newbyteorder(BYTEORDER[byte_order])
 
@@ -880,6 +1094,7 @@ class Section:
         if offset + length > self.length:
             raise InvalidAddressError(f"write(0x{addr:08x}) access out of bounds.")
         self.data[offset : offset + length] = data
+        self._touch(offset, length)
 
     def read_numeric(self, addr: int, dtype: str, **kws) -> int | float:
         """Read a single numeric value with explicit endianness.
@@ -979,6 +1194,7 @@ class Section:
             bit_mask = kws.pop("bit_mask")  # noqa: F841
 
         self.data[offset : offset + data_size] = struct.pack(fmt, value)
+        self._touch(offset, data_size)
 
     def read_numeric_array(self, addr: int, length: int, dtype: str, **kws) -> list[int] | list[float]:
         offset = addr - self.start_address
@@ -1145,6 +1361,7 @@ class Section:
             raise InvalidAddressError(f"write_asam_string(0x{addr:08x}) access out of bounds.")
         self.data[offset : offset + len(encoded)] = encoded
         self.data[offset + len(encoded) : offset + total_length] = terminator
+        self._touch(offset, total_length)
 
     def write_numeric_array(self, addr: int, data: list[int] | list[float], dtype: str, **kws) -> None:
         if not hasattr(data, "__iter__"):
@@ -1158,6 +1375,7 @@ class Section:
         if offset + data_size > self.length:
             raise InvalidAddressError(f"write_numeric_array(0x{addr:08x}) access out of bounds.")
         self.data[offset : offset + data_size] = struct.pack(fmt, *data)
+        self._touch(offset, data_size)
 
     def read_string(self, addr: int, encoding: str = "latin1", length: int = -1, **kws) -> str:
         """Read a null-terminated or fixed-length string from section.
@@ -1230,9 +1448,11 @@ class Section:
             raise InvalidAddressError(f"write_string(0x{addr:08x}) access out of bounds.")
         self.data[offset : offset + len(value)] = bytes(value, encoding=encoding)
         self.data[offset + len(value)] = 0
+        self._touch(offset, self.length - offset)  # Encoded length may differ from len(value).
 
     def write_ndarray(self, addr: int, array: np.ndarray, order: str = None, **kws) -> None:
         """ """
+        np = _numpy()
         offset = addr - self.start_address
         if offset < 0:
             raise InvalidAddressError(f"write_ndarray(0x{addr:08x}) access out of bounds.")
@@ -1245,6 +1465,7 @@ class Section:
             self.data[offset : offset + data_size] = fortran_array_to_buffer(array=array)
         else:
             self.data[offset : offset + data_size] = array.tobytes()
+        self._touch(offset, data_size)
 
     def write_asam_ndarray(
         self,
@@ -1285,6 +1506,7 @@ class Section:
             TypeError: If *array* is not an ndarray.
             ValueError: If *index_mode* is unsupported.
         """
+        np = _numpy()
         if not isinstance(array, np.ndarray):
             raise TypeError("array must be of type numpy.ndarray.")
         if index_mode not in ASAM_INDEX_MODES:
@@ -1337,6 +1559,7 @@ class Section:
 
     def read_ndarray(self, addr: int, length: int, dtype: str, shape: tuple = None, order: str = None, **kws) -> np.ndarray:
         """ """
+        np = _numpy()
         offset = addr - self.start_address
         if offset < 0:
             raise InvalidAddressError(f"read_ndarray(0x{addr:08x}) access out of bounds.")
@@ -1408,6 +1631,7 @@ class Section:
             ValueError: If *index_mode* is unsupported, or if a 2-D shape is
                 not provided for ALTERNATE modes.
         """
+        np = _numpy()
         if index_mode not in ASAM_INDEX_MODES:
             raise ValueError(f"Unsupported index_mode {index_mode!r}; " f"use one of {sorted(ASAM_INDEX_MODES)}.")
 
@@ -1492,12 +1716,123 @@ class Section:
         pass
     """
 
-    def find(self, expr: str, addr: int = -1) -> int:
-        for item in re.finditer(bytes(expr), self.data):
-            yield (self.start_address + item.start(), item.end() - item.start())
+    def fill(self, value: int = 0, start: int | None = None, length: int | None = None) -> None:
+        """Fill a range of the section with a constant byte value.
+
+        Args:
+            value: Fill byte (0 <= value <= 255)
+            start: Absolute start address (default: start of section)
+            length: Number of bytes to fill (default: up to the end of section)
+
+        Raises:
+            ValueError: If ``value`` is out of range
+            InvalidAddressError: If the range exceeds the section
+
+        Example::
+
+            section = Section(0x1000, bytearray(16))
+            section.fill(0xFF)                 # whole section
+            section.fill(0x00, 0x1004, 4)      # 0x1004..0x1007
+        """
+        if not isinstance(value, int):
+            raise TypeError("value must be of type int")
+        if not (0 <= value < 256):
+            raise ValueError("value must be between 0 and 255")
+        if start is None:
+            start = self.start_address
+        offset = start - self.start_address
+        if length is None:
+            length = self.length - offset
+        if offset < 0 or length < 0 or offset + length > self.length:
+            raise InvalidAddressError(f"fill(0x{start:08x}) access out of bounds.")
+        if length:
+            self.data[offset : offset + length] = bytes((value,)) * length
+            self._touch(offset, length)
+
+    def find(self, pattern: bytes | str | int, addr: int | None = None) -> int:
+        """Find the first occurrence of a byte pattern.
+
+        Args:
+            pattern: Bytes to search for; strings are ``latin1`` encoded,
+                an integer denotes a single byte
+            addr: Absolute address to start searching at (default: start of section)
+
+        Returns:
+            Absolute address of the first match, or -1 if not found
+
+        Example::
+
+            section = Section(0x1000, b"Hello World")
+            section.find(b"World")  # 0x1006
+        """
+        pattern = _pattern_to_bytes(pattern)
+        offset = 0 if addr is None else max(addr - self.start_address, 0)
+        pos = self.data.find(pattern, offset)
+        return -1 if pos == -1 else self.start_address + pos
+
+    def find_all(self, pattern: bytes | str | int) -> list[int]:
+        """Find all (possibly overlapping) occurrences of a byte pattern.
+
+        Args:
+            pattern: Bytes to search for (see :meth:`find`)
+
+        Returns:
+            Sorted list of absolute addresses of all matches
+
+        Example::
+
+            section = Section(0x1000, b"abcabc")
+            section.find_all(b"abc")  # [0x1000, 0x1003]
+        """
+        pattern = _pattern_to_bytes(pattern)
+        data = self.data
+        result = []
+        pos = data.find(pattern)
+        while pos != -1:
+            result.append(self.start_address + pos)
+            pos = data.find(pattern, pos + 1)
+        return result
+
+    def compare(self, other: "Section | bytes | bytearray") -> list[tuple[int, int]]:
+        """Compare section contents with another section or buffer.
+
+        Sections are compared address by address, plain buffers are taken
+        to start at :attr:`start_address`. Addresses of this section not
+        covered by ``other`` count as mismatches.
+
+        Args:
+            other: Section or bytes-like object to compare with
+
+        Returns:
+            List of ``(address, length)`` tuples of mismatching ranges;
+            empty if contents are equal
+
+        Example::
+
+            a = Section(0x1000, b"Hello World")
+            b = Section(0x1000, b"Hello_Worl!")
+            a.compare(b)  # [(0x1005, 1), (0x100a, 1)]
+        """
+        if isinstance(other, Section):
+            other_start, other_data = other.start_address, other.data
+        else:
+            other_start, other_data = self.start_address, other
+        end = self.start_address + self.length
+        lower = max(self.start_address, other_start)
+        upper = min(end, other_start + len(other_data))
+        if lower >= upper:
+            return _coalesce_ranges([(self.start_address, self.length)])
+        left = memoryview(self.data)[lower - self.start_address : upper - self.start_address]
+        right = memoryview(other_data)[lower - other_start : upper - other_start]
+        ranges = [(self.start_address, lower - self.start_address)]
+        ranges.extend(_mismatch_ranges(left, right, lower))
+        ranges.append((upper, end - upper))
+        return _coalesce_ranges(ranges)
 
     def __repr__(self) -> str:
-        return f"Section(address = 0X{self.start_address:08X}, length = {self.length:d}, data = {self.repr.repr(bytes(self.data))})"
+        return (
+            f"Section(address = 0X{self.start_address:08X}, length = {self.length:d}, data = {_get_repr().repr(bytes(self.data))})"
+        )
 
     def __len__(self) -> int:
         return len(self.data)
@@ -1541,12 +1876,17 @@ class LazySection(Section):
     everything into RAM. This is more efficient for very large files.
     """
 
+    __slots__ = ("filename", "_file")
+
     def __init__(self, start_address: int, filename: str, offset: int = 0, length: int = -1, name: str = ""):
         import mmap
         import os
 
         self._start_address = start_address
         self.name = name
+        self._parent_image = None
+        self._digests = None
+        self._checksum_trackers = None
         self.filename = filename
         self._file = open(filename, "rb")
         if length == -1:
@@ -1573,6 +1913,9 @@ class LazySection(Section):
     def write_ndarray(self, addr: int, array: np.ndarray, order: str = None, **kws) -> None:
         raise NotImplementedError("LazySection is read-only")
 
+    def fill(self, value: int = 0, start: int | None = None, length: int | None = None) -> None:
+        raise NotImplementedError("LazySection is read-only")
+
     def __del__(self):
         """Close memory-mapped file when section is destroyed."""
         try:
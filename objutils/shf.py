@@ -75,6 +75,7 @@ class Reader:
     """ """
 
     logger = Logger(__name__)
+    SIGNATURES = (b"<?xml", b"<dump")
 
     def load(self, fp, join: bool = False, **kws: Any):
         if isinstance(fp, str):
@@ -57,6 +57,7 @@ class Reader(hexfile.Reader):
     """
 
     FORMAT_SPEC = ((DATA, ":AAAALLBBDDCC"), (EOF, ":00"))
+    SIGNATURES = (b":",)
 
     def check_line(self, line: Any, format_type: int) -> None:
         """Validate Signetics record checksums.
@@ -94,6 +94,7 @@ class Reader(hexfile.Reader):
         (S8, "S8LLAAAAAACC"),
         (S9, "S9LLAAAACC"),
     )
+    SIGNATURES = tuple(b"S%d" % n for n in range(10))
 
     def load(self, fp: Any, join: bool = True, **kws: Any) -> Any:
         """Load and parse S-Record file.
@@ -58,6 +58,7 @@ class Reader(hexfile.Reader):
     """
 
     FORMAT_SPEC = ((DATA, "/AAAALLBBDDCC"), (EOF, "/AAAA00BB"))
+    SIGNATURES = (b"/",)
 
     def check_line(self, line: Any, format_type: int) -> None:
         """Validate Tektronix record checksums.
@@ -1,3 +1,5 @@
+import zlib
+
 import pytest
 
 from objutils.checksums import (
@@ -6,7 +8,13 @@ from objutils.checksums import (
     COMPLEMENT_TWOS,
     ROTATE_LEFT,
     ROTATE_RIGHT,
+    BlockChecksums,
+    Crc,
     check,
+    crc32_combine,
+    crc32_fill,
+    crc32_parallel,
+    new,
     lrc,
     nibble_sum,
     rotatedXOR,
@@ -263,3 +271,197 @@ def testCrc32():
 def testUserDefined():
     with pytest.raises(NotImplementedError):
         check(TEST, "CHK_USER_DEFINED")
+
+
+def test_crc32_combine():
+    first = bytes(range(256)) * 3
+    second = bytes(range(7, 250))
+    assert crc32_combine(zlib.crc32(first), zlib.crc32(second), len(second)) == zlib.crc32(first + second)
+    assert crc32_combine(zlib.crc32(first), 0, 0) == zlib.crc32(first)
+
+
+@pytest.mark.parametrize("algo", ["CHK_CRC_32", "CHK_ADD_11", "CHK_ADD_14", "CHK_ADD_22", "CHK_ADD_44"])
+def test_block_checksums(algo):
+    data = bytearray(bytes(range(256)) * 80 + b"tail")
+    tracker = BlockChecksums(algo, block_size=1024)
+    assert tracker.checksum(data) == check(data, algo)
+    assert tracker.checksum(data, 4, 8000) == check(data[4:8004], algo)
+    data[3000:3004] = b"ABCD"
+    tracker.invalidate(3000, 4)
+    assert tracker.checksum(data) == check(data, algo)
+
+
+def test_block_checksums_unsupported():
+    with pytest.raises(NotImplementedError):
+        BlockChecksums("CHK_CRC_16")
+
+
+@pytest.mark.parametrize(
+    "width, poly, init, refin, refout, xorout, expected",
+    [
+        (8, 0x07, 0x00, False, False, 0x00, 0xF4),  # CRC-8
+        (16, 0x1021, 0x0000, False, False, 0x0000, 0x31C3),  # CRC-16/XMODEM
+        (16, 0x1021, 0x0000, True, True, 0x0000, 0x2189),  # CRC-16/KERMIT
+        (16, 0x8005, 0xFFFF, True, True, 0x0000, 0x4B37),  # CRC-16/MODBUS
+        (32, 0x04C11DB7, 0xFFFFFFFF, False, False, 0xFFFFFFFF, 0xFC891918),  # CRC-32/BZIP2
+        (32, 0x04C11DB7, 0xFFFFFFFF, True, True, 0xFFFFFFFF, 0xCBF43926),  # CRC-32
+        (5, 0x05, 0x1F, True, True, 0x1F, 0x19),  # CRC-5/USB
+        (7, 0x09, 0x00, False, False, 0x00, 0x75),  # CRC-7/MMC
+        (12, 0x80F, 0x000, False, True, 0x000, 0xDAF),  # CRC-12/3GPP
+        (64, 0x42F0E1EBA9EA3693, 0, False, False, 0, 0x6C40DF5F0B497347),  # CRC-64/ECMA-182
+    ],
+)
+def test_crc_engine_catalogue(width, poly, init, refin, refout, xorout, expected):
+    assert Crc(width, poly, init, refin, refout, xorout)(b"123456789") == expected
+
+
+def test_user_defined_crc():
+    params = dict(width=16, poly=0x8005, init=0xFFFF, refin=True, refout=True)
+    assert check(b"123456789", "CHK_USER_DEFINED", **params) == 0x4B37
+    assert check(list(b"123456789"), "CHK_USER_DEFINED", **params) == 0x4B37
+
+
+@pytest.mark.parametrize(
+    "algo",
+    [
+        "CHK_ADD_11",
+        "CHK_ADD_12",
+        "CHK_ADD_14",
+        "CHK_ADD_22",
+        "CHK_ADD_24",
+        "CHK_ADD_44",
+        "CHK_ADD_22_BE",
+        "CHK_ADD_24_BE",
+        "CHK_ADD_44_BE",
+        "CHK_CRC_8",
+        "CHK_CRC_16",
+        "CHK_CRC_16_CCITT",
+        "CHK_CRC_32",
+        "CHK_CRC_64",
+    ],
+)
+def test_buffer_and_list_results_agree(algo):
+    # Buffers take the native path (if the extension is built), lists the pure Python one.
+    data = bytes(range(256)) * 9 + b"\x12\x34\x56\x78"
+    expected = check(list(data), algo)
+    assert check(data, algo) == expected
+    assert check(bytearray(data), algo) == expected
+    assert check(memoryview(data), algo) == expected
+
+
+@pytest.mark.parametrize(
+    "algo", ["CHK_ADD_11", "CHK_ADD_24", "CHK_ADD_44_BE", "CHK_CRC_8", "CHK_CRC_16", "CHK_CRC_32", "CHK_CRC_64"]
+)
+def test_non_contiguous_buffer(algo):
+    # Strided views can't be passed to the native kernels or zlib without a copy.
+    data = bytes(range(256)) * 9
+    strided = memoryview(data)[::2]
+    assert check(strided, algo) == check(data[::2], algo)
+    crc = new(algo)
+    crc.update(strided)
+    assert crc.digest() == check(data[::2], algo)
+
+
+def test_crc8_crc64():
+    assert check(b"123456789", "CHK_CRC_8") == 0xF4
+    assert check(b"123456789", "CHK_CRC_64") == 0x995DC9BBDF1939FA
+
+
+def test_native_kernels():
+    ext = pytest.importorskip("objutils.hexfiles_ext")
+    assert ext.CrcEngine(16, 0x1021, 0xFFFF)(b"123456789") == 0x29B1
+    assert ext.word_sum(b"\x01\x02\x03\x04", 2, 16, True) == 0x0604
+    assert ext.word_sum(b"\x01\x02\x03\x04", 2, 16, False) == 0x0406
+    assert ext.word_sum(b"\x01\x02\x03", 2, 16) == 0x0204
+    for width in (0, 65):
+        with pytest.raises(ValueError):
+            ext.CrcEngine(width, 0x07, 0)
+
+
+@pytest.mark.parametrize(
+    "algo, expected",
+    [
+        ("CHK_ADD_22", 0x0604),
+        ("CHK_ADD_22_BE", 0x0406),
+        ("CHK_ADD_24", 0x0604),
+        ("CHK_ADD_44", 0x04030201),
+        ("CHK_ADD_44_BE", 0x01020304),
+    ],
+)
+def test_word_sums_byteorder(algo, expected):
+    assert check(b"\x01\x02\x03\x04", algo) == expected
+
+
+@pytest.mark.parametrize(
+    "algo, expected",
+    [
+        ("CHK_ADD_22", 0x0604 + 0x05),
+        ("CHK_ADD_22_BE", 0x0406 + 0x0500),
+        ("CHK_ADD_44", 0x04030201 + 0x0605),
+        ("CHK_ADD_44_BE", 0x01020304 + 0x05060000),
+    ],
+)
+def test_word_sums_partial_tail(algo, expected):
+    frame = b"\x01\x02\x03\x04\x05" if algo.startswith("CHK_ADD_22") else b"\x01\x02\x03\x04\x05\x06"
+    assert check(frame, algo) == expected
+    assert check(list(frame), algo) == expected
+
+
+@pytest.mark.parametrize(
+    "algo",
+    [
+        "CHK_ADD_11",
+        "CHK_ADD_14",
+        "CHK_ADD_22",
+        "CHK_ADD_44",
+        "CHK_ADD_24_BE",
+        "CHK_CRC_8",
+        "CHK_CRC_16",
+        "CHK_CRC_16_CCITT",
+        "CHK_CRC_32",
+        "CHK_CRC_64",
+    ],
+)
+def test_incremental_checksum(algo):
+    data = bytes(range(256)) * 5 + b"\x01\x02\x03"
+    crc = new(algo)
+    for idx in range(0, len(data), 37):
+        crc.update(data[idx : idx + 37])
+    assert crc.digest() == check(data, algo)
+    partial = new(algo, list(data[:3]))
+    copied = partial.copy()
+    partial.update(memoryview(data)[3:])
+    assert partial.digest() == check(data, algo)
+    assert copied.digest() == check(data[:3], algo)
+
+
+def test_incremental_user_defined():
+    crc = new("CHK_USER_DEFINED", width=7, poly=0x09)
+    crc.update(b"12345")
+    crc.update(b"6789")
+    assert crc.digest() == 0x75
+    assert crc.hexdigest() == "75"
+    with pytest.raises(NotImplementedError):
+        new("CHK_USER_DEFINED")
+    with pytest.raises(NotImplementedError):
+        new("CHK_FOO")
+
+
+def test_crc32_parallel():
+    data = bytes(range(256)) * 1000 + b"odd tail"
+    assert crc32_parallel(data, workers=4, chunk_size=10000) == zlib.crc32(data)
+    assert crc32_parallel(bytearray(data), workers=3, chunk_size=4096) == zlib.crc32(data)
+    assert crc32_parallel(data[:100], workers=4) == zlib.crc32(data[:100])
+
+
+def test_crc32_fill():
+    for count in (0, 1, 5, 4096, 100003):
+        assert crc32_fill(0xFF, count) == zlib.crc32(b"\xff" * count)
+
+
+@pytest.mark.parametrize("algo", ["CHK_CRC_32", "CHK_CRC_16", "CHK_ADD_11", "CHK_ADD_24", "CHK_ADD_44_BE"])
+def test_incremental_update_fill(algo):
+    crc = new(algo, b"abc")
+    crc.update_fill(0x5A, 70001)
+    crc.update(b"xy")
+    assert crc.digest() == check(b"abc" + b"\x5a" * 70001 + b"xy", algo)
@@ -10,6 +10,7 @@ Based on the actual ElfParser API which uses:
 """
 
 import collections
+import hashlib
 import tempfile
 from pathlib import Path
 
@@ -32,6 +33,16 @@ def sample_elf_path():
     return EXAMPLES_DIR / "avr.elf"
 
 
+@pytest.fixture
+def temp_elf(sample_elf_path, tmp_path):
+    """Provide a private copy of the sample ELF file."""
+    import shutil
+
+    temp_elf = tmp_path / "test.elf"
+    shutil.copy(sample_elf_path, temp_elf)
+    return temp_elf
+
+
 @pytest.fixture
 def parser(sample_elf_path):
     """Create ElfParser instance for testing."""
@@ -262,6 +273,360 @@ class TestElfDatabase:
         assert parser.session is not None
 
 
+class TestElfCacheValidation:
+    """Test .prgdb cache validation (cheap key first, SHA512 only as fallback)."""
+
+    @pytest.fixture
+    def hash_calls(self, monkeypatch):
+        import objutils.elf
+
+        calls = []
+        original = objutils.elf.calculate_crypto_hash
+
+        def counting_hash(data):
+            calls.append(len(data))
+            return original(data)
+
+        monkeypatch.setattr(objutils.elf, "calculate_crypto_hash", counting_hash)
+        return calls
+
+    @staticmethod
+    def _open(path, **kws):
+        parser = ElfParser(str(path), **kws)
+        try:
+            return parser.e_shnum
+        finally:
+            parser.close()
+
+    def test_reopen_skips_full_hash(self, temp_elf, hash_calls):
+        self._open(temp_elf)
+        hash_calls.clear()
+        self._open(temp_elf)
+        assert hash_calls == []
+
+    def test_touch_falls_back_to_full_hash_once(self, temp_elf, hash_calls):
+        import os
+
+        self._open(temp_elf)
+        os.utime(temp_elf, ns=(0, 1_000_000_000))
+        hash_calls.clear()
+        self._open(temp_elf)
+        assert len(hash_calls) == 1
+        hash_calls.clear()
+        self._open(temp_elf)  # Refreshed key, no more hashing.
+        assert hash_calls == []
+
+    def test_verify_hash_opt_in(self, temp_elf, hash_calls):
+        self._open(temp_elf)
+        hash_calls.clear()
+        self._open(temp_elf, verify_hash=True)
+        assert len(hash_calls) == 1
+
+    def test_modified_file_rebuilds(self, temp_elf):
+        from objutils.elf import model
+
+        self._open(temp_elf)
+        data = bytearray(temp_elf.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        temp_elf.write_bytes(data)
+        parser = ElfParser(str(temp_elf))
+        try:
+            meta = parser.session.query(model.Meta).first()
+            assert meta.hash_value == hashlib.sha512(data).hexdigest()
+        finally:
+            parser.close()
+
+    def test_validation_key_tracks_header_tables(self, temp_elf):
+        from objutils.elf import calculate_validation_key
+
+        data = temp_elf.read_bytes()
+        key = calculate_validation_key(data, temp_elf)
+        size, _, _, sample = key.split(":")
+        assert int(size) == len(data)
+        patched = bytearray(data)
+        patched[0x12] ^= 0xFF  # e_machine
+        assert calculate_validation_key(bytes(patched), temp_elf).split(":")[3] != sample
+
+
+def _open_in_worker(path):
+    """Open `path` and load its symbols (runs in a separate process)."""
+    import os
+
+    from objutils.elf import model
+
+    parser = ElfParser(path)
+    try:
+        parser.symbols.fetch()
+        session = parser.db.session
+        return os.stat(parser.db_name).st_ino, session.query(model.Elf_Section).count(), session.query(model.Elf_Symbol).count()
+    finally:
+        parser.close()
+
+
+class TestElfSharedCache:
+    """Test concurrent use of one .prgdb (lock, temp file + rename, WAL)."""
+
+    def test_concurrent_open_builds_once(self, temp_elf, sample_elf_path):
+        import multiprocessing
+
+        reference = ElfParser(str(sample_elf_path), in_memory=True, lazy=False)
+        try:
+            num_symbols = len(reference.symbols.fetch(group_by_section=False))
+        finally:
+            reference.close()
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            results = pool.map(_open_in_worker, [str(temp_elf)] * 4)
+        # One database file, symbols loaded once.
+        assert len(set(results)) == 1
+        assert results[0][2] == num_symbols
+        assert sorted(p.name for p in temp_elf.parent.iterdir()) == ["test.elf", "test.prgdb", "test.prgdb.lock"]
+
+    def test_phase_loaded_by_other_parser(self, temp_elf):
+        from objutils.elf import model
+
+        first = ElfParser(str(temp_elf))
+        second = ElfParser(str(temp_elf))
+        try:
+            num_sections = len(first.sections.fetch())
+            assert len(second.sections.fetch()) == num_sections
+            assert second.db.session.query(model.Elf_Section).count() == num_sections
+        finally:
+            first.close()
+            second.close()
+
+    def test_rebuild_replaces_database(self, temp_elf):
+        from sqlalchemy import text
+
+        from objutils.elf import model
+
+        reader = ElfParser(str(temp_elf))
+        num_sections = len(reader.sections.fetch())
+        data = bytearray(temp_elf.read_bytes())
+        data[len(data) // 2] ^= 0xFF
+        temp_elf.write_bytes(data)
+        parser = ElfParser(str(temp_elf))
+        try:
+            assert parser.session.query(model.Meta).first().hash_value == hashlib.sha512(data).hexdigest()
+            assert parser.session.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # The reader's open transaction keeps its snapshot; it can't load further phases.
+            assert reader.db.session.query(model.Elf_Section).count() == num_sections
+            with pytest.raises(ValueError, match="rebuilt"):
+                reader.load_phases("symbols")
+        finally:
+            parser.close()
+            reader.close()
+        assert not list(temp_elf.parent.glob("*.tmp"))
+
+    def test_rebuild_while_other_process_reads(self, temp_elf):
+        import multiprocessing
+        import sqlite3
+
+        from objutils.elf.synthetic import make_elf
+
+        db_name = temp_elf.with_suffix(".prgdb")
+        ElfParser(str(temp_elf)).close()
+        reader = sqlite3.connect(db_name)
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            try:
+                # A read transaction pins the WAL, so the symbols loaded next stay in it.
+                reader.execute("BEGIN")
+                reader.execute("SELECT COUNT(*) FROM meta").fetchone()
+                pool.apply(_open_in_worker, (str(temp_elf),))
+                symbols = make_elf(temp_elf, num_sections=20, num_symbols=500)
+                _, num_sections, num_symbols = pool.apply(_open_in_worker, (str(temp_elf),))
+            finally:
+                reader.close()
+        assert (num_sections, num_symbols) == (20 + 4, len(symbols) + 1)
+        check = sqlite3.connect(db_name)
+        try:
+            assert check.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+        finally:
+            check.close()
+        parser = ElfParser(str(temp_elf))
+        try:
+            assert len(parser.symbols.fetch(group_by_section=False)) == len(symbols) + 1
+        finally:
+            parser.close()
+
+
+class TestElfOffsetOnlyImages:
+    """Test databases built with store_images=False (images served from the ELF file)."""
+
+    def test_no_blobs_stored(self, temp_elf):
+        from objutils.elf import model
+
+        parser = ElfParser(str(temp_elf), store_images=False)
+        try:
+            query = parser.query(model.Elf_Section).filter(model.Elf_Section.section_image.isnot(None))
+            assert query.count() == 0
+        finally:
+            parser.close()
+
+    def test_images_match_stored_blobs(self, temp_elf, sample_elf_path):
+        parser = ElfParser(str(temp_elf), store_images=False)
+        reference = ElfParser(str(sample_elf_path), in_memory=True)
+        try:
+            expected = {s.section_name: s.section_image for s in reference.sections.fetch()}
+            assert {s.section_name: s.section_image for s in parser.sections.fetch()} == expected
+            image = parser.create_image()
+            expected_image = reference.create_image()
+            assert [(s.start_address, s.tobytes()) for s in image] == [(s.start_address, s.tobytes()) for s in expected_image]
+        finally:
+            parser.close()
+            reference.close()
+
+    def test_open_program_database_serves_images(self, temp_elf):
+        from objutils.elf import model, open_program_database
+
+        parser = ElfParser(str(temp_elf), store_images=False)
+        expected = {s.section_name: s.section_image for s in parser.sections.fetch()}
+        parser.close()
+        db = open_program_database(temp_elf.with_suffix(".prgdb"))
+        try:
+            assert {s.section_name: s.section_image for s in db.session.query(model.Elf_Section)} == expected
+        finally:
+            db.close()
+
+    def test_closing_database_keeps_parser_mapping(self, temp_elf):
+        parser = ElfParser(str(temp_elf), store_images=False)
+        try:
+            parser.db.close()
+            assert bytes(parser.fp[:4]) == b"\x7fELF"
+        finally:
+            parser.close()
+
+
+class TestElfLazyPhases:
+    """Test on-demand parsing phases (lazy=True)."""
+
+    @staticmethod
+    def _phases(parser):
+        from objutils.elf import model
+
+        return parser.db.session.query(model.Meta).first().phases.split(",")
+
+    @staticmethod
+    def _snapshot(parser):
+        return (
+            [(s.section_name, s.section_image) for s in parser.sections.fetch()],
+            [(s.symbol_name, s.st_value, s.section_name) for s in parser.symbols.fetch(group_by_section=False)],
+            [(s.p_type, s.p_offset, s.p_filesz) for s in parser.segments],
+            parser.comment,
+            [(n.name, n.desc) for n in parser.notes],
+        )
+
+    def test_header_only_on_open(self, temp_elf):
+        from objutils.elf import model
+
+        parser = ElfParser(str(temp_elf))
+        try:
+            assert isinstance(parser.e_machine, int)
+            assert self._phases(parser) == ["header"]
+            assert parser.db.session.query(model.Elf_Section).count() == 0
+        finally:
+            parser.close()
+
+    def test_sections_do_not_load_symbols(self, temp_elf):
+        from objutils.elf import model
+
+        parser = ElfParser(str(temp_elf))
+        try:
+            parser.sections.fetch()
+            assert self._phases(parser) == ["header", "sections"]
+            assert parser.db.session.query(model.Elf_Symbol).count() == 0
+        finally:
+            parser.close()
+
+    def test_phases_persist_and_match_eager(self, temp_elf, sample_elf_path):
+        parser = ElfParser(str(temp_elf))
+        parser.sections.fetch()
+        parser.close()
+        parser = ElfParser(str(temp_elf))
+        eager = ElfParser(str(sample_elf_path), in_memory=True, lazy=False)
+        try:
+            assert self._phases(parser) == ["header", "sections"]
+            assert self._snapshot(parser) == self._snapshot(eager)
+            assert self._phases(parser) == list(ElfParser.PHASES)
+        finally:
+            parser.close()
+            eager.close()
+
+    def test_session_loads_everything(self, temp_elf):
+        parser = ElfParser(str(temp_elf), in_memory=True)
+        try:
+            parser.session
+            assert self._phases(parser) == list(ElfParser.PHASES)
+        finally:
+            parser.close()
+
+    def test_unknown_phase(self, temp_elf):
+        parser = ElfParser(str(temp_elf), in_memory=True)
+        try:
+            with pytest.raises(ValueError):
+                parser.load_phases("relocations")
+        finally:
+            parser.close()
+
+
+class TestElfDirectBackend:
+    """Test the SQLAlchemy-free backend (backend="direct")."""
+
+    @staticmethod
+    def _snapshot(parser):
+        return (
+            [(s.section_name, s.sh_type, s.sh_addr, s.sh_flags, s.section_image) for s in parser.sections.fetch()],
+            [
+                (s.symbol_name, s.st_value, s.st_size, s.st_bind, s.st_type, s.section_name, s.access)
+                for s in parser.symbols.fetch(group_by_section=False)
+            ],
+            [(s.symbol_name, s.st_value) for s in parser.symbols.fetch(group_by_section=False, types_str="func")],
+            [(s.p_type, s.p_offset, s.p_filesz, s.p_flags) for s in parser.segments],
+            parser.comment,
+            [(n.name, n.desc) for n in parser.notes],
+            [(s.start_address, bytes(s.data)) for s in parser.create_image(join=False).sections],
+        )
+
+    def test_matches_sqlite_backend(self, temp_elf, sample_elf_path):
+        from objutils.elf.direct import DirectElfParser
+
+        direct = ElfParser(str(temp_elf), backend="direct")
+        sqlite = ElfParser(str(sample_elf_path), in_memory=True)
+        try:
+            assert isinstance(direct, DirectElfParser)
+            assert (direct.e_machine, direct.e_entry, direct.endianess) == (sqlite.e_machine, sqlite.e_entry, sqlite.endianess)
+            assert self._snapshot(direct) == self._snapshot(sqlite)
+            text = sqlite.sections.get(".text")
+            if text is not None:
+                assert direct.sections.get(".text").section_image == text.section_image
+        finally:
+            direct.close()
+            sqlite.close()
+        assert not temp_elf.with_suffix(".prgdb").exists()
+
+    def test_no_session(self, temp_elf):
+        parser = ElfParser(str(temp_elf), backend="direct")
+        try:
+            with pytest.raises(AttributeError):
+                parser.session
+        finally:
+            parser.close()
+
+    def test_unknown_backend(self, temp_elf):
+        with pytest.raises(ValueError):
+            ElfParser(str(temp_elf), backend="lmdb")
+
+    def test_does_not_import_sqlalchemy(self, temp_elf):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from objutils.elf import ElfParser; "
+            f"p = ElfParser({str(temp_elf)!r}, backend='direct'); p.symbols.fetch(); p.create_image(); "
+            "sys.exit('sqlalchemy' in sys.modules)"
+        )
+        assert subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).parents[2]).returncode == 0
+
+
 class TestElfInMemoryDatabase:
     """Test ELF parser with in-memory SQLite database (in_memory=True)."""
 
@@ -363,6 +728,51 @@ class TestElfImageCreation:
             pytest.skip(f"Image creation not supported for this ELF: {e}")
 
 
+class TestElfQueryFilters:
+    """Test the filters of the section and symbol queries, on a synthetic ELF."""
+
+    @pytest.fixture
+    def synthetic_parser(self, tmp_path):
+        from objutils.elf.synthetic import make_elf
+
+        path = tmp_path / "synthetic.elf"
+        make_elf(path, num_sections=4, num_symbols=40)
+        parser = ElfParser(str(path), in_memory=True)
+        yield parser
+        parser.close()
+
+    def test_sections_fetch_filters_by_name(self, synthetic_parser):
+        names = [s.section_name for s in synthetic_parser.sections.fetch(sections=".text.f1, .text.f3", order_by_address=False)]
+        assert names == [".text.f1", ".text.f3"]
+        assert len(synthetic_parser.sections.fetch()) == 8
+
+    def test_symbols_fetch_matches_any_type(self, synthetic_parser):
+        def fetch(types_str):
+            return synthetic_parser.symbols.fetch(types_str=types_str, group_by_section=False)
+
+        assert len(fetch("func")) == 40
+        assert len(fetch("notype,func")) == len(fetch("notype")) + 40
+
+    def test_create_image_patterns(self, synthetic_parser):
+        # Every synthetic section is linked at address 0, so pick one at a time.
+        image = synthetic_parser.create_image(join=False, include_pattern=r"\.text\.f1$")
+        assert [(s.start_address, bytes(s.data)) for s in image.sections] == [(0, b"\x90" * 16)]
+        image = synthetic_parser.create_image(join=False, exclude_pattern=r"\.text\.f[123]")
+        assert len(image.sections) == 1
+
+    def test_gcc_special_symbols(self, synthetic_parser):
+        from objutils.elf import defs, model
+
+        synthetic_parser.load_phases("symbols")
+        for name in ("_etext", "etext"):
+            synthetic_parser.session.add(
+                model.Elf_Symbol(
+                    symbol_name=name, st_value=0x100, st_type=defs.SymbolType.STT_NOTYPE, st_shndx=defs.SectionName.SHN_ABS
+                )
+            )
+        assert [s.symbol_name for s in synthetic_parser.symbols.fetch_gcc_special_symbols()] == ["_etext"]
+
+
 class TestElfDebugSections:
     """Test debug section handling."""
 
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+"""Tests for symbol-table import into the .prgdb, using synthetic ELF files."""
+
+import struct
+import sys
+
+import pytest
+
+from objutils.elf import ElfParser, defs, model, tables
+from objutils.elf.synthetic import make_elf
+
+
+@pytest.fixture
+def synthetic_elf(tmp_path):
+    path = tmp_path / "synthetic.elf"
+    return path, make_elf(path, num_sections=50, num_symbols=2000)
+
+
+def count_section_queries(parser):
+    """Attach a counter for SELECTs against elf_section to `parser`'s engine."""
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM elf_section" in statement:
+            statements.append(statement)
+
+    event.listen(parser.db.engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+
+def symbol_index_names(parser):
+    from sqlalchemy import inspect
+
+    return {index["name"] for index in inspect(parser.db.engine).get_indexes("elf_symbol")}
+
+
+class TestSymbolImport:
+    """Bulk import of symbol tables (symbols phase)."""
+
+    def test_symbols_match_table(self, synthetic_elf):
+        path, expected = synthetic_elf
+        parser = ElfParser(str(path))
+        try:
+            symbols = sorted(parser.symbols.fetch(group_by_section=False), key=lambda s: s.st_name)
+            assert [(s.symbol_name, s.st_value, s.st_shndx) for s in symbols[1:]] == expected
+            for symbol in symbols[1:]:
+                if symbol.st_shndx == defs.SectionName.SHN_ABS:
+                    assert (symbol.section_name, symbol.access) == ("SHN_ABS", 0)
+                else:
+                    assert (symbol.section_name, symbol.access) == (f".text.f{symbol.st_shndx - 1}", 6)
+                    assert (symbol.st_bind, symbol.st_type) == (defs.SymbolBinding.STB_GLOBAL, defs.SymbolType.STT_FUNC)
+        finally:
+            parser.close()
+
+    def test_indexes_created_after_load(self, synthetic_elf):
+        path, _ = synthetic_elf
+        parser = ElfParser(str(path))
+        try:
+            parser.load_phases("symbols")
+            assert symbol_index_names(parser) == {index.name for index in model.Elf_Symbol.__table__.indexes}
+        finally:
+            parser.close()
+
+    def test_indexes_restored_on_failure(self, synthetic_elf, monkeypatch):
+        path, _ = synthetic_elf
+        parser = ElfParser(str(path))
+
+        def fail(section, section_map=None):
+            raise RuntimeError("boom")
+
+        monkeypatch.setattr(parser, "_parse_symbol_section", fail)
+        try:
+            with pytest.raises(RuntimeError):
+                parser.load_phases("symbols")
+            assert symbol_index_names(parser) == {index.name for index in model.Elf_Symbol.__table__.indexes}
+        finally:
+            parser.close()
+
+    def test_failed_table_rolls_back_phase(self, tmp_path, monkeypatch):
+        path = tmp_path / "two_tables.elf"
+        expected = make_elf(path, num_sections=5, num_symbols=100, dynsym=True)
+        parser = ElfParser(str(path))
+        parse_symbol_section = parser._parse_symbol_section
+        tables_parsed = []
+
+        def fail_second(section, section_map=None):
+            tables_parsed.append(section.section_name)
+            if len(tables_parsed) == 2:
+                raise RuntimeError("boom")
+            parse_symbol_section(section, section_map)
+
+        monkeypatch.setattr(parser, "_parse_symbol_section", fail_second)
+        try:
+            with pytest.raises(RuntimeError):
+                parser.load_phases("symbols")
+            assert parser.db.session.query(model.Elf_Symbol).count() == 0
+            assert "symbols" not in parser.db.session.query(model.Meta).first().phases.split(",")
+            assert symbol_index_names(parser) == {index.name for index in model.Elf_Symbol.__table__.indexes}
+            monkeypatch.undo()
+            parser.load_phases("symbols")
+            # Both tables, each with the null symbol.
+            assert parser.db.session.query(model.Elf_Symbol).count() == 2 * (len(expected) + 1)
+        finally:
+            parser.close()
+
+    def test_struct_failure_falls_back_to_construct(self, synthetic_elf, monkeypatch, capsys, caplog):
+        path, expected = synthetic_elf
+        monkeypatch.setitem(sys.modules, "objutils.hexfiles_ext", None)  # Take the pure-Python tiers.
+        parser = ElfParser(str(path))
+
+        def fail(symtab_bytes, strtab_bytes):
+            raise struct.error("boom")
+
+        monkeypatch.setattr(parser, "_parse_symbol_section_struct", fail)
+        try:
+            parser.load_phases("symbols")
+            assert parser.db.session.query(model.Elf_Symbol).count() == len(expected) + 1
+        finally:
+            parser.close()
+        assert capsys.readouterr().out == ""
+        assert "falling back to construct" in caplog.text
+
+    def test_in_memory_matches_file(self, synthetic_elf):
+        path, _ = synthetic_elf
+        on_disk = ElfParser(str(path))
+        in_memory = ElfParser(str(path), in_memory=True)
+        try:
+            rows = [
+                [(s.symbol_name, s.st_value, s.st_shndx, s.section_name) for s in p.symbols.fetch(group_by_section=False)]
+                for p in (on_disk, in_memory)
+            ]
+            assert rows[0] == rows[1]
+        finally:
+            on_disk.close()
+            in_memory.close()
+
+
+class TestSymbolSectionResolution:
+    """st_shndx -> section resolution without per-section queries."""
+
+    def test_map_from_parsed_headers(self, synthetic_elf):
+        path, _ = synthetic_elf
+        parser = ElfParser(str(path))
+        try:
+            parser.load_phases("sections")
+            mapping = parser._section_index_map()
+            assert mapping[1] == (".text.f0", 6)
+            assert mapping[0] == ("SHN_UNDEF", 0)
+            assert mapping[defs.SectionName.SHN_COMMON] == ("SHN_COMMON", 0)
+            queries = count_section_queries(parser)
+            parser.load_phases("symbols")
+            # Only the lookup of the symbol-table sections themselves.
+            assert len(queries) == 1
+        finally:
+            parser.close()
+
+    def test_map_after_reopen(self, synthetic_elf):
+        path, expected = synthetic_elf
+        parser = ElfParser(str(path))
+        parser.load_phases("sections")
+        parser.close()
+        parser = ElfParser(str(path))
+        try:
+            queries = count_section_queries(parser)
+            symbols = parser.symbols.fetch(group_by_section=False)
+            # Symbol-table sections, the index map and the .symtab/.strtab contents, not one per section.
+            assert len(queries) == 4
+            by_name = {s.symbol_name: s for s in symbols}
+            for name, _, shndx in expected:
+                expected_section = "SHN_ABS" if shndx == defs.SectionName.SHN_ABS else f".text.f{shndx - 1}"
+                assert by_name[name].section_name == expected_section
+        finally:
+            parser.close()
+
+    def test_extension_resolves_sections(self):
+        ext = pytest.importorskip("objutils.hexfiles_ext")
+        entry = struct.Struct("<IBBHQQ")
+        symtab = b"".join(entry.pack(1, 0x12, 0, shndx, 0, 0) for shndx in (3, defs.SectionName.SHN_ABS, 7))
+        result = ext.parse_symbol_table(symtab, b"\x00main\x00", True, True, {3: (".text", 6), 0xFFF1: ("SHN_ABS", 0)})
+        assert [(s["symbol_name"], s["section_name"], s["access"]) for s in result] == [
+            ("main", ".text", 6),
+            ("main", "SHN_ABS", 0),
+            ("main", "7", 0),
+        ]
+        assert "section_name" not in ext.parse_symbol_table(symtab, b"\x00main\x00", True, True)[0]
+
+
+class TestColumnarImport:
+    """Symbols imported via the columnar path match the per-symbol parsers."""
+
+    def test_rows_from_columns(self, synthetic_elf):
+        pytest.importorskip("numpy")
+        path, _ = synthetic_elf
+        parser = ElfParser(str(path))
+        try:
+            parser.load_phases("sections")
+            section_map = parser._section_index_map()
+            symtab = parser.sections.get(section_name=".symtab")
+            symtab_bytes, strtab_bytes = parser._section_bytes(symtab.index), parser._section_bytes(symtab.sh_link)
+            columns = tables.symbol_columns(symtab_bytes, strtab_bytes, parser.b64, parser._endianess)
+            rows = parser._symbol_rows_from_columns(columns, section_map)
+            symbols = parser._parse_symbol_section_struct(symtab_bytes, strtab_bytes)
+            assert rows == [
+                (
+                    sym["st_name"],
+                    sym["st_value"],
+                    sym["st_size"],
+                    sym["st_bind"],
+                    sym["st_type"],
+                    sym["st_other"],
+                    sym["st_shndx"],
+                    sym["symbol_name"],
+                    *(section_map.get(sym["st_shndx"]) or (str(sym["st_shndx"]), 0)),
+                )
+                for sym in symbols
+            ]
+        finally:
+            parser.close()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+"""Tests for objutils.elf.tables against the construct reference definitions."""
+
+import random
+import sys
+from types import SimpleNamespace
+
+import pytest
+from construct import BitsInteger, BitStruct, CString, Int8ul, Struct
+
+from objutils.elf import ElfParser, tables
+
+CLASSES = [
+    pytest.param(False, "<", id="elf32-le"),
+    pytest.param(False, ">", id="elf32-be"),
+    pytest.param(True, "<", id="elf64-le"),
+    pytest.param(True, ">", id="elf64-be"),
+]
+
+
+def reference_parser(b64, endianess, **header):
+    """ElfParser with only the construct data types (and `header` fields) configured."""
+    parser = object.__new__(ElfParser)
+    parser.set_data_types(SimpleNamespace(ei_class=2 if b64 else 1, ei_data=1 if endianess == "<" else 2))
+    parser._header = SimpleNamespace(**header)
+    return parser
+
+
+def random_table(kind, b64, count, entsize=0, prefix=0):
+    rng = random.Random(f"{kind}{b64}{count}{entsize}")
+    size = (entsize or tables.table_struct(kind, b64, "<").size) * count
+    return bytes(rng.getrandbits(8) for _ in range(prefix + size))
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_section_headers_match_construct(b64, endianess):
+    parser = reference_parser(b64, endianess, e_shnum=17)
+    data = random_table("shdr", b64, parser.e_shnum, prefix=8)
+    expected = parser._section_header_struct().parse(data[8:]).sections
+    columns = tables.read_columns(data, "shdr", b64, endianess, offset=8, count=parser.e_shnum)
+    for name in tables.SHDR_FIELDS:
+        assert list(columns[name]) == [entry[name] for entry in expected]
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_program_headers_match_construct(b64, endianess):
+    parser = reference_parser(b64, endianess, e_phnum=9)
+    data = random_table("phdr", b64, parser.e_phnum)
+    expected = parser._program_header_struct().parse(data).segments
+    rows = list(tables.iter_table(data, "phdr", b64, endianess, count=parser.e_phnum))
+    names = tables.field_names("phdr", b64)
+    assert [dict(zip(names, row)) for row in rows] == [{name: entry[name] for name in names} for entry in expected]
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_symbols_match_construct(b64, endianess):
+    parser = reference_parser(b64, endianess)
+    info = BitStruct("st_bind" / BitsInteger(4), "st_type" / BitsInteger(4))
+    if b64:
+        symbol = Struct(
+            "st_name" / parser.Word,
+            "st_info" / info,
+            "st_other" / Int8ul,
+            "st_shndx" / parser.Half,
+            "st_value" / parser.Addr,
+            "st_size" / parser.Xword,
+        )
+    else:
+        symbol = Struct(
+            "st_name" / parser.Word,
+            "st_value" / parser.Addr,
+            "st_size" / parser.Word,
+            "st_info" / info,
+            "st_other" / Int8ul,
+            "st_shndx" / parser.Half,
+        )
+    data = random_table("sym", b64, 25)
+    names = tables.field_names("sym", b64)
+    for idx, row in enumerate(tables.iter_table(data, "sym", b64, endianess)):
+        entry = symbol.parse(data[idx * symbol.sizeof() :])
+        values = dict(zip(names, row))
+        assert (values["st_info"] >> 4, values["st_info"] & 0x0F) == (entry.st_info.st_bind, entry.st_info.st_type)
+        for name in ("st_name", "st_value", "st_size", "st_other", "st_shndx"):
+            assert values[name] == entry[name]
+
+
+@pytest.mark.parametrize("kind", ["shdr", "phdr", "sym"])
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_numpy_array_matches_columns(kind, b64, endianess):
+    pytest.importorskip("numpy")
+    natural = tables.table_struct(kind, b64, endianess).size
+    data = random_table(kind, b64, 11, entsize=natural + 8)
+    columns = tables.read_columns(data, kind, b64, endianess, count=11, entsize=natural + 8)
+    array = tables.read_array(data, kind, b64, endianess, count=11, entsize=natural + 8)
+    assert len(array) == 11
+    for name in tables.field_names(kind, b64):
+        assert array[name].tolist() == list(columns[name])
+
+
+def test_padded_entries_are_skipped():
+    data = random_table("shdr", False, 3, entsize=48)
+    natural = tables.table_struct("shdr", False, "<").size
+    padded = list(tables.iter_table(data, "shdr", False, "<", count=3, entsize=48))
+    assert padded == [tables.table_struct("shdr", False, "<").unpack(data[i * 48 : i * 48 + natural]) for i in range(3)]
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError):
+        tables.table_struct("shdr", True, "<", entsize=16)
+    with pytest.raises(ValueError):
+        list(tables.iter_table(bytes(100), "shdr", True, "<", count=2))
+    assert tables.read_columns(b"", "sym", False, "<") == {name: () for name in tables.field_names("sym", False)}
+
+
+def symbol_table(b64, endianess, count):
+    """Random symbol table with names (including suffix-shared ones) in a matching string table."""
+    rng = random.Random(count)
+    names = [f"sym_{idx}_{rng.randrange(1 << 16):x}".encode() for idx in range(count)]
+    strtab = b"\x00" + b"\x00".join(names) + b"\x00"
+    layout = tables.table_struct("sym", b64, endianess)
+    offsets = [strtab.index(name + b"\x00") + rng.choice((0, 0, 4)) for name in names] + [0, len(strtab) + 10]
+    entries = []
+    for offset in offsets:
+        info, other, shndx, value, size = rng.randrange(256), rng.randrange(4), rng.randrange(1 << 16), rng.randrange(1 << 32), 8
+        if b64:
+            entries.append(layout.pack(offset, info, other, shndx, value, size))
+        else:
+            entries.append(layout.pack(offset, value, size, info, other, shndx))
+    return b"".join(entries), strtab
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_struct_symbol_parser_matches_construct(b64, endianess):
+    parser = reference_parser(b64, endianess)
+    symtab, strtab = symbol_table(b64, endianess, 200)
+    parser._images = {1: strtab}
+    parser.asciiCString = CString(encoding="ascii")
+    result = parser._parse_symbol_section_struct(symtab, strtab)
+    assert len(result) == 202
+    assert result == parser._parse_symbol_section_py(symtab, strtab, 1)
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_struct_symbol_parser_matches_extension(b64, endianess):
+    ext = pytest.importorskip("objutils.hexfiles_ext")
+    parser = reference_parser(b64, endianess)
+    symtab, strtab = symbol_table(b64, endianess, 200)
+    expected = ext.parse_symbol_table(symtab, strtab, b64, endianess == "<")
+    assert parser._parse_symbol_section_struct(symtab, strtab) == expected
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_symbol_columns_fallback(b64, endianess, monkeypatch):
+    np = pytest.importorskip("numpy")
+    monkeypatch.setitem(sys.modules, "objutils.hexfiles_ext", None)
+    symtab, strtab = symbol_table(b64, endianess, 50)
+    columns = tables.symbol_columns(symtab, strtab, b64, endianess)
+    expected = tables.read_columns(symtab, "sym", b64, endianess)
+    for name, code in tables.SYMBOL_COLUMNS.items():
+        assert columns[name].dtype == np.dtype(code)
+        assert columns[name].tolist() == list(expected[name])
+    names = tables.StringTable(strtab)
+    assert tables.column_names(columns) == [names[offset] for offset in expected["st_name"]]
+    assert columns["name_offsets"][-1] == len(columns["names"])
+
+
+@pytest.mark.parametrize("b64, endianess", CLASSES)
+def test_symbol_columns_match_extension(b64, endianess, monkeypatch):
+    ext = pytest.importorskip("objutils.hexfiles_ext")
+    symtab, strtab = symbol_table(b64, endianess, 200)
+    columns = ext.parse_symbol_columns(symtab, strtab, b64, endianess == "<")
+    monkeypatch.setitem(sys.modules, "objutils.hexfiles_ext", None)
+    fallback = tables.symbol_columns(symtab, strtab, b64, endianess)
+    assert columns["names"] == fallback["names"]
+    for name in (*tables.SYMBOL_COLUMNS, "name_offsets"):
+        assert columns[name].dtype == fallback[name].dtype
+        assert columns[name].tolist() == fallback[name].tolist()
+    symbols = ext.parse_symbol_table(symtab, strtab, b64, endianess == "<")
+    assert tables.column_names(columns) == [symbol["symbol_name"] for symbol in symbols]
+
+
+def test_string_table():
+    strtab = b"\x00main\x00foo_bar\x00\xc3\xa4\x00"
+    names = tables.StringTable(strtab)
+    assert [names[0], names[1], names[6], names[10], names[14]] == ["", "main", "foo_bar", "bar", "\xe4"]
+    assert names[100] == ""
+    assert names[10] == tables.cstring(strtab, 10)
+
+
+def test_cstring():
+    strtab = b"\x00.text\x00.data\x00tail"
+    assert tables.cstring(strtab, 1) == ".text"
+    assert tables.cstring(strtab, 3) == "ext"
+    assert tables.cstring(strtab, 0) == ""
+    assert tables.cstring(strtab, 13) == "tail"
+    assert tables.cstring(strtab, 100) == ""
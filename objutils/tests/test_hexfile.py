@@ -1,7 +1,8 @@
 #!/usr/bin/env python
+import logging
 import unittest
 
-from objutils import hexfile, loads, dumps, Section
+from objutils import hexfile, loads, dumps, registry, Section
 from objutils.image import Image
 
 
@@ -127,6 +128,23 @@ class TestHexfile(unittest.TestCase):
         self.assertEqual(roundtrip.sections[1].start_address, 0x1002)
         self.assertEqual(roundtrip.sections[1].data, b"\x09\x09\x05\x06\x07\x08")
 
+    def test_reader_patterns_compiled_once_per_class(self):
+        first = registry.get("srec").Reader()
+        second = registry.get("srec").Reader()
+        self.assertEqual(len(first.formats), 8)
+        for (type1, pattern1), (type2, pattern2) in zip(first.formats, second.formats):
+            self.assertEqual(type1, type2)
+            self.assertIs(pattern1, pattern2)
+        self.assertIsNot(first.formats, second.formats)
+        self.assertIsNot(registry.get("ihex").Reader().formats[0][1], first.formats[0][1])
+
+    def test_reader_instances_share_log_handler(self):
+        registry.get("ihex").Reader()
+        handlers = len(logging.getLogger("objutils.Reader").handlers)
+        for _ in range(10):
+            registry.get("ihex").Reader()
+        self.assertEqual(len(logging.getLogger("objutils.Reader").handlers), handlers)
+
 
 def main():
     unittest.main()
@@ -14,6 +14,7 @@ else:
     NUMPY_SUPPORT = True
 
 from objutils import dumps
+from objutils.checksums import check
 from objutils.exceptions import InvalidAddressError
 from objutils.image import Image
 from objutils.section import Section
@@ -1406,5 +1407,134 @@ def test_image_asam_ndarray_fortran_roundtrip():
     assert np.array_equal(result, arr)
 
 
+def test_image_fill_across_sections():
+    img = Image([Section(0x1000, bytearray(4)), Section(0x1004, bytearray(4))], join=False)
+    img.fill(0x55, 0x1002, 4)
+    assert img.sections[0].data == b"\x00\x00\x55\x55"
+    assert img.sections[1].data == b"\x55\x55\x00\x00"
+    img.fill(0xFF)
+    assert img.read(0x1000, 4) == b"\xff" * 4
+    with pytest.raises(InvalidAddressError):
+        img.fill(0x00, 0x1006, 4)
+
+
+def test_image_find():
+    img = Image([Section(0x1000, b"abcabc"), Section(0x2000, b"xxabc")])
+    assert img.find(b"abc") == 0x1000
+    assert img.find(b"abc", 0x1001) == 0x1003
+    assert img.find(b"abc", 0x1004) == 0x2002
+    assert img.find(b"zzz") == -1
+    assert img.find_all(b"abc") == [0x1000, 0x1003, 0x2002]
+
+
+def test_image_compare():
+    left = Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])
+    assert left.compare(Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])) == []
+    right = Image([Section(0x1000, b"HeLlo"), Section(0x2000, b"Wor")])
+    assert left.compare(right) == [(0x1002, 1), (0x2003, 2)]
+    right = Image([Section(0x1000, b"He"), Section(0x1003, b"lX")], join=False)
+    assert left.compare(right) == [(0x1002, 1), (0x1004, 1), (0x2000, 5)]
+
+
+def test_image_equality_compares_contents():
+    assert Image(Section(0x1000, b"abc")) == Image(Section(0x1000, b"abc"))
+    assert Image(Section(0x1000, b"abc")) != Image(Section(0x1000, b"abd"))
+    assert Image(Section(0x1000, b"abc")) != Image(Section(0x2000, b"abc"))
+    assert Image(Section(0x1000, b"abc", name="a")) == Image(Section(0x1000, b"abc", name="b"))  # Names aren't compared.
+
+
+def test_image_digest():
+    img = Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])
+    other = Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])
+    assert img.digest() == other.digest()
+    assert img.digest("sha256") == other.digest("sha256")
+    assert img == other
+    assert Image(Section(0x1000, b"Hello")).digest() != Image(Section(0x1001, b"Hello")).digest()
+
+
+def test_image_equality_after_in_place_modification():
+    img = Image([Section(0x1000, b"Hello")])
+    other = Image([Section(0x1000, b"Hello")])
+    assert img.digest() == other.digest()
+    img.sections[0].data[0] = ord("J")  # Bypasses the digest cache.
+    assert img != other
+    other.sections[0].data[0] = ord("J")
+    assert img == other
+
+
+def test_image_digest_invalidated_on_write():
+    img = Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])
+    other = Image([Section(0x1000, b"Hello"), Section(0x2000, b"World")])
+    before = img.digest()
+    other.digest()
+    img.write(0x2000, b"w")
+    assert img.digest() != before
+    assert img != other
+    img.write_numeric(0x2000, ord("W"), "uint8_le")
+    assert img.digest() == before
+    img.insert_section(b"!", 0x3000)
+    assert img.digest() != before
+
+
+def test_image_read_range_across_sections():
+    img = Image([Section(0x1000, b"Hello"), Section(0x1005, b"World")], join=False)
+    assert img.read_range(0x1003, 4) == b"loWo"
+    assert img.read_range(0x1000, 10) == b"HelloWorld"
+    assert img.read_range(0x1002, 0) == b""
+
+
+def test_image_read_range_gaps():
+    img = Image([Section(0x1000, b"AB"), Section(0x1004, b"CD")])
+    assert img.read_range(0x0FFF, 7, fill=0xFF) == b"\xffAB\xff\xffCD"
+    with pytest.raises(InvalidAddressError):
+        img.read_range(0x1000, 6)
+
+
+@pytest.mark.parametrize("algo", ["CHK_CRC_32", "CHK_CRC_16", "CHK_ADD_11", "CHK_ADD_44"])
+def test_image_checksum_walks_sections(algo):
+    img = Image([Section(0x1000, bytes(range(64))), Section(0x2000, b"Hello World!")])
+    assert img.checksum(algo, fill=None) == check(bytes(range(64)) + b"Hello World!", algo)
+    assert img.checksum(algo, 0x1010, 0x2004, fill=None) == check(bytes(range(16, 64)) + b"Hell", algo)
+    assert img.checksum(algo, 0x2000, 0x200C) == check(b"Hello World!", algo)
+
+
+@pytest.mark.parametrize("algo", ["CHK_CRC_32", "CHK_CRC_16", "CHK_ADD_11", "CHK_ADD_22", "CHK_ADD_44_BE"])
+def test_image_checksum_fills_gaps(algo):
+    img = Image([Section(0x1001, b"ABC"), Section(0x1009, b"Hello")])
+    assert img.checksum(algo, 0x1000, 0x1010) == check(b"\xffABC\xff\xff\xff\xff\xffHello\xff\xff", algo)
+    assert img.checksum(algo, 0x1000, 0x1010, fill=0x00) == check(b"\x00ABC\x00\x00\x00\x00\x00Hello\x00\x00", algo)
+    assert img.checksum(algo, 0x0F00, 0x0F10) == check(b"\xff" * 16, algo)
+
+
+def test_image_checksum_cache_invalidation():
+    img = Image([Section(0x1000, bytes(256))])
+    first = img.checksum("CHK_CRC_32", 0x1000, 0x2000)
+    assert img.checksum("CHK_CRC_32", 0x1000, 0x2000) == first
+    img.write(0x1010, b"\x01")
+    assert img.checksum("CHK_CRC_32", 0x1000, 0x2000) != first
+    img.write(0x1010, b"\x00")
+    assert img.checksum("CHK_CRC_32", 0x1000, 0x2000) == first
+    img.insert_section(b"\x00", 0x1800)
+    assert img.checksum("CHK_CRC_32", 0x1000, 0x2000) != first
+    assert len(img._checksums) == 1  # Entries from before the writes are dropped.
+
+
+def test_image_checksum_user_defined():
+    img = Image([Section(0x1000, b"1234"), Section(0x1006, b"789")])
+    params = {"width": 16, "poly": 0x1021, "init": 0xFFFF}
+    expected = check(b"1234\xff\xff789", "CHK_USER_DEFINED", **params)
+    assert img.checksum("CHK_USER_DEFINED", **params) == expected
+    assert img.checksum("CHK_USER_DEFINED", **params, xorout=0xFFFF) == expected ^ 0xFFFF  # Not served from the cache.
+    with pytest.raises(NotImplementedError):
+        img.checksum("CHK_USER_DEFINED")
+
+
+def test_image_checksum_invalid_range():
+    img = Image([Section(0x1000, bytes(16))])
+    with pytest.raises(ValueError):
+        img.checksum("CHK_CRC_32", 0x1008, 0x1004)
+    assert img.checksum("CHK_CRC_32", 0x1004, 0x1004) == 0
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import io
-from objutils import probes, registry
+from objutils import probe, probes, registry
 
 # Test Data
 IHEX = b":100000004578616D706C65207769746820616E2039\n:00000001FF\n"
@@ -66,6 +66,19 @@ class TestProbeUniqueness(unittest.TestCase):
                     if name == "mostec" and reader_name in ["ihex", "sig"]:
                         self.assertFalse(res, f"Reader {reader_name} should NOT accept {name} data")
 
+    def test_signature_pre_dispatch(self):
+        self.assertEqual(probes(b"\n\n  " + IHEX), "ihex")
+        self.assertEqual(probes(b"\xef\xbb\xbf" + SREC), "srec")
+        self.assertEqual(probes(b"!M1000 00 01 02 03\n"), "cosmac")
+        self.assertIsNone(probes(b"\x7fELF\x02\x01\x01" + bytes(64)))
+        self.assertIsNone(probes(b""))
+
+    def test_probe_restores_position(self):
+        buf = io.BytesIO(b"junk" + SREC)
+        buf.seek(4)
+        self.assertEqual(probe(buf), "srec")
+        self.assertEqual(buf.tell(), 4)
+
 
 if __name__ == "__main__":
     unittest.main()
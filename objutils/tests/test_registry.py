@@ -1,5 +1,9 @@
+import subprocess
+import sys
 import unittest
 
+from objutils.registry import Codec, CodecAlreadyExistError, CodecDoesNotExistError, registry
+
 
 class DummyReader:
     pass
@@ -46,5 +50,39 @@ class TestRegistry(unittest.TestCase):
     """
 
 
+class TestLazyRegistration(unittest.TestCase):
+    NAME = "lazy_dummy"
+
+    def tearDown(self):
+        registry._codecs.pop(self.NAME, None)
+
+    def test_module_is_resolved_on_get(self):
+        registry.register_lazy(self.NAME, __name__, "Dummy format.", reader="DummyReader", writer="DummyWriter")
+        self.assertIn(self.NAME, registry.formats)
+        codec = registry.get(self.NAME.upper())
+        self.assertIsInstance(codec, Codec)
+        self.assertIs(codec.Reader, DummyReader)
+        self.assertIs(codec.Writer, DummyWriter)
+        self.assertEqual(codec.description, "Dummy format.")
+        self.assertEqual(DummyReader.codecName, self.NAME)
+        self.assertIs(registry.get(self.NAME), codec)
+        self.assertIn((self.NAME, codec), list(registry))
+
+    def test_errors(self):
+        registry.register_lazy(self.NAME, __name__, reader="DummyReader", writer="DummyWriter")
+        with self.assertRaises(CodecAlreadyExistError):
+            registry.register(self.NAME, DummyReader, DummyWriter)
+        with self.assertRaises(CodecDoesNotExistError):
+            registry.get("no_such_format")
+
+    def test_import_does_not_load_codecs(self):
+        code = (
+            "import sys, objutils; "
+            "print(sorted(m for m in ('objutils.ihex', 'objutils.hexfile', 'rich', 'numpy') if m in sys.modules))"
+        )
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip().splitlines()[-1], "[]")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,13 @@
 import array
 import math
 import struct
+import subprocess
+import sys
+import textwrap
 
 import pytest
 
+from objutils.checksums import check
 from objutils.exceptions import InvalidAddressError
 from objutils.section import (
     INT8_RANGE,
@@ -1105,3 +1109,98 @@ def test_write_asam_string_utf8_still_works():
     sec.write_asam_string(0, text, "UTF8")
     result = sec.read_asam_string(0, "UTF8")
     assert result == text
+
+
+def test_fill_whole_section():
+    sec = Section(0x1000, bytearray(8))
+    sec.fill(0xFF)
+    assert sec.data == b"\xff" * 8
+
+
+def test_fill_range():
+    sec = Section(0x1000, bytearray(8))
+    sec.fill(0xAA, 0x1002, 3)
+    assert sec.data == b"\x00\x00\xaa\xaa\xaa\x00\x00\x00"
+
+
+def test_fill_out_of_bounds():
+    sec = Section(0x1000, bytearray(8))
+    with pytest.raises(InvalidAddressError):
+        sec.fill(0x00, 0x1006, 4)
+    with pytest.raises(ValueError):
+        sec.fill(0x100)
+
+
+def test_find():
+    sec = Section(0x1000, b"Hello World, Hello")
+    assert sec.find(b"Hello") == 0x1000
+    assert sec.find("Hello", 0x1001) == 0x100D
+    assert sec.find(b"xyz") == -1
+    assert sec.find(ord("W")) == 0x1006
+
+
+def test_find_all():
+    sec = Section(0x1000, b"aaaXaa")
+    assert sec.find_all(b"aa") == [0x1000, 0x1001, 0x1004]
+    assert sec.find_all(b"X") == [0x1003]
+    assert sec.find_all(b"Y") == []
+    with pytest.raises(ValueError):
+        sec.find_all(b"")
+
+
+def test_compare():
+    left = Section(0x1000, b"Hello World")
+    assert left.compare(Section(0x1000, b"Hello World")) == []
+    assert left.compare(Section(0x1000, b"HellO_World")) == [(0x1004, 2)]
+    assert left.compare(b"Hello_Worl!") == [(0x1005, 1), (0x100A, 1)]
+    assert left.compare(Section(0x1002, b"llo")) == [(0x1000, 2), (0x1005, 6)]
+    assert left.compare(Section(0x2000, b"Hello")) == [(0x1000, 11)]
+
+
+def test_section_uses_slots():
+    sec = Section(0x1000, b"Hello")
+    assert not hasattr(sec, "__dict__")
+    with pytest.raises(AttributeError):
+        sec.foo = 42
+
+
+def test_tracked_checksum_follows_writes():
+    sec = Section(0x1000, bytearray(range(256)) * 64)
+    sec.track_checksum("CHK_CRC_32", block_size=1024)
+    assert sec.checksum("CHK_CRC_32") == check(sec.data, "CHK_CRC_32")
+    sec.write(0x1400, b"\x01\x02\x03")
+    sec.write_numeric(0x3000, 0xDEADBEEF, "uint32_be")
+    assert sec.checksum("CHK_CRC_32") == check(sec.data, "CHK_CRC_32")
+    assert sec.checksum("CHK_CRC_32", 0x1002, 0x2000) == check(sec.data[2:0x2002], "CHK_CRC_32")
+    assert sec.checksum("CHK_ADD_11") == check(sec.data, "CHK_ADD_11")
+
+
+def test_works_without_numpy():
+    code = textwrap.dedent("""
+        import sys
+
+        sys.modules["numpy"] = None  # Makes `import numpy` raise ImportError.
+        from objutils import Image, Section, dumps, loads
+        from objutils.checksums import check
+
+        section = Section(0x1000, bytes(range(64)))
+        section.write_numeric_array(0x1000, [1, 2, 3], "uint16_le")
+        assert section.read_numeric_array(0x1000, 3, "uint16_le") == (1, 2, 3)
+        section.fill(0xFF, 0x1010, 4)
+        assert section.compare(Section(0x1000, bytes(64))) != []
+        img = loads("srec", dumps("srec", Image([section])))
+        assert img[0].data == section.data
+        assert check(bytes(section.data), "CHK_ADD_24_BE") == sum(
+            int.from_bytes(section.data[i : i + 2], "big") for i in range(0, 64, 2)
+        )
+        try:
+            section.read_ndarray(0x1000, 4, "uint16_le")
+        except ImportError as exc:
+            assert "NumPy" in str(exc)
+        else:
+            raise AssertionError("ImportError expected")
+        print("OK")
+        """)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().endswith("OK")
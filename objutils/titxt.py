@@ -53,6 +53,8 @@ class Reader(hexfile.ASCIIHexReader):
     Supports space-separated hex data without checksums.
     """
 
+    SIGNATURES = (b"@",)
+
     def __init__(
         self,
         address_pattern: str = r"^@(?P<address>[0-9a-zA-Z]{2,8})\s*$",
@@ -23,9 +23,11 @@ __copyright__ = """
 """
 
 import ctypes
+import errno
 import mmap
 import os
 import threading
+from contextlib import contextmanager
 from enum import IntEnum
 from io import BytesIO
 
@@ -163,6 +165,49 @@ def create_memorymapped_fileview(filename, writeable=False):
     return memoryview(mmap.mmap(fd, size, access=mmap.ACCESS_WRITE if writeable else mmap.ACCESS_READ))
 
 
+@contextmanager
+def locked_file(filename):
+    """Hold an exclusive advisory lock on `filename` (created if missing) for the duration of the block.
+
+    Blocks until the lock is available; other errors (e.g. a read-only
+    directory) raise ``OSError``. Uses ``fcntl.flock`` on POSIX and
+    ``msvcrt.locking`` on Windows. The lock file is left in place, removing it
+    would race with processes waiting for it.
+
+    Example::
+
+        with locked_file("firmware.prgdb.lock"):
+            ...  # only one process at a time
+    """
+    fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        if os.name == "nt":
+            import msvcrt
+
+            while True:
+                try:
+                    msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as exc:
+                    if exc.errno != errno.EDEADLK:  # (== EDEADLOCK) LK_LOCK gave up after ten attempts, keep waiting.
+                        raise
+            try:
+                yield
+            finally:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
 def enum_from_str(enum_class: IntEnum, enumerator: str) -> IntEnum:
     """Create an `IntEnum` instance from an enumerator `str`.
 